@@ -227,10 +227,12 @@ class CliParameterValidationOrchestrator:
         if parameter_loader is None:
             parameter_loader = ParameterLoader(logger=logger)
 
-        parameter_strategies: List[Any] = parameter_loader.get_all()
         required_parameter_names: Set[str] = self.resolve_required_parameter_names(
             cli_command_run
         )
+        parameter_strategies: List[Any] = parameter_loader.get_named(
+            required_parameter_names
+        )
 
         for parameter_strategy in parameter_strategies:
             parameter_name: Optional[str] = self.resolve_parameter_name(parameter_strategy)
@@ -0,0 +1,188 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from rdflib import Graph, Literal, URIRef
+
+from ontobdc.shared.adapter.local_name_index import LocalNameIndex
+from ontobdc.shared.adapter.util import is_valid_uri, lemma_tokens, lemmatize_tokens, lemmatizer_fingerprint
+
+
+class EntityAliasIndex:
+    """Persistent lemma -> entity URI index of the `entityAlias` entities in context graphs.
+
+    Every entity that carries `entityAlias` in a source graph is indexed
+    under the lemma of its local name and of each alias literal. Lemmas are
+    computed with a single batched spaCy pass when a source is (re)indexed,
+    and the token -> lemma map of that pass is stored too. A lookup whose
+    tokens were all seen at build time is therefore a pair of dictionary
+    reads with no spaCy pipeline loaded. A source is re-indexed only when
+    its ``st_mtime_ns``/``st_size`` changes, the same invalidation
+    `EntityFacadeIndex` uses; the whole index is rebuilt when the alias
+    predicate, the language or the installed spaCy/lookup-table versions
+    (`lemmatizer_fingerprint`) change.
+    """
+
+    INDEX_FILENAME: str = "entity-alias-index.json"
+    INDEX_VERSION: int = 1
+
+    def __init__(self, index_path: Path, *, alias_predicate: URIRef, language: str = "en") -> None:
+        self._index_path: Path = Path(index_path).expanduser().resolve()
+        self._alias_predicate: URIRef = URIRef(str(alias_predicate))
+        self._language: str = str(language or "en")
+        self._lemmatizer: str = lemmatizer_fingerprint(self._language)
+        self._sources: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @classmethod
+    def for_root(cls, root_path: Path, *, alias_predicate: URIRef, language: str = "en") -> "EntityAliasIndex":
+        return cls(
+            Path(root_path).expanduser().resolve() / ".__ontobdc__" / "cache" / cls.INDEX_FILENAME,
+            alias_predicate=alias_predicate,
+            language=language,
+        )
+
+    @property
+    def index_path(self) -> Path:
+        return self._index_path
+
+    def refresh(self, source_files: Iterable[Path]) -> None:
+        sources: Dict[str, Dict[str, Any]] = self._load()
+        changed: bool = False
+        source_path: Path
+        for source_path in [Path(source_file).expanduser().resolve() for source_file in source_files]:
+            signature: Optional[List[Any]] = self._signature(source_path)
+            if signature is None:
+                if sources.pop(str(source_path), None) is not None:
+                    changed = True
+                continue
+            current: Optional[Dict[str, Any]] = sources.get(str(source_path))
+            if current is not None and current.get("signature") == signature:
+                continue
+            sources[str(source_path)] = {"signature": signature, **self._build_source(source_path)}
+            changed = True
+
+        if changed:
+            self._save(sources)
+
+    def entities(self, source_files: Iterable[Path]) -> List[str]:
+        """Return every aliased entity URI of `source_files`, file by file and sorted by URI within each file."""
+        source_paths: List[Path] = [Path(source_file).expanduser().resolve() for source_file in source_files]
+        self.refresh(source_paths)
+        sources: Dict[str, Dict[str, Any]] = self._load()
+        return list(
+            dict.fromkeys(
+                entity_uri
+                for source_path in source_paths
+                for entity_uri in list((sources.get(str(source_path)) or {}).get("entities") or [])
+            )
+        )
+
+    def find(self, value: str, source_files: Iterable[Path]) -> List[str]:
+        """Return the entity URIs whose alias lemma equals the lemma of `value`."""
+        source_paths: List[Path] = [Path(source_file).expanduser().resolve() for source_file in source_files]
+        self.refresh(source_paths)
+        sources: Dict[str, Dict[str, Any]] = self._load()
+        indexed: List[Dict[str, Any]] = [sources[str(path)] for path in source_paths if str(path) in sources]
+
+        tokens: List[str] = lemma_tokens(value)
+        known: Dict[str, str] = {}
+        for source in indexed:
+            known.update(dict(source.get("token_lemmas") or {}))
+        missing: List[str] = [token for token in tokens if token not in known]
+        if missing:
+            known.update(lemmatize_tokens(missing, language=self._language))
+        lemma: str = " ".join(known[token] for token in tokens).strip()
+        if not lemma:
+            return []
+
+        return list(
+            dict.fromkeys(
+                entity_uri
+                for source in indexed
+                for entity_uri in list(dict(source.get("aliases") or {}).get(lemma) or [])
+            )
+        )
+
+    def _build_source(self, source_path: Path) -> Dict[str, Any]:
+        graph: Graph = Graph()
+        graph.parse(str(source_path), format="turtle")
+
+        entity_aliases: List[Tuple[str, List[str]]] = []
+        for subject in dict.fromkeys(graph.subjects(self._alias_predicate, None)):
+            if not is_valid_uri(str(subject)):
+                continue
+            aliases: List[str] = [LocalNameIndex.local_name(subject)]
+            for alias in graph.objects(subject, self._alias_predicate):
+                alias_value: str = str(alias.toPython() if isinstance(alias, Literal) else alias).strip()
+                if alias_value:
+                    aliases.append(alias_value)
+            entity_aliases.append((str(subject), aliases))
+        entity_aliases.sort()
+
+        token_lemmas: Dict[str, str] = lemmatize_tokens(
+            [token for _, aliases in entity_aliases for alias in aliases for token in lemma_tokens(alias)],
+            language=self._language,
+        )
+        alias_index: Dict[str, List[str]] = {}
+        for entity_uri, aliases in entity_aliases:
+            for alias in aliases:
+                lemma: str = " ".join(token_lemmas[token] for token in lemma_tokens(alias)).strip()
+                if lemma and entity_uri not in alias_index.setdefault(lemma, []):
+                    alias_index[lemma].append(entity_uri)
+
+        return {
+            "entities": [entity_uri for entity_uri, _ in entity_aliases],
+            "aliases": alias_index,
+            "token_lemmas": token_lemmas,
+        }
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._sources is not None:
+            return self._sources
+
+        self._sources = {}
+        if self._index_path.is_file():
+            try:
+                payload: Any = json.loads(self._index_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if (
+                isinstance(payload, dict)
+                and payload.get("version") == self.INDEX_VERSION
+                and payload.get("alias_predicate") == str(self._alias_predicate)
+                and payload.get("language") == self._language
+                and payload.get("lemmatizer") == self._lemmatizer
+            ):
+                self._sources = dict(payload.get("sources") or {})
+        return self._sources
+
+    def _save(self, sources: Dict[str, Dict[str, Any]]) -> None:
+        self._sources = sources
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path: Path = self._index_path.with_name(f".{self._index_path.name}.tmp")
+            temporary_path.write_text(
+                json.dumps(
+                    {
+                        "version": self.INDEX_VERSION,
+                        "alias_predicate": str(self._alias_predicate),
+                        "language": self._language,
+                        "lemmatizer": self._lemmatizer,
+                        "sources": sources,
+                    },
+                    ensure_ascii=True,
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+            temporary_path.replace(self._index_path)
+        except OSError:
+            # A read-only location still gets the in-memory index for this process.
+            return
+
+    def _signature(self, source_path: Path) -> Optional[List[Any]]:
+        try:
+            stat_result = source_path.stat()
+        except OSError:
+            return None
+        return [stat_result.st_mtime_ns, stat_result.st_size]
@@ -1,14 +1,15 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 from urllib.parse import unquote, urlparse
 from urllib.request import url2pathname
 
-from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib import Graph, Namespace, URIRef
 from rdflib.namespace import PROV, RDF
 
 from ontobdc.context.adapter.dataset_instance import (
     DatasetEntityInstanceRepository,
 )
+from ontobdc.context.adapter.facade_index import EntityFacadeIndex
 from ontobdc.context.adapter.instance_support import (
     EntityInstanceRepositorySupport,
 )
@@ -33,11 +34,18 @@ class ContainerEntityInstanceRepository(EntityInstanceRepositorySupport):
         self._entity: str = str(entity).strip()
         if not self._entity:
             raise ValueError("Entity reference is required.")
+        self._facade_index: EntityFacadeIndex = EntityFacadeIndex.for_root(
+            self._container_path
+        )
 
     @property
     def container_path(self) -> Path:
         return self._container_path
 
+    @property
+    def facade_index(self) -> EntityFacadeIndex:
+        return self._facade_index
+
     @property
     def container_metadata_path(self) -> Path:
         return get_container_storage_file_path(self._container_path)
@@ -47,31 +55,21 @@ class ContainerEntityInstanceRepository(EntityInstanceRepositorySupport):
         container_subject: URIRef = self._resolve_container_subject(
             container_graph
         )
-        dataset_subjects: List[URIRef] = self._resolve_dataset_subjects(
-            container_graph=container_graph,
-            container_subject=container_subject,
-        )
 
         datasets: List[Dict[str, Any]] = []
         instances: List[Dict[str, Any]] = []
         resolved_entity_uri: str = ""
         resolved_entity_name: str = self._entity
 
-        for dataset_subject in dataset_subjects:
-            dataset_path: Path = self._resolve_dataset_path(
-                container_graph=container_graph,
-                dataset_subject=dataset_subject,
-            )
-            facade: Optional[Dict[str, Any]] = self._resolve_dataset_facade(
-                dataset_path=dataset_path,
-            )
-            if facade is None:
-                continue
-
+        for dataset_subject, dataset_path, facade in self._iter_dataset_facades(
+            container_graph=container_graph,
+            container_subject=container_subject,
+        ):
             dataset_repository: DatasetEntityInstanceRepository = (
                 self._build_dataset_repository(
                     dataset_path=dataset_path,
                     entity_uri=str(facade["entity_uri"]),
+                    use_cache=True,
                 )
             )
             dataset_payload: Dict[str, Any] = (
@@ -109,6 +107,126 @@ class ContainerEntityInstanceRepository(EntityInstanceRepositorySupport):
             "instances": instances,
         }
 
+    def iter_instances(
+        self,
+        *,
+        equals: Optional[Mapping[str, Any]] = None,
+        prefixes: Optional[Mapping[str, str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the facade-projected instances of every matching dataset.
+
+        ``equals``/``prefixes`` are keyed by facade column name (for example
+        ``GlobalId``), the same names ``list_instances`` exposes. Each facade
+        field's source column is resolved once per dataset from the
+        resource's schema field names. The filters are translated to those
+        columns and pushed down to
+        ``DatasetEntityInstanceRepository.iter_instances``, together with
+        the facade columns as its ``columns``. Rows are therefore filtered
+        before they are converted, and only the facade's cells are cast.
+        Stopping after the first match leaves the remaining rows and
+        datasets unread.
+        """
+        container_graph: Graph = self._load_container_graph()
+        container_subject: URIRef = self._resolve_container_subject(
+            container_graph
+        )
+        for _, dataset_path, facade in self._iter_dataset_facades(
+            container_graph=container_graph,
+            container_subject=container_subject,
+        ):
+            dataset_repository: DatasetEntityInstanceRepository = (
+                self._build_dataset_repository(
+                    dataset_path=dataset_path,
+                    entity_uri=str(facade["entity_uri"]),
+                )
+            )
+            source_keys: Dict[str, str] = self._resolve_source_keys(
+                field_names=dataset_repository.field_names(),
+                fields=list(facade["fields"]),
+            )
+            source_equals: Optional[Dict[str, Any]] = self._source_filters(
+                filters=equals,
+                source_keys=source_keys,
+            )
+            source_prefixes: Optional[Dict[str, str]] = self._source_filters(
+                filters=prefixes,
+                source_keys=source_keys,
+            )
+            if source_equals is None or source_prefixes is None:
+                continue
+            for instance in dataset_repository.iter_instances(
+                columns=list(dict.fromkeys(source_keys.values())),
+                equals=source_equals,
+                prefixes=source_prefixes,
+            ):
+                yield {
+                    name: instance[source_key]
+                    for name, source_key in source_keys.items()
+                    if source_key in instance
+                }
+
+    def _resolve_source_keys(
+        self,
+        *,
+        field_names: List[str],
+        fields: List[Dict[str, Any]],
+    ) -> Dict[str, str]:
+        """Map each facade column name to its source column, as
+        ``_project_instance`` would for a row with ``field_names`` keys.
+        """
+        header: Dict[str, Any] = dict.fromkeys(field_names)
+        source_keys: Dict[str, str] = {}
+        for field in fields:
+            source_key: Optional[str] = self._resolve_instance_field_key(
+                instance=header,
+                field=field,
+            )
+            if source_key is not None:
+                source_keys[str(field["name"])] = source_key
+        return source_keys
+
+    def _source_filters(
+        self,
+        *,
+        filters: Optional[Mapping[str, Any]],
+        source_keys: Dict[str, str],
+    ) -> Optional[Dict[str, Any]]:
+        """Translate facade-keyed filters to source columns.
+
+        A filter on a facade column the dataset does not provide compares
+        against an empty value: a blank expectation always matches and is
+        dropped, any other means no row can match, signalled by ``None``.
+        """
+        translated: Dict[str, Any] = {}
+        for column, expected in (filters or {}).items():
+            source_key: Optional[str] = source_keys.get(column)
+            if source_key is not None:
+                translated[source_key] = expected
+            elif str(expected).strip():
+                return None
+        return translated
+
+    def _iter_dataset_facades(
+        self,
+        *,
+        container_graph: Graph,
+        container_subject: URIRef,
+    ) -> Iterator[Tuple[URIRef, Path, Dict[str, Any]]]:
+        dataset_subjects: List[URIRef] = self._resolve_dataset_subjects(
+            container_graph=container_graph,
+            container_subject=container_subject,
+        )
+        for dataset_subject in dataset_subjects:
+            dataset_path: Path = self._resolve_dataset_path(
+                container_graph=container_graph,
+                dataset_subject=dataset_subject,
+            )
+            facade: Optional[Dict[str, Any]] = self._resolve_dataset_facade(
+                dataset_path=dataset_path,
+            )
+            if facade is not None:
+                yield dataset_subject, dataset_path, facade
+
     def _load_container_graph(self) -> Graph:
         return self._load_turtle_graph(
             file_path=self.container_metadata_path,
@@ -191,10 +309,12 @@ class ContainerEntityInstanceRepository(EntityInstanceRepositorySupport):
         *,
         dataset_path: Path,
         entity_uri: str,
+        use_cache: bool = False,
     ) -> DatasetEntityInstanceRepository:
         return DatasetEntityInstanceRepository(
             dataset_path=str(dataset_path),
             entity=entity_uri,
+            use_cache=use_cache,
         )
 
     def _resolve_dataset_facade(
@@ -205,12 +325,16 @@ class ContainerEntityInstanceRepository(EntityInstanceRepositorySupport):
         facade_path: Path = self._resolve_facade_path(dataset_path)
         if not facade_path.is_file():
             return None
-        facade_graph: Graph = self._load_turtle_graph(
-            file_path=facade_path,
-            label="dataset facade",
-        )
+        try:
+            records: List[Dict[str, Any]] = self.facade_index.records(
+                [facade_path]
+            )
+        except Exception as exc:
+            raise ValueError(
+                f"Could not read dataset facade: {facade_path}"
+            ) from exc
         return self._find_entity_facade(
-            facade_graph=facade_graph,
+            records=records,
             facade_path=facade_path,
         )
 
@@ -224,119 +348,36 @@ class ContainerEntityInstanceRepository(EntityInstanceRepositorySupport):
     def _find_entity_facade(
         self,
         *,
-        facade_graph: Graph,
+        records: List[Dict[str, Any]],
         facade_path: Path,
     ) -> Optional[Dict[str, Any]]:
-        for entity_subject, predicate, facade_subject in facade_graph:
-            if self._local_name(predicate) != "hasDataEntityFacade":
-                continue
-            if not self._references_match(self._entity, entity_subject):
-                continue
-            if not isinstance(facade_subject, URIRef):
+        for record in records:
+            if not self._references_match(self._entity, record["entity_uri"]):
                 continue
 
-            fields: List[Dict[str, Any]] = self._resolve_facade_fields(
-                facade_graph=facade_graph,
-                facade_subject=facade_subject,
-            )
+            fields: List[Dict[str, Any]] = [
+                {
+                    "identifier": str(field["identifier"]),
+                    "name": self._column_name(str(field["identifier"])),
+                    "mapped_property": str(field.get("mapped_property") or ""),
+                }
+                for field in list(record["fields"])
+            ]
             if not fields:
                 continue
+            fields.sort(key=self._facade_field_sort_key)
             return {
-                "entity_uri": str(entity_subject),
-                "entity_name": self._local_name(entity_subject),
+                "entity_uri": str(record["entity_uri"]),
+                "entity_name": str(record["entity_name"]),
                 "entity_identifier": self._snake_case(
-                    self._local_name(entity_subject)
+                    str(record["entity_name"])
                 ),
-                "facade_uri": str(facade_subject),
+                "facade_uri": str(record["facade_uri"]),
                 "facade_path": str(facade_path),
                 "fields": fields,
             }
         return None
 
-    def _resolve_facade_fields(
-        self,
-        *,
-        facade_graph: Graph,
-        facade_subject: URIRef,
-    ) -> List[Dict[str, Any]]:
-        fields: List[Dict[str, Any]] = []
-        for _, predicate, field_subject in facade_graph.triples(
-            (facade_subject, None, None)
-        ):
-            if self._local_name(predicate) != "hasFacadeField":
-                continue
-            if not isinstance(field_subject, URIRef):
-                continue
-
-            field: Optional[Dict[str, Any]] = self._resolve_facade_field(
-                facade_graph=facade_graph,
-                field_subject=field_subject,
-            )
-            if field is not None:
-                fields.append(field)
-        fields.sort(key=self._facade_field_sort_key)
-        return fields
-
-    def _resolve_facade_field(
-        self,
-        *,
-        facade_graph: Graph,
-        field_subject: URIRef,
-    ) -> Optional[Dict[str, Any]]:
-        identifier: Optional[Literal] = self._first_literal_by_local_name(
-            graph=facade_graph,
-            subject=field_subject,
-            local_name="identifier",
-        )
-        if identifier is None:
-            return None
-
-        mapped_property: Optional[URIRef] = self._first_uri_by_local_name(
-            graph=facade_graph,
-            subject=field_subject,
-            local_name="mapsToProperty",
-        )
-        identifier_value: str = str(identifier).strip()
-        return {
-            "identifier": identifier_value,
-            "name": self._column_name(identifier_value),
-            "mapped_property": (
-                str(mapped_property)
-                if mapped_property is not None
-                else ""
-            ),
-        }
-
-    def _first_literal_by_local_name(
-        self,
-        *,
-        graph: Graph,
-        subject: URIRef,
-        local_name: str,
-    ) -> Optional[Literal]:
-        for _, predicate, value in graph.triples((subject, None, None)):
-            if (
-                self._local_name(predicate) == local_name
-                and isinstance(value, Literal)
-            ):
-                return value
-        return None
-
-    def _first_uri_by_local_name(
-        self,
-        *,
-        graph: Graph,
-        subject: URIRef,
-        local_name: str,
-    ) -> Optional[URIRef]:
-        for _, predicate, value in graph.triples((subject, None, None)):
-            if (
-                self._local_name(predicate) == local_name
-                and isinstance(value, URIRef)
-            ):
-                return value
-        return None
-
     def _facade_field_sort_key(
         self,
         field: Dict[str, Any],
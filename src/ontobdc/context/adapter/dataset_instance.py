@@ -1,10 +1,11 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Mapping
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from rdflib import Graph, Namespace, URIRef
 from rdflib.namespace import RDF
 
+from ontobdc.context.adapter.instance_cache import DatasetInstanceTableCache
 from ontobdc.context.adapter.instance_support import (
     EntityInstanceRepositorySupport,
 )
@@ -21,11 +22,22 @@ DATAPACKAGE_FILE_NAME: str = "datapackage.json"
 
 
 class DatasetEntityInstanceRepository(EntityInstanceRepositorySupport):
-    def __init__(self, *, dataset_path: str, entity: str) -> None:
+    def __init__(
+        self,
+        *,
+        dataset_path: str,
+        entity: str,
+        use_cache: bool = False,
+    ) -> None:
         self._dataset_path: Path = Path(dataset_path).expanduser().resolve()
         self._entity: str = str(entity).strip()
         if not self._entity:
             raise ValueError("Entity reference is required.")
+        self._instance_cache: Optional[DatasetInstanceTableCache] = (
+            DatasetInstanceTableCache.for_dataset(self._dataset_path)
+            if use_cache
+            else None
+        )
 
     @property
     def dataset_path(self) -> Path:
@@ -77,6 +89,97 @@ class DatasetEntityInstanceRepository(EntityInstanceRepositorySupport):
             "instances": instances,
         }
 
+    def iter_instances(
+        self,
+        *,
+        columns: Optional[Sequence[str]] = None,
+        equals: Optional[Mapping[str, Any]] = None,
+        prefixes: Optional[Mapping[str, str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the entity's instances one row at a time.
+
+        Rows come straight from frictionless' row stream over the CSV/XLSX
+        source, so memory stays constant and a caller that stops early never
+        reads the rest of the table. ``equals``/``prefixes`` are matched
+        against each raw row before it is converted, and ``columns`` keeps
+        only the named cells of the rows that pass; frictionless casts a
+        cell only when it is read, so unrequested columns are never cast.
+        Unlike ``list_instances`` this does not parse the dataset metadata.
+        A repository built with ``use_cache`` also buffers the read columns
+        (``columns`` plus the ``equals``/``prefixes`` keys) of a fully read
+        table into the instance cache, so its memory grows with the table.
+        """
+        datapackage: Dict[str, Any] = self._load_datapackage()
+        resource_descriptors: List[Dict[str, Any]] = (
+            self._select_entity_resource_descriptors(datapackage)
+        )
+        if not resource_descriptors:
+            raise ValueError(
+                f"Datapackage '{self.datapackage_path}' does not expose a "
+                f"resource for entity '{self._entity}'."
+            )
+
+        read_columns: Optional[List[str]] = (
+            None
+            if columns is None
+            else list(dict.fromkeys([*columns, *(equals or {}), *(prefixes or {})]))
+        )
+        for resource_descriptor in resource_descriptors:
+            for row in self._iter_single_resource_rows(
+                resource_descriptor,
+                columns=read_columns,
+            ):
+                if not self._instance_matches(
+                    row,
+                    equals=equals,
+                    prefixes=prefixes,
+                ):
+                    continue
+                if columns is None:
+                    yield self._row_to_dict(row)
+                else:
+                    yield {
+                        column: row[column]
+                        for column in columns
+                        if column in row
+                    }
+
+    def field_names(self) -> List[str]:
+        """Return the schema field names of the entity's resources, in order.
+
+        These are the keys of the rows ``iter_instances`` yields. A resource
+        whose descriptor declares its schema is not opened; any other is
+        opened only long enough for frictionless to infer its header.
+        """
+        datapackage: Dict[str, Any] = self._load_datapackage()
+        field_names: List[str] = []
+        for resource_descriptor in self._select_entity_resource_descriptors(
+            datapackage
+        ):
+            schema: Any = resource_descriptor.get("schema")
+            declared: List[Any] = (
+                list(schema.get("fields") or [])
+                if isinstance(schema, dict)
+                else []
+            )
+            if declared and all(
+                isinstance(field, dict) and field.get("name")
+                for field in declared
+            ):
+                names: List[str] = [str(field["name"]) for field in declared]
+            else:
+                resource: Any = self._open_resource(
+                    self._build_runtime_resource_descriptor(resource_descriptor)
+                )
+                try:
+                    names = list(resource.schema.field_names)
+                finally:
+                    resource.close()
+            field_names.extend(
+                name for name in names if name not in field_names
+            )
+        return field_names
+
     def _load_dataset_graph(self) -> Graph:
         return self._load_turtle_graph(
             file_path=self.dataset_metadata_path,
@@ -195,6 +298,101 @@ class DatasetEntityInstanceRepository(EntityInstanceRepositorySupport):
         self,
         resource_descriptor: Dict[str, Any],
     ) -> List[Dict[str, Any]]:
+        return [
+            self._row_to_dict(row)
+            for row in self._iter_single_resource_rows(resource_descriptor)
+        ]
+
+    def _iter_single_resource_rows(
+        self,
+        resource_descriptor: Dict[str, Any],
+        *,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[Any]:
+        """Yield the resource's rows; ``columns`` names the only cells the
+        caller reads, and therefore the only ones cached.
+        """
+        runtime_descriptor: Dict[str, Any] = (
+            self._build_runtime_resource_descriptor(resource_descriptor)
+        )
+        resource_name: str = str(
+            runtime_descriptor.get("name") or "<unnamed>"
+        ).strip()
+        source_paths: List[Path] = self._local_source_paths(
+            runtime_descriptor
+        )
+        signatures: Optional[List[Tuple[int, int]]] = (
+            self._instance_cache.signatures(source_paths)
+            if self._instance_cache is not None and source_paths
+            else None
+        )
+        if self._instance_cache is not None and signatures is not None:
+            cached_rows: Optional[Iterator[Dict[str, Any]]] = (
+                self._instance_cache.read(
+                    resource_name=resource_name,
+                    descriptor=runtime_descriptor,
+                    source_paths=source_paths,
+                    columns=columns,
+                )
+            )
+            if cached_rows is not None:
+                yield from cached_rows
+                return
+
+        resource: Any = self._open_resource(runtime_descriptor)
+
+        # Filling the cache casts and holds in memory only the cells the
+        # caller reads anyway; later reads of those columns are served from
+        # the sidecar.
+        cached_columns: Optional[Dict[str, List[Any]]] = None
+        try:
+            field_types: Dict[str, str] = {
+                field.name: field.type for field in resource.schema.fields
+            }
+            fill_names: List[str] = (
+                list(field_types)
+                if columns is None
+                else [name for name in columns if name in field_types]
+            )
+            if (
+                signatures is not None
+                and fill_names
+                and all(
+                    field_types[name]
+                    in DatasetInstanceTableCache.CACHEABLE_TYPES
+                    for name in fill_names
+                )
+            ):
+                cached_columns = {name: [] for name in fill_names}
+            for row in resource.row_stream:
+                if cached_columns is not None:
+                    for field_name, values in cached_columns.items():
+                        values.append(row[field_name])
+                yield row
+        except Exception as exc:
+            raise ValueError(
+                f"Could not read entity resource '{resource_name}' from "
+                f"dataset '{self._dataset_path}'."
+            ) from exc
+        finally:
+            resource.close()
+
+        if (
+            self._instance_cache is not None
+            and signatures is not None
+            and cached_columns is not None
+        ):
+            self._instance_cache.write(
+                resource_name=resource_name,
+                descriptor=runtime_descriptor,
+                source_paths=source_paths,
+                signatures=signatures,
+                field_types=field_types,
+                columns=cached_columns,
+                complete=len(cached_columns) == len(field_types),
+            )
+
+    def _open_resource(self, runtime_descriptor: Dict[str, Any]) -> Any:
         try:
             from frictionless import Resource, system
         except ModuleNotFoundError as exc:
@@ -203,26 +401,45 @@ class DatasetEntityInstanceRepository(EntityInstanceRepositorySupport):
                 "resources."
             ) from exc
 
-        runtime_descriptor: Dict[str, Any] = (
-            self._build_runtime_resource_descriptor(resource_descriptor)
-        )
         resource_name: str = str(
             runtime_descriptor.get("name") or "<unnamed>"
         ).strip()
         try:
             # The resolved path is always an absolute path under our own
             # dataset directory (never user/remote-supplied), so it is safe
-            # to bypass frictionless' relative-path-only safety check.
+            # to bypass frictionless' relative-path-only safety check. Only
+            # the open runs in the trusted context: it is process-global
+            # and must not stay switched on while a row generator is
+            # suspended between rows.
             with system.use_context(trusted=True):
-                rows: List[Any] = list(
-                    Resource(runtime_descriptor).read_rows()
-                )
+                resource: Any = Resource(runtime_descriptor)
+                resource.open()
         except Exception as exc:
             raise ValueError(
                 f"Could not read entity resource '{resource_name}' from "
                 f"dataset '{self._dataset_path}'."
             ) from exc
-        return [self._row_to_dict(row) for row in rows]
+        return resource
+
+    def _local_source_paths(
+        self,
+        runtime_descriptor: Dict[str, Any],
+    ) -> List[Path]:
+        """Return the resource's local source files, or ``[]`` when it has none.
+
+        Inline ``data`` and remote paths are never cached.
+        """
+        path_value: Any = runtime_descriptor.get("path")
+        path_values: List[Any] = (
+            path_value if isinstance(path_value, list) else [path_value]
+        )
+        source_paths: List[Path] = []
+        for value in path_values:
+            raw_path: str = str(value or "").strip()
+            if not raw_path or "://" in raw_path:
+                return []
+            source_paths.append(Path(raw_path))
+        return source_paths
 
     def _build_runtime_resource_descriptor(
         self,
@@ -1,25 +1,73 @@
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ontobdc.cli.domain.port.context import CliContextPort
-from ontobdc.cli.domain.response.command import CommandResponse
+from ontobdc.cli.domain.response.command import CommandResponse, ExceptionCommandResponse
 from ontobdc.context.adapter.repository import DocumentImportStepRepository, LocalContextFileResource
+from ontobdc.context.adapter.vector import EntityVectorRepositoryAdapter
 from ontobdc.context.domain.machine.document_import_state import DocumentImportProcessState
 from ontobdc.shared.facade.adapter.logger import NullLogRepository
 from ontobdc.shared.facade.port.logger import LogRepositoryPort
 
 
+class DocumentImportSharedResources:
+    """Process-wide resources shared by every document of one import batch.
+
+    The entity facade is resolved once from the CLI context (or through
+    ``EntityVectorRepositoryAdapter`` when the context does not carry it),
+    and the context parameters the import steps read are snapshotted, so
+    concurrent documents never go back to the CLI context.
+    """
+
+    _CONTEXT_PARAMETER_NAMES: tuple[str, ...] = (
+        "container_id",
+        "container_path",
+        "entity_uri",
+        "worksheet_name",
+        "datapackage_path",
+    )
+
+    def __init__(self, context: CliContextPort) -> None:
+        self._root_path: str = str(context.root_path)
+        self._parameters: Dict[str, str] = {
+            name: str(context.get_parameter_value(name) or "").strip()
+            for name in self._CONTEXT_PARAMETER_NAMES
+        }
+        self._entity_facade: Dict[str, Any] = dict(context.get_parameter_value("entity_facade") or {})
+        if not self._entity_facade and self._parameters["entity_uri"]:
+            self._entity_facade = dict(
+                EntityVectorRepositoryAdapter(self._root_path).resolve_entity_facade(
+                    self._parameters["entity_uri"]
+                )
+                or {}
+            )
+
+    @property
+    def entity_facade(self) -> Dict[str, Any]:
+        return self._entity_facade
+
+    def get_parameter_value(self, name: str) -> str:
+        return self._parameters.get(name, "")
+
+
 class DocumentImportStateTransitionHandler:
     def __init__(
         self,
         context: CliContextPort,
         logger: Optional[LogRepositoryPort] = None,
+        step_repository: Optional[DocumentImportStepRepository] = None,
+        shared_resources: Optional[DocumentImportSharedResources] = None,
     ) -> None:
         self._context: CliContextPort = context
         self._logger: LogRepositoryPort = logger or NullLogRepository()
-        self._step_repository: DocumentImportStepRepository = context.get_parameter_value("step_repository")
+        self._step_repository: DocumentImportStepRepository = (
+            step_repository or context.get_parameter_value("step_repository")
+        )
         self._target_path: Path = self._step_repository.source_path
+        self._shared_resources: Optional[DocumentImportSharedResources] = shared_resources
 
     @property
     def context(self) -> CliContextPort:
@@ -36,7 +84,37 @@ class DocumentImportStateTransitionHandler:
                 return state
         return DocumentImportProcessState.UNDEFINED
 
+    @property
+    def step_repository(self) -> DocumentImportStepRepository:
+        return self._step_repository
+
     def execute(self) -> CommandResponse:
+        generated_steps: List[Dict[str, Any]] = self.run_steps()
+        current_state: DocumentImportProcessState = self.observed_state
+
+        return CommandResponse(
+            title="Context Import Bootstrap",
+            description=f"Bootstrapped the import workflow for '{self._target_path.name}' with an empty workbook source.",
+            content={
+                "container_id": self._parameter("container_id"),
+                "container_path": self._parameter("container_path"),
+                "entity_uri": self._parameter("entity_uri"),
+                "source_path": str(self._target_path),
+                "current_state": current_state.value,
+                "visited_states": [DocumentImportProcessState.UNDEFINED.value]
+                + [step["state"] for step in generated_steps],
+                "step_dir": str(self._step_repository.step_dir),
+                "generated_steps": generated_steps,
+            },
+        )
+
+    def run_steps(self) -> List[Dict[str, Any]]:
+        """Materialize every import step of this document and return them.
+
+        When the handler runs as part of a batch (``shared_resources`` is
+        set) the CLI context is never written, so documents can be processed
+        concurrently without each step re-serializing ``context.ttl``.
+        """
         generated_steps: List[Dict[str, Any]] = []
 
         previous_state: DocumentImportProcessState = DocumentImportProcessState.UNDEFINED
@@ -51,7 +129,8 @@ class DocumentImportStateTransitionHandler:
                 content=json.dumps(step_payload, ensure_ascii=True, indent=2, sort_keys=True),
                 file_type="json",
             )
-            self._context.set_parameter_value("resource", LocalContextFileResource(step_path))
+            if self._shared_resources is None:
+                self._context.set_parameter_value("resource", LocalContextFileResource(step_path))
             generated_steps.append(
                 {
                     "state": state.value,
@@ -60,23 +139,7 @@ class DocumentImportStateTransitionHandler:
             )
             previous_state = state
 
-        current_state: DocumentImportProcessState = self.observed_state
-
-        return CommandResponse(
-            title="Context Import Bootstrap",
-            description=f"Bootstrapped the import workflow for '{self._target_path.name}' with an empty workbook source.",
-            content={
-                "container_id": str(self._context.get_parameter_value("container_id") or "").strip(),
-                "container_path": str(self._context.get_parameter_value("container_path") or "").strip(),
-                "entity_uri": str(self._context.get_parameter_value("entity_uri") or "").strip(),
-                "source_path": str(self._target_path),
-                "current_state": current_state.value,
-                "visited_states": [DocumentImportProcessState.UNDEFINED.value]
-                + [step["state"] for step in generated_steps],
-                "step_dir": str(self._step_repository.step_dir),
-                "generated_steps": generated_steps,
-            },
-        )
+        return generated_steps
 
     def _import_state_sequence(self) -> List[DocumentImportProcessState]:
         return [
@@ -99,7 +162,11 @@ class DocumentImportStateTransitionHandler:
         previous_state: DocumentImportProcessState,
     ) -> Dict[str, Any]:
         source_resource: LocalContextFileResource = self._step_repository.reload(DocumentImportProcessState.UNDEFINED)
-        entity_facade: Dict[str, Any] = dict(self._context.get_parameter_value("entity_facade") or {})
+        entity_facade: Dict[str, Any] = (
+            self._shared_resources.entity_facade
+            if self._shared_resources is not None
+            else dict(self._context.get_parameter_value("entity_facade") or {})
+        )
         field_identifiers: List[str] = [
             str(field.get("identifier") or "").strip()
             for field in list(entity_facade.get("fields") or [])
@@ -111,23 +178,140 @@ class DocumentImportStateTransitionHandler:
             "state_label": state.label(),
             "state_description": state.description(),
             "previous_state": previous_state.value,
-            "container_id": str(self._context.get_parameter_value("container_id") or "").strip(),
-            "container_path": str(self._context.get_parameter_value("container_path") or "").strip(),
-            "entity_uri": str(self._context.get_parameter_value("entity_uri") or "").strip(),
+            "container_id": self._parameter("container_id"),
+            "container_path": self._parameter("container_path"),
+            "entity_uri": self._parameter("entity_uri"),
             "entity_name": str(entity_facade.get("entity_name") or "").strip(),
             "entity_identifier": str(entity_facade.get("entity_identifier") or "").strip(),
             "entity_facade_uri": str(entity_facade.get("facade_uri") or "").strip(),
             "source_file": source_resource.to_json(),
             "workbook": {
                 "path": str(source_resource.path),
-                "worksheet_name": str(self._context.get_parameter_value("worksheet_name") or "").strip(),
+                "worksheet_name": self._parameter("worksheet_name"),
                 "field_count": len(field_identifiers),
                 "field_identifiers": field_identifiers,
                 "row_count": 0,
                 "format": "xlsx",
             },
-            "datapackage_path": str(self._context.get_parameter_value("datapackage_path") or "").strip(),
+            "datapackage_path": self._parameter("datapackage_path"),
             "bootstrap_mode": "empty_entity_workbook",
         }
 
         return payload
+
+    def _parameter(self, name: str) -> str:
+        if self._shared_resources is not None:
+            return self._shared_resources.get_parameter_value(name)
+        return str(self._context.get_parameter_value(name) or "").strip()
+
+
+class DocumentBatchImportStateTransitionHandler:
+    """Fan the per-document import pipeline out across a worker pool.
+
+    Every source file listed in the ``import_source_files`` context
+    parameter gets its own ``DocumentImportStepRepository`` and runs through
+    ``DocumentImportStateTransitionHandler`` on a thread of the pool. The
+    resolved entity facade and context parameters are shared through one
+    ``DocumentImportSharedResources`` instance, and the CLI context is only
+    written once, after every document has finished. Step directories are
+    keyed by source path as well as content, so identical documents in one
+    batch do not overwrite each other's step files.
+    """
+
+    def __init__(
+        self,
+        context: CliContextPort,
+        logger: Optional[LogRepositoryPort] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self._context: CliContextPort = context
+        self._logger: LogRepositoryPort = logger or NullLogRepository()
+        self._source_files: List[str] = [
+            str(source_file)
+            for source_file in list(context.get_parameter_value("import_source_files") or [])
+            if str(source_file).strip()
+        ]
+        self._max_workers: int = max(1, min(max_workers or (os.cpu_count() or 1), len(self._source_files) or 1))
+
+    @property
+    def source_files(self) -> List[str]:
+        return list(self._source_files)
+
+    def execute(self) -> CommandResponse:
+        container_path: str = str(self._context.get_parameter_value("container_path") or "").strip()
+        shared_resources: DocumentImportSharedResources = DocumentImportSharedResources(self._context)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results: List[Dict[str, Any]] = list(
+                executor.map(
+                    lambda source_file: self._import_document(
+                        source_file=source_file,
+                        container_path=container_path,
+                        shared_resources=shared_resources,
+                    ),
+                    self._source_files,
+                )
+            )
+
+        failed_results: List[Dict[str, Any]] = [result for result in results if result.get("error")]
+        content: Dict[str, Any] = {
+            "container_id": shared_resources.get_parameter_value("container_id"),
+            "container_path": container_path,
+            "entity_uri": shared_resources.get_parameter_value("entity_uri"),
+            "source_count": len(self._source_files),
+            "imported_count": len(results) - len(failed_results),
+            "failed_count": len(failed_results),
+            "max_workers": self._max_workers,
+            "results": results,
+        }
+        if failed_results:
+            return ExceptionCommandResponse(
+                title="Context Batch Import Incomplete",
+                description=f"{len(failed_results)} of {len(self._source_files)} document(s) could not be imported.",
+                content=content,
+            )
+
+        if results:
+            self._context.set_parameter_value(
+                "resource",
+                LocalContextFileResource(Path(str(results[-1]["generated_steps"][-1]["path"]))),
+            )
+
+        return CommandResponse(
+            title="Context Batch Import Bootstrap",
+            description=f"Bootstrapped the import workflow for {len(results)} document(s) with {self._max_workers} worker(s).",
+            content=content,
+        )
+
+    def _import_document(
+        self,
+        *,
+        source_file: str,
+        container_path: str,
+        shared_resources: DocumentImportSharedResources,
+    ) -> Dict[str, Any]:
+        try:
+            handler: DocumentImportStateTransitionHandler = DocumentImportStateTransitionHandler(
+                context=self._context,
+                logger=self._logger,
+                step_repository=DocumentImportStepRepository(
+                    container_path=container_path,
+                    source_path=source_file,
+                    key_by_path=True,
+                ),
+                shared_resources=shared_resources,
+            )
+            generated_steps: List[Dict[str, Any]] = handler.run_steps()
+        except Exception as error:
+            self._logger.log_error(f"Could not import '{source_file}': {error}")
+            return {
+                "source_path": source_file,
+                "error": str(error),
+            }
+
+        return {
+            "source_path": source_file,
+            "current_state": handler.observed_state.value,
+            "step_dir": str(handler.step_repository.step_dir),
+            "generated_steps": generated_steps,
+        }
@@ -1,8 +1,6 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from rdflib import Graph, Literal, URIRef
-
 from ontobdc.context.adapter.vector import EntityVectorRepositoryAdapter
 
 
@@ -27,11 +25,7 @@ class BrasidataEntityCatalogRepositoryAdapter:
         cache_root: Path = Path(
             str(sync_payload.get("cache_root") or "")
         ).expanduser().resolve()
-        facade_files: List[Path] = sorted(
-            file_path
-            for file_path in (cache_root / "ontology").rglob("facade.ttl")
-            if file_path.is_file()
-        )
+        facade_files: List[Path] = self._vector_repository.cached_facade_files()
         entities: List[Dict[str, Any]] = self._load_entities(
             cache_root=cache_root,
             facade_files=facade_files,
@@ -68,68 +62,39 @@ class BrasidataEntityCatalogRepositoryAdapter:
     ) -> List[Dict[str, Any]]:
         selected_by_uri: Dict[str, Dict[str, Any]] = {}
 
-        for facade_file in facade_files:
-            graph: Graph = Graph()
-            graph.parse(str(facade_file), format="turtle")
+        record: Dict[str, Any]
+        for record in self._vector_repository.facade_index.records(facade_files):
+            entity_uri: str = str(record.get("entity_uri") or "").strip()
+            if not entity_uri:
+                continue
+
             relative_source_path: str = self._relative_source_path(
                 cache_root=cache_root,
-                source_file=facade_file,
+                source_file=Path(str(record["source_file"])),
             )
-
-            entity_subject: URIRef
-            predicate: URIRef
-            facade_subject: URIRef
-            for entity_subject, predicate, facade_subject in graph:
-                if self._local_name(predicate) != "hasDataEntityFacade":
-                    continue
-                if not isinstance(entity_subject, URIRef):
-                    continue
-                if not isinstance(facade_subject, URIRef):
-                    continue
-
-                entity_uri: str = str(entity_subject).strip()
-                if not entity_uri:
-                    continue
-
-                entity_record: Dict[str, Any] = {
-                    "entity_uri": entity_uri,
-                    "entity_name": self._local_name(entity_subject),
-                    "entity_identifier": self._snake_case(
-                        self._local_name(entity_subject)
-                    ),
-                    "facade_uri": str(facade_subject),
-                    "facade_identifier": self._literal_value(
-                        graph=graph,
-                        subject=facade_subject,
-                        predicate_local_name="identifier",
-                    ),
-                    "facade_name": self._literal_value(
-                        graph=graph,
-                        subject=facade_subject,
-                        predicate_local_name="name",
-                    ),
-                    "description": self._literal_value(
-                        graph=graph,
-                        subject=facade_subject,
-                        predicate_local_name="description",
-                    ),
-                    "field_count": self._count_objects(
-                        graph=graph,
-                        subject=facade_subject,
-                        predicate_local_name="hasFacadeField",
-                    ),
-                    "domain": self._ontology_domain(relative_source_path),
-                    "kind": self._ontology_kind(relative_source_path),
-                    "source_path": relative_source_path,
-                }
-
-                current_record: Optional[Dict[str, Any]] = (
-                    selected_by_uri.get(entity_uri)
-                )
-                if current_record is None or relative_source_path < str(
-                    current_record.get("source_path") or ""
-                ):
-                    selected_by_uri[entity_uri] = entity_record
+            entity_record: Dict[str, Any] = {
+                "entity_uri": entity_uri,
+                "entity_name": str(record["entity_name"]),
+                "entity_identifier": self._snake_case(
+                    str(record["entity_name"])
+                ),
+                "facade_uri": str(record["facade_uri"]),
+                "facade_identifier": str(record["facade_identifier"]),
+                "facade_name": str(record["facade_name"]),
+                "description": str(record["description"]),
+                "field_count": int(record["field_count"]),
+                "domain": self._ontology_domain(relative_source_path),
+                "kind": self._ontology_kind(relative_source_path),
+                "source_path": relative_source_path,
+            }
+
+            current_record: Optional[Dict[str, Any]] = (
+                selected_by_uri.get(entity_uri)
+            )
+            if current_record is None or relative_source_path < str(
+                current_record.get("source_path") or ""
+            ):
+                selected_by_uri[entity_uri] = entity_record
 
         return sorted(
             selected_by_uri.values(),
@@ -140,36 +105,6 @@ class BrasidataEntityCatalogRepositoryAdapter:
             ),
         )
 
-    def _literal_value(
-        self,
-        *,
-        graph: Graph,
-        subject: URIRef,
-        predicate_local_name: str,
-    ) -> str:
-        predicate: URIRef
-        obj: Any
-        for predicate, obj in graph.predicate_objects(subject):
-            if self._local_name(predicate) != predicate_local_name:
-                continue
-            if isinstance(obj, Literal):
-                return str(obj).strip()
-
-        return ""
-
-    def _count_objects(
-        self,
-        *,
-        graph: Graph,
-        subject: URIRef,
-        predicate_local_name: str,
-    ) -> int:
-        return sum(
-            1
-            for predicate, _ in graph.predicate_objects(subject)
-            if self._local_name(predicate) == predicate_local_name
-        )
-
     def _relative_source_path(
         self,
         *,
@@ -204,9 +139,3 @@ class BrasidataEntityCatalogRepositoryAdapter:
                 output.append("_")
             output.append(character.lower())
         return "".join(output)
-
-    def _local_name(self, uri: Any) -> str:
-        raw_value: str = str(uri).strip()
-        if "#" in raw_value:
-            return raw_value.rsplit("#", 1)[-1]
-        return raw_value.rstrip("/").rsplit("/", 1)[-1]
@@ -0,0 +1,203 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from rdflib import Graph, Literal, URIRef
+
+from ontobdc.shared.adapter.local_name_index import LocalNameIndex
+
+
+class EntityFacadeIndex:
+    """Persistent entity -> facade-fields index built from ``facade.ttl`` files.
+
+    Every indexed source file is recorded with its ``st_mtime_ns`` and
+    ``st_size``; ``refresh`` re-parses only the sources whose stat changed
+    (or that are new) and drops the ones that disappeared, so repeated
+    lookups read one JSON file instead of parsing and scanning every facade
+    graph. Records are plain dictionaries so each caller projects the field
+    shape it needs. Each source also stores the positions of its records
+    keyed by entity URI and by normalized entity name, so ``find`` is one
+    dictionary read per facade file.
+    """
+
+    INDEX_FILENAME: str = "facade-index.json"
+    INDEX_VERSION: int = 2
+
+    def __init__(self, index_path: Path) -> None:
+        self._index_path: Path = Path(index_path).expanduser().resolve()
+        self._sources: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @classmethod
+    def for_root(cls, root_path: Path) -> "EntityFacadeIndex":
+        return cls(Path(root_path).expanduser().resolve() / ".__ontobdc__" / "cache" / cls.INDEX_FILENAME)
+
+    @property
+    def index_path(self) -> Path:
+        return self._index_path
+
+    def refresh(self, facade_files: Iterable[Path]) -> None:
+        sources: Dict[str, Dict[str, Any]] = self._load()
+        source_paths: List[Path] = [Path(facade_file).expanduser().resolve() for facade_file in facade_files]
+        tracked_keys = {str(source_path) for source_path in source_paths}
+        changed: bool = False
+
+        source_path: Path
+        for source_path in source_paths:
+            source_key: str = str(source_path)
+            signature: Optional[Tuple[int, int]] = self._signature(source_path)
+            if signature is None:
+                continue
+            current: Optional[Dict[str, Any]] = sources.get(source_key)
+            if current is not None and tuple(current.get("signature") or ()) == signature:
+                continue
+            records: List[Dict[str, Any]] = self._build_records(source_path)
+            sources[source_key] = {
+                "signature": list(signature),
+                "records": records,
+                "lookup": self._build_lookup(records),
+            }
+            changed = True
+
+        for source_key in [key for key in sources if key not in tracked_keys and not Path(key).is_file()]:
+            sources.pop(source_key)
+            changed = True
+
+        if changed:
+            self._save(sources)
+
+    def records(self, facade_files: Iterable[Path]) -> List[Dict[str, Any]]:
+        """Return the indexed records of ``facade_files``, in file order."""
+        source_paths: List[Path] = [Path(facade_file).expanduser().resolve() for facade_file in facade_files]
+        self.refresh(source_paths)
+        sources: Dict[str, Dict[str, Any]] = self._load()
+        return [
+            dict(record)
+            for source_path in source_paths
+            for record in list((sources.get(str(source_path)) or {}).get("records") or [])
+        ]
+
+    def find(self, entity: str, facade_files: Iterable[Path]) -> List[Dict[str, Any]]:
+        """Return the records whose entity matches ``entity`` by URI or normalized local name."""
+        entity_value: str = str(entity or "").strip()
+        normalized_entity: str = self.normalized_name(LocalNameIndex.local_name(entity_value))
+        source_paths: List[Path] = [Path(facade_file).expanduser().resolve() for facade_file in facade_files]
+        self.refresh(source_paths)
+        sources: Dict[str, Dict[str, Any]] = self._load()
+
+        matches: List[Dict[str, Any]] = []
+        for source_path in source_paths:
+            source: Dict[str, Any] = sources.get(str(source_path)) or {}
+            lookup: Dict[str, List[int]] = dict(source.get("lookup") or {})
+            positions: List[int] = sorted(
+                set(lookup.get(f"uri:{entity_value}") or [])
+                | set(lookup.get(f"name:{normalized_entity}") or [])
+            )
+            records: List[Dict[str, Any]] = list(source.get("records") or [])
+            matches.extend(dict(records[position]) for position in positions)
+        return matches
+
+    @staticmethod
+    def normalized_name(value: str) -> str:
+        return "".join(character for character in str(value).lower() if character.isalnum())
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._sources is not None:
+            return self._sources
+
+        self._sources = {}
+        if self._index_path.is_file():
+            try:
+                payload: Any = json.loads(self._index_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, dict) and payload.get("version") == self.INDEX_VERSION:
+                self._sources = dict(payload.get("sources") or {})
+        return self._sources
+
+    def _save(self, sources: Dict[str, Dict[str, Any]]) -> None:
+        self._sources = sources
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path: Path = self._index_path.with_name(f".{self._index_path.name}.tmp")
+            temporary_path.write_text(
+                json.dumps({"version": self.INDEX_VERSION, "sources": sources}, ensure_ascii=True, sort_keys=True),
+                encoding="utf-8",
+            )
+            temporary_path.replace(self._index_path)
+        except OSError:
+            # A read-only location still gets the in-memory index for this process.
+            return
+
+    def _signature(self, source_path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat_result = source_path.stat()
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    def _build_lookup(self, records: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+        lookup: Dict[str, List[int]] = {}
+        for position, record in enumerate(records):
+            lookup.setdefault(f"uri:{record['entity_uri']}", []).append(position)
+            lookup.setdefault(f"name:{self.normalized_name(record['entity_name'])}", []).append(position)
+        return lookup
+
+    def _build_records(self, source_path: Path) -> List[Dict[str, Any]]:
+        graph: Graph = Graph()
+        graph.parse(str(source_path), format="turtle")
+
+        index: LocalNameIndex = LocalNameIndex(graph)
+
+        def first_literal(subject: Any, local_name: str) -> str:
+            literal: Optional[Literal] = index.first_literal(subject, local_name)
+            return str(literal).strip() if literal is not None else ""
+
+        def first_uri(subject: Any, local_name: str) -> str:
+            uri: Optional[URIRef] = index.first_uri(subject, local_name)
+            return str(uri) if uri is not None else ""
+
+        records: List[Dict[str, Any]] = []
+        for entity_subject, facade_subject in index.subject_objects("hasDataEntityFacade"):
+            if not isinstance(entity_subject, URIRef) or not isinstance(facade_subject, URIRef):
+                continue
+            field_subjects: List[Any] = index.objects(facade_subject, "hasFacadeField")
+            fields: List[Dict[str, Any]] = []
+            for field_subject in field_subjects:
+                identifier: str = first_literal(field_subject, "identifier")
+                if not identifier:
+                    continue
+                required: List[Any] = [
+                    obj for obj in index.objects(field_subject, "isRequired")
+                    if isinstance(obj, Literal)
+                ]
+                fields.append(
+                    {
+                        "identifier": identifier,
+                        "datatype": LocalNameIndex.local_name(first_uri(field_subject, "fieldDatatype")),
+                        "mapped_property": first_uri(field_subject, "mapsToProperty"),
+                        "required": bool(required[0].toPython()) if required else False,
+                    }
+                )
+            fields.sort(
+                key=lambda field: (
+                    0 if field["identifier"] == "global_id" else
+                    1 if field["identifier"] == "name" else 2,
+                    field["identifier"],
+                )
+            )
+            records.append(
+                {
+                    "entity_uri": str(entity_subject),
+                    "entity_name": LocalNameIndex.local_name(entity_subject),
+                    "facade_uri": str(facade_subject),
+                    "facade_identifier": first_literal(facade_subject, "identifier"),
+                    "facade_name": first_literal(facade_subject, "name"),
+                    "description": first_literal(facade_subject, "description"),
+                    "field_count": len(field_subjects),
+                    "fields": fields,
+                    "source_file": str(source_path),
+                }
+            )
+
+        records.sort(key=lambda record: (record["entity_uri"], record["facade_uri"]))
+        return records
@@ -0,0 +1,305 @@
+import hashlib
+import json
+import re
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple
+
+from ontobdc.storage.adapter.bootstrap import get_ontobdc_directory
+
+
+class DatasetInstanceTableCache:
+    """Columnar sidecar cache of a dataset resource's typed instance rows.
+
+    Each frictionless resource gets two files under
+    ``<dataset>/.__ontobdc__/cache/instances/``: ``<name>.meta.json`` holds
+    the descriptor hash, the schema field names, the cached column names
+    and the size,
+    ``st_mtime_ns`` and SHA-256 of every source file; ``<name>.columns.json``
+    holds one value list per cached column plus each column's frictionless
+    type. Only the columns a read projected are cached, and a later read is
+    served from the sidecar when it needs no other column. A read whose
+    descriptor hash and source stats all match skips frictionless entirely.
+    A source whose mtime moved but whose size did not is re-hashed once, and
+    a matching hash just refreshes the recorded stat. Cast values are stored
+    in a JSON form that decodes back to the same Python types frictionless
+    casts to; a column whose type is not in ``CACHEABLE_TYPES`` (``any``,
+    ``list``) is never cached.
+    """
+
+    CACHE_VERSION: int = 3
+    HASH_CHUNK_SIZE: int = 1024 * 1024
+    CACHEABLE_TYPES: FrozenSet[str] = frozenset(
+        {
+            "string",
+            "integer",
+            "boolean",
+            "year",
+            "array",
+            "object",
+            "geojson",
+            "number",
+            "date",
+            "datetime",
+            "time",
+            "yearmonth",
+            "geopoint",
+            "duration",
+        }
+    )
+
+    def __init__(self, cache_directory: Path) -> None:
+        self._cache_directory: Path = Path(cache_directory).expanduser().resolve()
+
+    @classmethod
+    def for_dataset(cls, dataset_path: Path) -> "DatasetInstanceTableCache":
+        return cls(get_ontobdc_directory(Path(dataset_path)) / "cache" / "instances")
+
+    @property
+    def cache_directory(self) -> Path:
+        return self._cache_directory
+
+    @staticmethod
+    def descriptor_hash(descriptor: Dict[str, Any]) -> str:
+        return hashlib.sha256(
+            json.dumps(descriptor, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def read(
+        self,
+        *,
+        resource_name: str,
+        descriptor: Dict[str, Any],
+        source_paths: List[Path],
+        columns: Optional[Sequence[str]] = None,
+    ) -> Optional[Iterator[Dict[str, Any]]]:
+        """Return the cached rows holding ``columns`` (every schema field when
+        ``None``), or ``None`` when the cache is missing, stale or lacks one.
+
+        Requested names that are not schema fields are dropped, as the
+        frictionless read drops them.
+        """
+        meta_path, columns_path = self._paths(resource_name)
+        meta: Optional[Dict[str, Any]] = self._load_json(meta_path)
+        if (
+            meta is None
+            or meta.get("version") != self.CACHE_VERSION
+            or meta.get("descriptor") != self.descriptor_hash(descriptor)
+        ):
+            return None
+        cached_columns: List[str] = list(meta.get("column_names") or [])
+        if columns is None:
+            if not meta.get("complete"):
+                return None
+            column_names: List[str] = cached_columns
+        else:
+            schema_fields: Set[str] = set(meta.get("field_names") or [])
+            column_names = [
+                column for column in dict.fromkeys(columns) if column in schema_fields
+            ]
+            if not set(column_names) <= set(cached_columns):
+                return None
+        if not column_names:
+            # Row count is only recoverable from a column's values.
+            return None
+
+        recorded: List[Dict[str, Any]] = list(meta.get("sources") or [])
+        if [str(source.get("path")) for source in recorded] != [str(path) for path in source_paths]:
+            return None
+
+        refreshed: bool = False
+        for source in recorded:
+            signature: Optional[Tuple[int, int]] = self._signature(Path(source["path"]))
+            if signature is None or signature[1] != source.get("size"):
+                return None
+            if signature[0] == source.get("mtime_ns"):
+                continue
+            if self._file_hash(Path(source["path"])) != source.get("sha256"):
+                return None
+            source["mtime_ns"] = signature[0]
+            refreshed = True
+
+        table: Optional[Dict[str, Any]] = self._load_json(columns_path)
+        if table is None or table.get("descriptor") != meta.get("descriptor"):
+            return None
+        try:
+            decoded: List[List[Any]] = self._decode_table(table, column_names)
+        except (LookupError, TypeError, ValueError):
+            return None
+        if refreshed:
+            self._write_json(meta_path, meta)
+        return self._iter_rows(column_names, decoded)
+
+    def write(
+        self,
+        *,
+        resource_name: str,
+        descriptor: Dict[str, Any],
+        source_paths: List[Path],
+        signatures: List[Tuple[int, int]],
+        field_types: Dict[str, str],
+        columns: Dict[str, List[Any]],
+        complete: bool,
+    ) -> None:
+        """Store ``columns``; ``signatures`` are the source stats taken before the read.
+
+        ``complete`` marks that ``columns`` holds every schema field.
+        """
+        if [self._signature(path) for path in source_paths] != signatures:
+            # A source changed while it was being read; its rows may be mixed.
+            return
+
+        descriptor_hash: str = self.descriptor_hash(descriptor)
+        try:
+            encoded: Dict[str, List[Any]] = {
+                column: self._encode_column(values, field_types.get(column, ""))
+                for column, values in columns.items()
+            }
+            table_text: str = json.dumps(
+                {
+                    "descriptor": descriptor_hash,
+                    "column_names": list(columns),
+                    "types": dict(field_types),
+                    "columns": encoded,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        except (AttributeError, LookupError, TypeError, ValueError):
+            return
+
+        meta_path, columns_path = self._paths(resource_name)
+        self._write_text(columns_path, table_text)
+        self._write_json(
+            meta_path,
+            {
+                "version": self.CACHE_VERSION,
+                "descriptor": descriptor_hash,
+                "field_names": list(field_types),
+                "column_names": list(columns),
+                "complete": complete,
+                "sources": [
+                    {
+                        "path": str(path),
+                        "mtime_ns": signature[0],
+                        "size": signature[1],
+                        "sha256": self._file_hash(path),
+                    }
+                    for path, signature in zip(source_paths, signatures)
+                ],
+            },
+        )
+
+    def signatures(self, source_paths: List[Path]) -> Optional[List[Tuple[int, int]]]:
+        signatures: List[Tuple[int, int]] = []
+        for path in source_paths:
+            signature: Optional[Tuple[int, int]] = self._signature(path)
+            if signature is None:
+                return None
+            signatures.append(signature)
+        return signatures
+
+    def _decode_table(self, table: Dict[str, Any], column_names: List[str]) -> List[List[Any]]:
+        types: Dict[str, str] = dict(table.get("types") or {})
+        encoded: Dict[str, List[Any]] = dict(table.get("columns") or {})
+        return [self._decode_column(list(encoded[column]), types.get(column, "")) for column in column_names]
+
+    def _iter_rows(self, column_names: List[str], decoded: List[List[Any]]) -> Iterator[Dict[str, Any]]:
+        for values in zip(*decoded):
+            yield dict(zip(column_names, values))
+
+    def _encode_column(self, values: List[Any], field_type: str) -> List[Any]:
+        if field_type not in self.CACHEABLE_TYPES:
+            raise ValueError(f"Field type is not cacheable: {field_type}")
+        return [None if value is None else self._encode_value(value, field_type) for value in values]
+
+    def _decode_column(self, values: List[Any], field_type: str) -> List[Any]:
+        return [None if value is None else self._decode_value(value, field_type) for value in values]
+
+    def _encode_value(self, value: Any, field_type: str) -> Any:
+        if field_type == "number":
+            # ``floatNumber`` fields cast to float; JSON keeps those as numbers.
+            return str(value) if isinstance(value, Decimal) else value
+        if field_type in {"date", "datetime", "time"}:
+            return value.isoformat()
+        if field_type == "yearmonth":
+            return [value.year, value.month]
+        if field_type == "geopoint":
+            return [str(part) if isinstance(part, Decimal) else part for part in value]
+        if field_type == "duration":
+            from frictionless import platform
+
+            return platform.isodate.duration_isoformat(value)
+        return value
+
+    def _decode_value(self, value: Any, field_type: str) -> Any:
+        if field_type == "number":
+            return Decimal(value) if isinstance(value, str) else value
+        if field_type == "date":
+            return date.fromisoformat(value)
+        if field_type == "datetime":
+            return datetime.fromisoformat(value)
+        if field_type == "time":
+            return time.fromisoformat(value)
+        if field_type == "yearmonth":
+            from frictionless.fields.yearmonth import yearmonth
+
+            return yearmonth(*value)
+        if field_type == "geopoint":
+            from frictionless.fields.geopoint import geopoint
+
+            return geopoint(*(Decimal(part) if isinstance(part, str) else part for part in value))
+        if field_type == "duration":
+            from frictionless import platform
+
+            return platform.isodate.parse_duration(value)
+        return value
+
+    def _paths(self, resource_name: str) -> Tuple[Path, Path]:
+        safe_name: str = re.sub(r"[^A-Za-z0-9._-]+", "_", resource_name).strip("._") or "resource"
+        digest: str = hashlib.sha256(resource_name.encode("utf-8")).hexdigest()[:12]
+        stem: str = f"{safe_name[-80:]}_{digest}"
+        return (
+            self._cache_directory / f"{stem}.meta.json",
+            self._cache_directory / f"{stem}.columns.json",
+        )
+
+    def _signature(self, path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    def _file_hash(self, path: Path) -> str:
+        digest = hashlib.sha256()
+        try:
+            with path.open("rb") as stream:
+                for chunk in iter(lambda: stream.read(self.HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+        except OSError:
+            return ""
+        return digest.hexdigest()
+
+    def _load_json(self, path: Path) -> Optional[Dict[str, Any]]:
+        if not path.is_file():
+            return None
+        try:
+            payload: Any = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def _write_json(self, path: Path, payload: Dict[str, Any]) -> None:
+        self._write_text(path, json.dumps(payload, ensure_ascii=True, sort_keys=True))
+
+    def _write_text(self, path: Path, text: str) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path: Path = path.with_name(f".{path.name}.tmp")
+            temporary_path.write_text(text, encoding="utf-8")
+            temporary_path.replace(path)
+        except OSError:
+            # A read-only dataset is still read directly through frictionless.
+            return
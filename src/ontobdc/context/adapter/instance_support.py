@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, List
+from typing import Any, List, Mapping, Optional
 
 from rdflib import Graph
 
@@ -16,6 +16,21 @@ class EntityInstanceRepositorySupport:
             raise ValueError(f"Could not read {label}: {file_path}") from exc
         return graph
 
+    def _instance_matches(
+        self,
+        instance: Mapping[str, Any],
+        *,
+        equals: Optional[Mapping[str, Any]] = None,
+        prefixes: Optional[Mapping[str, str]] = None,
+    ) -> bool:
+        for column, expected in (equals or {}).items():
+            if str(instance.get(column) or "").strip() != str(expected).strip():
+                return False
+        for column, prefix in (prefixes or {}).items():
+            if not str(instance.get(column) or "").strip().startswith(prefix):
+                return False
+        return True
+
     def _references_match(self, left: Any, right: Any) -> bool:
         left_value: str = str(left or "").strip()
         right_value: str = str(right or "").strip()
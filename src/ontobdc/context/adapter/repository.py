@@ -191,13 +191,19 @@ class EntityAnalysisStepRepository(EntityLearningStepRepository):
 
 
 class DocumentImportStepRepository(EntityLearningStepRepository):
-    def __init__(self, container_path: str, source_path: str) -> None:
+    def __init__(self, container_path: str, source_path: str, *, key_by_path: bool = False) -> None:
         self._root_path: Path = Path(container_path).expanduser().resolve()
         self._source_path: Path = Path(source_path).expanduser().resolve()
         if not self._source_path.exists() or not self._source_path.is_file():
             raise FileNotFoundError(f"Import source not found: {self._source_path}")
 
-        self._source_hash: str = hashlib.sha256(self._source_path.read_bytes()).hexdigest()
+        source_digest = hashlib.sha256()
+        if key_by_path:
+            # Batch imports run documents concurrently: identical files at
+            # different paths must not share (and overwrite) one step dir.
+            source_digest.update(f"{self._source_path}\0".encode("utf-8"))
+        source_digest.update(self._source_path.read_bytes())
+        self._source_hash: str = source_digest.hexdigest()
         self._step_dir: Path = (
             self._root_path / ".__ontobdc__" / "etl" / "import" / "document" / self._source_hash
         )
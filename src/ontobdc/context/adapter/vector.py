@@ -1,9 +1,16 @@
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
+from urllib.error import URLError
 from urllib.request import Request, urlopen
 
-from rdflib import Graph, Literal, URIRef
+from rdflib import Graph, Literal
+
+from ontobdc.context.adapter.facade_index import EntityFacadeIndex
+from ontobdc.shared.adapter.local_name_index import LocalNameIndex
+from ontobdc.shared.adapter.metadata_index import MetadataFileLocationIndex
 
 
 class EntityVectorRepositoryAdapter:
@@ -12,9 +19,30 @@ class EntityVectorRepositoryAdapter:
     REMOTE_REPOSITORY: str = "brasidatacenter"
     REMOTE_ONTOLOGY_REF: str = "master"
     REMOTE_ONTOLOGY_FILENAMES = frozenset({"vector.ttl", "type.ttl", "facade.ttl"})
+    REMOTE_API_BASE_URL: str = "https://api.github.com"
+    REMOTE_RAW_BASE_URL: str = "https://raw.githubusercontent.com"
+    REMOTE_TIMEOUT_SECONDS: int = 30
+    REMOTE_SYNC_TTL_SECONDS: int = 3600
+    REMOTE_SYNC_RETRY_SECONDS: int = 300
+    REMOTE_SYNC_MAX_WORKERS: int = 8
+    REMOTE_SYNC_MANIFEST_FILENAME: str = "ontology-sync.json"
+    LOCAL_FACADE_FILES_INDEX_FILENAME: str = "facade-file-index.json"
+    CACHED_FACADE_FILES_INDEX_FILENAME: str = "ontology-facade-file-index.json"
 
-    def __init__(self, root_path: str):
+    def __init__(
+        self,
+        root_path: str,
+        api_base_url: Optional[str] = None,
+        raw_base_url: Optional[str] = None,
+        sync_ttl_seconds: Optional[int] = None,
+    ):
         self._project_root: Path = Path(root_path).expanduser().resolve()
+        self._api_base_url: str = (api_base_url or self.REMOTE_API_BASE_URL).rstrip("/")
+        self._raw_base_url: str = (raw_base_url or self.REMOTE_RAW_BASE_URL).rstrip("/")
+        self._sync_ttl_seconds: int = (
+            self.REMOTE_SYNC_TTL_SECONDS if sync_ttl_seconds is None else int(sync_ttl_seconds)
+        )
+        self._facade_index: Optional[EntityFacadeIndex] = None
 
     @property
     def default_max_distance(self) -> float:
@@ -24,6 +52,12 @@ class EntityVectorRepositoryAdapter:
     def cache_root(self) -> Path:
         return self._project_root / ".__ontobdc__" / "cache"
 
+    @property
+    def facade_index(self) -> EntityFacadeIndex:
+        if self._facade_index is None:
+            self._facade_index = EntityFacadeIndex.for_root(self._project_root)
+        return self._facade_index
+
     def resolve_origins(self) -> Dict[str, Any]:
         local_vector_files: List[Path] = sorted(
             file_path
@@ -47,17 +81,73 @@ class EntityVectorRepositoryAdapter:
             "default_max_distance": self.default_max_distance,
         }
 
-    def sync_remote_ontology_vector_cache(self) -> Dict[str, Any]:
-        cache_files: List[str] = []
-        remote_paths: List[str] = self._list_remote_ontology_paths()
-        for remote_path in remote_paths:
-            target_path: Path = self.cache_root / Path(remote_path)
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            target_path.write_text(
-                self._download_remote_text_file(remote_path),
-                encoding="utf-8",
-            )
-            cache_files.append(str(target_path))
+    @property
+    def sync_manifest_path(self) -> Path:
+        return self.cache_root / self.REMOTE_SYNC_MANIFEST_FILENAME
+
+    def sync_remote_ontology_vector_cache(self, force: bool = False) -> Dict[str, Any]:
+        """Bring the cached remote ontology files up to date.
+
+        The sync manifest records the git blob SHA of every cached file and
+        when the remote tree was last listed. Within the TTL the network is
+        not touched at all; past it, the tree is listed once and only blobs
+        whose SHA changed (or whose cached file is missing) are downloaded,
+        concurrently. When listing or downloading fails, an existing cache
+        is reported as stale instead of failing, and the failed attempt is
+        recorded: further syncs serve the stale cache without touching the
+        network until a retry time that backs off exponentially from
+        ``REMOTE_SYNC_RETRY_SECONDS`` up to the TTL. ``force`` ignores both
+        the TTL and the backoff.
+        """
+        manifest: Dict[str, Any] = self._load_sync_manifest()
+        cached_blobs: Dict[str, str] = dict(manifest.get("blobs") or {})
+        downloaded_paths: List[str] = []
+        removed_paths: List[str] = []
+        network_used: bool = False
+        stale: bool = False
+
+        sync_due: bool = force or not self._is_sync_manifest_fresh(manifest)
+        if sync_due and not force and cached_blobs and time.time() < float(manifest.get("retry_after") or 0.0):
+            # A recent attempt failed: keep serving the stale cache until the retry time.
+            sync_due = False
+            stale = True
+
+        if sync_due:
+            synced_at: float = float(manifest.get("synced_at") or 0.0)
+            try:
+                remote_blobs: Dict[str, str] = self._list_remote_ontology_blobs()
+                network_used = True
+            except (URLError, OSError, ValueError):
+                if not cached_blobs:
+                    raise
+                stale = True
+
+            if not stale:
+                removed_paths = sorted(set(cached_blobs) - set(remote_blobs))
+                for remote_path in removed_paths:
+                    (self.cache_root / Path(remote_path)).unlink(missing_ok=True)
+                    cached_blobs.pop(remote_path, None)
+
+                changed_paths: List[str] = sorted(
+                    remote_path
+                    for remote_path, blob_sha in remote_blobs.items()
+                    if cached_blobs.get(remote_path) != blob_sha
+                    or not (self.cache_root / Path(remote_path)).is_file()
+                )
+                try:
+                    downloaded_paths = self._download_remote_files(changed_paths, cached_blobs, remote_blobs)
+                    synced_at = time.time()
+                except (URLError, OSError, ValueError):
+                    if not cached_blobs:
+                        self._save_sync_manifest(self._sync_manifest(synced_at, cached_blobs, failed_attempts=0))
+                        raise
+                    stale = True
+
+            failed_attempts: int = int(manifest.get("failed_attempts") or 0) + 1 if stale else 0
+            self._save_sync_manifest(self._sync_manifest(synced_at, cached_blobs, failed_attempts=failed_attempts))
+
+        remote_paths: List[str] = sorted(cached_blobs)
+        cache_files: List[str] = [str(self.cache_root / Path(remote_path)) for remote_path in remote_paths]
 
         return {
             "remote_ontology_ref": self.REMOTE_ONTOLOGY_REF,
@@ -69,15 +159,40 @@ class EntityVectorRepositoryAdapter:
             "cached_vector_files": [
                 path for path in cache_files if path.endswith("/vector.ttl")
             ],
+            "downloaded_ontology_files": [
+                str(self.cache_root / Path(remote_path)) for remote_path in downloaded_paths
+            ],
+            "removed_ontology_files": [
+                str(self.cache_root / Path(remote_path)) for remote_path in removed_paths
+            ],
+            "network_used": network_used,
+            "stale": stale,
             "cache_root": str(self.cache_root),
         }
 
-    def resolve_entity_facade(self, entity: str) -> Optional[Dict[str, Any]]:
-        local_facade_files = sorted(
-            file_path
-            for file_path in self._project_root.rglob("facade.ttl")
-            if file_path.is_file() and ".__ontobdc__" not in file_path.parts
+    def local_facade_files(self) -> List[Path]:
+        """Return the project's ``facade.ttl`` files outside ``.__ontobdc__`` directories."""
+        return sorted(
+            MetadataFileLocationIndex(
+                self._project_root,
+                self.cache_root / self.LOCAL_FACADE_FILES_INDEX_FILENAME,
+                file_names=["facade.ttl"],
+                excluded_directory_names=[".__ontobdc__"],
+            ).locations("facade.ttl")
         )
+
+    def cached_facade_files(self) -> List[Path]:
+        """Return the ``facade.ttl`` files of the synced remote ontology cache."""
+        return sorted(
+            MetadataFileLocationIndex(
+                self.cache_root / "ontology",
+                self.cache_root / self.CACHED_FACADE_FILES_INDEX_FILENAME,
+                file_names=["facade.ttl"],
+            ).locations("facade.ttl")
+        )
+
+    def resolve_entity_facade(self, entity: str) -> Optional[Dict[str, Any]]:
+        local_facade_files: List[Path] = self.local_facade_files()
         resolved_facade: Optional[Dict[str, Any]] = self._resolve_entity_facade_from_files(
             entity=entity,
             facade_files=local_facade_files,
@@ -86,11 +201,7 @@ class EntityVectorRepositoryAdapter:
             return resolved_facade
 
         self.sync_remote_ontology_vector_cache()
-        cached_facade_files = sorted(
-            file_path
-            for file_path in (self.cache_root / "ontology").rglob("facade.ttl")
-            if file_path.is_file()
-        )
+        cached_facade_files: List[Path] = self.cached_facade_files()
         return self._resolve_entity_facade_from_files(
             entity=entity,
             facade_files=cached_facade_files,
@@ -102,54 +213,24 @@ class EntityVectorRepositoryAdapter:
         entity: str,
         facade_files: List[Path],
     ) -> Optional[Dict[str, Any]]:
-        normalized_entity = self._normalized_name(self._local_name(entity))
-        for facade_file in facade_files:
-            graph = Graph()
-            graph.parse(str(facade_file), format="turtle")
-            for entity_subject, predicate, facade_subject in graph:
-                if self._local_name(predicate) != "hasDataEntityFacade":
-                    continue
-                if self._normalized_name(self._local_name(entity_subject)) != normalized_entity:
-                    continue
-                fields = []
-                for _, field_predicate, field_subject in graph.triples(
-                    (facade_subject, None, None)
-                ):
-                    if self._local_name(field_predicate) != "hasFacadeField":
-                        continue
-                    identifier = self._first_literal_by_local_name(
-                        graph, field_subject, "identifier"
-                    )
-                    datatype = self._first_object_by_local_name(
-                        graph, field_subject, "fieldDatatype"
-                    )
-                    if identifier is None:
-                        continue
-                    fields.append(
-                        {
-                            "identifier": str(identifier),
-                            "name": self._column_name(str(identifier)),
-                            "datatype": self._local_name(datatype) if datatype else "string",
-                        }
-                    )
-                fields.sort(
-                    key=lambda field: (
-                        0 if field["identifier"] == "global_id" else
-                        1 if field["identifier"] == "name" else 2,
-                        field["identifier"],
-                    )
-                )
-                if fields:
-                    return {
-                        "entity_uri": str(entity_subject),
-                        "entity_name": self._local_name(entity_subject),
-                        "entity_identifier": self._snake_case(
-                            self._local_name(entity_subject)
-                        ),
-                        "facade_uri": str(facade_subject),
-                        "fields": fields,
-                        "source_file": str(facade_file),
-                    }
+        for record in self.facade_index.find(entity, facade_files):
+            fields = [
+                {
+                    "identifier": str(field["identifier"]),
+                    "name": self._column_name(str(field["identifier"])),
+                    "datatype": str(field.get("datatype") or "") or "string",
+                }
+                for field in list(record["fields"])
+            ]
+            if fields:
+                return {
+                    "entity_uri": str(record["entity_uri"]),
+                    "entity_name": str(record["entity_name"]),
+                    "entity_identifier": self._snake_case(str(record["entity_name"])),
+                    "facade_uri": str(record["facade_uri"]),
+                    "fields": fields,
+                    "source_file": str(record["source_file"]),
+                }
         return None
 
     def load_registered_candidates(self, file_paths: List[str]) -> Dict[str, Any]:
@@ -176,22 +257,23 @@ class EntityVectorRepositoryAdapter:
                 continue
             graph = Graph()
             graph.parse(str(file_path), format="turtle")
+            index = LocalNameIndex(graph)
             for subject in set(graph.subjects()):
-                identifier_literal = self._first_literal_by_local_name(graph, subject, "identifier")
+                identifier_literal = index.first_literal(subject, "identifier")
                 identifier_value = str(identifier_literal) if identifier_literal is not None else None
                 if identifier_value == "max_distance":
-                    value_literal = self._first_literal_by_local_name(graph, subject, "value")
+                    value_literal = index.first_literal(subject, "value")
                     if value_literal is not None and max_distance is None:
                         max_distance = float(str(value_literal))
                         max_distance_source = str(file_path)
                     continue
-                vector_literal = self._first_literal_by_local_name(graph, subject, "documentTypeVectorValue")
+                vector_literal = index.first_literal(subject, "documentTypeVectorValue")
                 if vector_literal is None:
                     continue
-                entity_type_object = self._first_object_by_local_name(graph, subject, "isDocumentEntityTypeOf")
-                supported_file_type_literal = self._first_literal_by_local_name(graph, subject, "supportedFileType")
-                name_literal = self._first_literal_by_local_name(graph, subject, "name")
-                description_literal = self._first_literal_by_local_name(graph, subject, "description")
+                entity_type_object = index.first_uri(subject, "isDocumentEntityTypeOf")
+                supported_file_type_literal = index.first_literal(subject, "supportedFileType")
+                name_literal = index.first_literal(subject, "name")
+                description_literal = index.first_literal(subject, "description")
                 candidates.append({
                     "candidate_uri": str(subject),
                     "identifier": identifier_value or self._local_name(subject),
@@ -219,16 +301,17 @@ class EntityVectorRepositoryAdapter:
             return {"source_kind": "learning_record", "file_count": 0, "candidate_count": 0, "candidates": [], "max_distance": None, "max_distance_source": ""}
         graph = Graph()
         graph.parse(str(context_file_path), format="turtle")
+        index = LocalNameIndex(graph)
         candidates = []
         for subject in set(graph.subjects()):
-            aligned_vector_literal = self._first_literal_by_local_name(graph, subject, "alignedVector")
+            aligned_vector_literal = index.first_literal(subject, "alignedVector")
             if aligned_vector_literal is None:
                 continue
-            entity_type_object = self._first_object_by_local_name(graph, subject, "entityUri")
-            supported_file_type_literal = self._first_literal_by_local_name(graph, subject, "supportedFileType")
-            source_file_path_literal = self._first_literal_by_local_name(graph, subject, "sourceFilePath")
-            content_language_literal = self._first_literal_by_local_name(graph, subject, "contentLanguage")
-            learned_at_literal = self._first_literal_by_local_name(graph, subject, "learnedAt")
+            entity_type_object = index.first_uri(subject, "entityUri")
+            supported_file_type_literal = index.first_literal(subject, "supportedFileType")
+            source_file_path_literal = index.first_literal(subject, "sourceFilePath")
+            content_language_literal = index.first_literal(subject, "contentLanguage")
+            learned_at_literal = index.first_literal(subject, "learnedAt")
             candidates.append({
                 "candidate_uri": str(subject),
                 "identifier": self._local_name(subject),
@@ -245,18 +328,92 @@ class EntityVectorRepositoryAdapter:
             })
         return {"source_kind": "learning_record", "file_count": 1, "candidate_count": len(candidates), "candidates": candidates, "max_distance": None, "max_distance_source": ""}
 
-    def _list_remote_ontology_paths(self) -> List[str]:
+    def _load_sync_manifest(self) -> Dict[str, Any]:
+        if not self.sync_manifest_path.is_file():
+            return {}
+        try:
+            payload = json.loads(self.sync_manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("remote_ontology_ref") != self.REMOTE_ONTOLOGY_REF:
+            return {}
+        return payload
+
+    def _save_sync_manifest(self, manifest: Dict[str, Any]) -> None:
+        self.cache_root.mkdir(parents=True, exist_ok=True)
+        temporary_path: Path = self.sync_manifest_path.with_name(f".{self.sync_manifest_path.name}.tmp")
+        temporary_path.write_text(json.dumps(manifest, ensure_ascii=True, indent=2, sort_keys=True), encoding="utf-8")
+        temporary_path.replace(self.sync_manifest_path)
+
+    def _sync_manifest(
+        self,
+        synced_at: float,
+        cached_blobs: Dict[str, str],
+        *,
+        failed_attempts: int,
+    ) -> Dict[str, Any]:
+        retry_after: float = 0.0
+        if failed_attempts:
+            retry_after = time.time() + min(
+                max(self._sync_ttl_seconds, self.REMOTE_SYNC_RETRY_SECONDS),
+                self.REMOTE_SYNC_RETRY_SECONDS * 2 ** (failed_attempts - 1),
+            )
+        return {
+            "remote_ontology_ref": self.REMOTE_ONTOLOGY_REF,
+            "synced_at": synced_at,
+            "blobs": cached_blobs,
+            "failed_attempts": failed_attempts,
+            "retry_after": retry_after,
+        }
+
+    def _is_sync_manifest_fresh(self, manifest: Dict[str, Any]) -> bool:
+        blobs: Dict[str, str] = dict(manifest.get("blobs") or {})
+        if not blobs:
+            return False
+        synced_at: float = float(manifest.get("synced_at") or 0.0)
+        if time.time() - synced_at >= self._sync_ttl_seconds:
+            return False
+        return all((self.cache_root / Path(remote_path)).is_file() for remote_path in blobs)
+
+    def _download_remote_files(
+        self,
+        remote_paths: List[str],
+        cached_blobs: Dict[str, str],
+        remote_blobs: Dict[str, str],
+    ) -> List[str]:
+        if not remote_paths:
+            return []
+
+        def download(remote_path: str) -> str:
+            target_path: Path = self.cache_root / Path(remote_path)
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path: Path = target_path.with_name(f".{target_path.name}.tmp")
+            temporary_path.write_text(self._download_remote_text_file(remote_path), encoding="utf-8")
+            temporary_path.replace(target_path)
+            return remote_path
+
+        downloaded_paths: List[str] = []
+        with ThreadPoolExecutor(max_workers=min(self.REMOTE_SYNC_MAX_WORKERS, len(remote_paths))) as executor:
+            for remote_path in executor.map(download, remote_paths):
+                cached_blobs[remote_path] = remote_blobs[remote_path]
+                downloaded_paths.append(remote_path)
+        return downloaded_paths
+
+    def _list_remote_ontology_blobs(self) -> Dict[str, str]:
         request = Request(self._remote_tree_api_url(), headers={"Accept": "application/vnd.github+json", "User-Agent": "OntoBDC"})
-        with urlopen(request, timeout=30) as response:
+        with urlopen(request, timeout=self.REMOTE_TIMEOUT_SECONDS) as response:
             payload = json.loads(response.read().decode("utf-8"))
-        return sorted(
-            path
+        return {
+            path: str(entry.get("sha", "")).strip()
             for entry in list(payload.get("tree", []))
             if entry.get("type") == "blob"
             for path in [str(entry.get("path", "")).strip()]
             if path.startswith("ontology/")
             and Path(path).name in self.REMOTE_ONTOLOGY_FILENAMES
-        )
+        }
+
+    def _list_remote_ontology_paths(self) -> List[str]:
+        return sorted(self._list_remote_ontology_blobs())
 
     def _list_remote_ontology_vector_paths(self) -> List[str]:
         return [
@@ -266,26 +423,14 @@ class EntityVectorRepositoryAdapter:
 
     def _download_remote_text_file(self, remote_path: str) -> str:
         request = Request(self._remote_raw_file_url(remote_path), headers={"User-Agent": "OntoBDC"})
-        with urlopen(request, timeout=30) as response:
+        with urlopen(request, timeout=self.REMOTE_TIMEOUT_SECONDS) as response:
             return response.read().decode("utf-8")
 
     def _remote_tree_api_url(self) -> str:
-        return f"https://api.github.com/repos/{self.REMOTE_OWNER}/{self.REMOTE_REPOSITORY}/git/trees/{self.REMOTE_ONTOLOGY_REF}?recursive=1"
+        return f"{self._api_base_url}/repos/{self.REMOTE_OWNER}/{self.REMOTE_REPOSITORY}/git/trees/{self.REMOTE_ONTOLOGY_REF}?recursive=1"
 
     def _remote_raw_file_url(self, remote_path: str) -> str:
-        return f"https://raw.githubusercontent.com/{self.REMOTE_OWNER}/{self.REMOTE_REPOSITORY}/{self.REMOTE_ONTOLOGY_REF}/{remote_path}"
-
-    def _first_literal_by_local_name(self, graph: Graph, subject: URIRef, local_name: str) -> Optional[Literal]:
-        for _, predicate, obj in graph.triples((subject, None, None)):
-            if self._local_name(predicate) == local_name and isinstance(obj, Literal):
-                return obj
-        return None
-
-    def _first_object_by_local_name(self, graph: Graph, subject: URIRef, local_name: str) -> Optional[URIRef]:
-        for _, predicate, obj in graph.triples((subject, None, None)):
-            if self._local_name(predicate) == local_name and isinstance(obj, URIRef):
-                return obj
-        return None
+        return f"{self._raw_base_url}/{self.REMOTE_OWNER}/{self.REMOTE_REPOSITORY}/{self.REMOTE_ONTOLOGY_REF}/{remote_path}"
 
     def _parse_vector_literal(self, literal: Literal) -> List[float]:
         payload = json.loads(str(literal).strip())
@@ -699,51 +699,24 @@ class ContextEntityCommand(CliCommandPort):
         if not source_path.is_file():
             return {}
 
-        graph: Graph = Graph()
-        graph.parse(str(source_path), format="turtle")
+        root_path: str = str(self._request.context.root_path).strip()
+        records: List[Dict[str, Any]] = EntityVectorRepositoryAdapter(
+            root_path=root_path,
+        ).facade_index.records([source_path])
+        facade_uri: str = str(facade.get("facade_uri") or "").strip()
         requirement_map: Dict[str, bool] = {}
-        field_subject: URIRef
-        predicate: URIRef
-        obj: Any
-        for field_subject, predicate, obj in graph:
-            predicate_name: str = self._local_name(predicate)
-            if predicate_name != "identifier":
-                continue
-            if not isinstance(obj, Literal):
+        record: Dict[str, Any]
+        for record in records:
+            if facade_uri and str(record.get("facade_uri") or "") != facade_uri:
                 continue
-
-            field_identifier: str = str(obj).strip()
-            if not field_identifier:
-                continue
-
-            requirement_map[field_identifier] = self._is_required_field(
-                graph=graph,
-                field_subject=field_subject,
-            )
+            field: Dict[str, Any]
+            for field in list(record.get("fields") or []):
+                requirement_map[str(field["identifier"])] = bool(
+                    field.get("required")
+                )
 
         return requirement_map
 
-    def _is_required_field(
-        self,
-        graph: Graph,
-        field_subject: URIRef,
-    ) -> bool:
-        predicate: URIRef
-        obj: Any
-        for predicate, obj in graph.predicate_objects(field_subject):
-            if self._local_name(predicate) != "isRequired":
-                continue
-            if isinstance(obj, Literal):
-                return bool(obj.toPython())
-
-        return False
-
-    def _local_name(self, predicate: URIRef) -> str:
-        predicate_value: str = str(predicate).strip()
-        if "#" in predicate_value:
-            return predicate_value.rsplit("#", 1)[-1].strip()
-        return predicate_value.rstrip("/").rsplit("/", 1)[-1].strip()
-
     def _frictionless_type(self, datatype: str) -> str:
         return {
             "any_uri": "string",
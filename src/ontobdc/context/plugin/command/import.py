@@ -1,6 +1,10 @@
 
-from pathlib import Path
-from typing import Dict, List
+import hashlib
+import os
+import shutil
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional
 from ontobdc.cli.domain.exception.command import CliCommandArgumentException
 from ontobdc.cli.domain.response.command import CommandResponse
 from ontobdc.cli.domain.request.command import CliCommandRequest
@@ -33,7 +37,10 @@ class DocumentImportCommand(CliCommandPort):
             {
                 "accepts": ["--import-from"],
                 "valued": True,
-                "description": "Select the source file to be imported into the container.",
+                "description": (
+                    "Select the source file, directory or zip archive to be "
+                    "imported into the container."
+                ),
                 "usage": "ontobdc context --entity <entity_uri> --import-from <file_path>",
             },
         ],
@@ -95,13 +102,138 @@ class DocumentImportCommand(CliCommandPort):
         if not resolved_import_path.exists():
             return False
 
+        if not self._has_importable_files(resolved_import_path.resolve()):
+            raise CliCommandArgumentException(
+                f"No importable files found in '{resolved_import_path}'."
+            )
         return True
 
     def run(self) -> CommandResponse:
-        from ontobdc.context.adapter.document import DocumentImportStateTransitionHandler
-
+        from ontobdc.context.adapter.document import (
+            DocumentBatchImportStateTransitionHandler,
+            DocumentImportStateTransitionHandler,
+        )
+        from ontobdc.context.adapter.repository import DocumentImportStepRepository
+
+        source_files: List[str] = [
+            str(source_file)
+            for source_file in self._collect_source_files(
+                Path(
+                    str(self._request.context.get_parameter_value("import_from_path") or "")
+                ).expanduser().resolve(),
+                container_path=Path(
+                    str(self._request.context.get_parameter_value("container_path") or "")
+                ),
+            )
+        ]
+        self._request.context.set_parameter_value("import_source_files", source_files)
+        if len(source_files) > 1:
+            return DocumentBatchImportStateTransitionHandler(
+                context=self._request.context,
+            ).execute()
+
+        self._request.context.set_parameter_value(
+            "step_repository",
+            DocumentImportStepRepository(
+                container_path=str(self._request.context.get_parameter_value("container_path") or ""),
+                source_path=source_files[0],
+            ),
+        )
         handler: DocumentImportStateTransitionHandler = DocumentImportStateTransitionHandler(
             context=self._request.context,
         )
 
         return handler.execute()
+
+    def _has_importable_files(self, import_path: Path) -> bool:
+        """Validate the import source without extracting or writing anything."""
+        if import_path.is_file() and zipfile.is_zipfile(import_path):
+            try:
+                with zipfile.ZipFile(import_path) as archive:
+                    members: List[zipfile.ZipInfo] = self._archive_members(archive)
+            except (OSError, zipfile.BadZipFile) as exc:
+                raise CliCommandArgumentException(
+                    f"Could not read import archive '{import_path}'."
+                ) from exc
+            return any(
+                not member.is_dir()
+                and self._is_importable(PurePosixPath(member.filename))
+                for member in members
+            )
+
+        if import_path.is_file():
+            return True
+
+        return any(
+            file_path.is_file()
+            and self._is_importable(file_path.relative_to(import_path))
+            for file_path in import_path.rglob("*")
+        )
+
+    def _collect_source_files(self, import_path: Path, container_path: Path) -> List[Path]:
+        if import_path.is_file() and zipfile.is_zipfile(import_path):
+            import_path = self._extract_archive(import_path, container_path=container_path)
+
+        if import_path.is_file():
+            return [import_path]
+
+        return sorted(
+            file_path
+            for file_path in import_path.rglob("*")
+            if file_path.is_file()
+            and self._is_importable(file_path.relative_to(import_path))
+        )
+
+    def _is_importable(self, relative_path: PurePosixPath) -> bool:
+        return (
+            ".__ontobdc__" not in relative_path.parts
+            and not relative_path.name.startswith(".")
+        )
+
+    def _archive_members(self, archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+        members: List[zipfile.ZipInfo] = archive.infolist()
+        member: zipfile.ZipInfo
+        for member in members:
+            member_path: PurePosixPath = PurePosixPath(member.filename.replace("\\", "/"))
+            if (
+                member_path.is_absolute()
+                or ".." in member_path.parts
+                or ":" in (member_path.parts[0] if member_path.parts else "")
+            ):
+                raise CliCommandArgumentException(
+                    f"Unsafe path in import archive: {member.filename}"
+                )
+        return members
+
+    def _extract_archive(self, archive_path: Path, container_path: Path) -> Path:
+        """Unpack a zip archive into the container's import staging area.
+
+        The staging directory is keyed by the archive hash, so re-importing
+        the same archive reuses the already extracted members. Members are
+        extracted into a per-process partial directory that is renamed into
+        place; when a concurrent import renamed its copy first, that one is
+        used.
+        """
+        with archive_path.open("rb") as stream:
+            archive_hash: str = hashlib.file_digest(stream, "sha256").hexdigest()
+        staging_dir: Path = (
+            Path(container_path).expanduser().resolve()
+            / ".__ontobdc__" / "etl" / "import" / "archive" / archive_hash
+        )
+        if staging_dir.is_dir():
+            return staging_dir
+
+        partial_dir: Path = staging_dir.with_name(f".{archive_hash}.{os.getpid()}.partial")
+        if partial_dir.exists():
+            # Left behind by a crashed run; its members may be incomplete.
+            shutil.rmtree(partial_dir)
+        with zipfile.ZipFile(archive_path) as archive:
+            self._archive_members(archive)
+            archive.extractall(partial_dir)
+        try:
+            partial_dir.replace(staging_dir)
+        except OSError:
+            if not staging_dir.is_dir():
+                raise
+            shutil.rmtree(partial_dir, ignore_errors=True)
+        return staging_dir
@@ -1,11 +1,12 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
-from ontobdc.shared.adapter.util import is_valid_uri, to_lemma
-from rdflib import Graph, Literal, URIRef
+from ontobdc.shared.adapter.util import is_valid_uri, lemma_tokens
+from rdflib import Literal, URIRef
 from rdflib.namespace import RDF
 
 from ontobdc.cli.domain.port.context import CliContextPort, CliContextStrategyPort
+from ontobdc.context.adapter.alias_index import EntityAliasIndex
 from ontobdc.context.adapter.vector import EntityVectorRepositoryAdapter
 from ontobdc.shared.adapter.config import ConfigDataAdapter
 from ontobdc.shared.adapter.ontology import OntologyConfigAdapter
@@ -32,11 +33,7 @@ class EntityUriStrategy(ParameterPort, CliContextStrategyPort):
             context.set_parameter_value("entity_uri", URIRef(raw_entity_value))
             return context
 
-        raw_entity_value: str = to_lemma(
-            raw_entity_value,
-            language=str(context.language or "en"),
-        )
-        if not raw_entity_value:
+        if not lemma_tokens(raw_entity_value):
             return context
 
         resolved_entity_value: Optional[str] = self._resolve_entity_from_aliases(context, raw_entity_value)
@@ -66,6 +63,14 @@ class EntityUriStrategy(ParameterPort, CliContextStrategyPort):
         context: CliContextPort,
         raw_entity_value: str,
     ) -> Optional[str]:
+        alias_index: Optional[EntityAliasIndex] = self._alias_index(context)
+        if alias_index is not None:
+            matched_entities: List[str] = alias_index.find(raw_entity_value, self._context_files(context))
+            if len(matched_entities) == 1:
+                return matched_entities[0]
+            if matched_entities:
+                raise ValueError(f"Multiple entity candidates found for alias: {raw_entity_value}")
+
         entity_candidates: List[Dict[str, Any]] = self._collect_entity_candidates(context)
         if not entity_candidates:
             return None
@@ -111,31 +116,34 @@ class EntityUriStrategy(ParameterPort, CliContextStrategyPort):
 
         return None
 
-    def _collect_context_candidates(self, context: CliContextPort) -> List[Dict[str, Any]]:
+    def _alias_index(self, context: CliContextPort) -> Optional[EntityAliasIndex]:
         config_adapter: ConfigDataAdapter = ConfigDataAdapter()
         ontology_adapter: OntologyConfigAdapter = OntologyConfigAdapter(config_adapter)
         obdc_namespace: Optional[Any] = ontology_adapter.get_ontology_namespace_by_prefix("obdc")
         if obdc_namespace is None:
-            return []
-
-        entity_alias: URIRef = obdc_namespace["entityAlias"]
+            return None
 
-        context_graph: Graph = Graph()
-        context_file_path: Path = Path(context.root_path)  / ".__ontobdc__" / "context.ttl"
-        context_graph.parse(context_file_path, format="turtle")
+        return EntityAliasIndex.for_root(
+            Path(context.root_path),
+            alias_predicate=obdc_namespace["entityAlias"],
+            language=str(context.language or "en"),
+        )
 
-        candidates: List[Dict[str, Any]] = []
+    def _context_files(self, context: CliContextPort) -> List[Path]:
+        return [Path(context.root_path) / ".__ontobdc__" / "context.ttl"]
 
-        for subject in set(context_graph.subjects(entity_alias, None)):
-            if is_valid_uri(str(subject)):
-                candidates.append(
-                    {
-                        "entity_uri": str(subject),
-                        "entity_ref": subject,
-                    }
-                )
+    def _collect_context_candidates(self, context: CliContextPort) -> List[Dict[str, Any]]:
+        alias_index: Optional[EntityAliasIndex] = self._alias_index(context)
+        if alias_index is None:
+            return []
 
-        return candidates
+        return [
+            {
+                "entity_uri": entity_uri,
+                "entity_ref": URIRef(entity_uri),
+            }
+            for entity_uri in alias_index.entities(self._context_files(context))
+        ]
 
         # ontology_graph: Graph = ontology_adapter.get_ontology_content("obdc")
         # subject: URIRef
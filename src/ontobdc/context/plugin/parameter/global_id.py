@@ -1,3 +1,4 @@
+from itertools import islice
 from typing import Any
 
 from ontobdc.context.adapter.instance import ContainerEntityInstanceRepository
@@ -10,16 +11,13 @@ def resolve_entity_by_global_id(
     *, container_path: str, entity: str, global_id: str
 ) -> dict[str, Any]:
     """Resolve exactly one entity instance without identity fallbacks."""
-    payload = ContainerEntityInstanceRepository(
+    instances = ContainerEntityInstanceRepository(
         container_path=container_path, entity=entity
-    ).list_instances()
-    matches: list[dict[str, Any]] = []
-    for instance in payload.get("instances", []):
-        if not isinstance(instance, dict):
-            continue
-        value = instance.get("GlobalId", instance.get("global_id"))
-        if str(value or "").strip() == global_id:
-            matches.append(dict(instance))
+    ).iter_instances(equals={"GlobalId": global_id})
+    # Two matches already make the GlobalId ambiguous; stop reading there.
+    matches: list[dict[str, Any]] = [
+        dict(instance) for instance in islice(instances, 2)
+    ]
     if not matches:
         raise ValueError(
             f"Could not resolve entity '{entity}' with GlobalId '{global_id}'."
@@ -2,7 +2,7 @@ import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
 
 
 @dataclass(frozen=True)
@@ -40,6 +40,28 @@ class EntityWorkbookAdapter:
         worksheet_name: str,
         fields: Sequence[EntityWorkbookField],
     ) -> List[Dict[str, Any]]:
+        return list(
+            self.iter_records(
+                workbook_path=workbook_path,
+                worksheet_name=worksheet_name,
+                fields=fields,
+            )
+        )
+
+    def iter_records(
+        self,
+        *,
+        workbook_path: Path,
+        worksheet_name: str,
+        fields: Sequence[EntityWorkbookField],
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the workbook records one row at a time.
+
+        The workbook is opened in openpyxl's read-only streaming mode, so
+        only the requested worksheet is parsed, row by row, and a caller
+        that stops iterating early never reads the remaining rows. The
+        workbook is closed when the generator is exhausted or closed.
+        """
         try:
             from openpyxl import load_workbook
         except ModuleNotFoundError as exc:
@@ -49,38 +71,42 @@ class EntityWorkbookAdapter:
 
         resolved_workbook_path: Path = workbook_path.expanduser().resolve()
         if not resolved_workbook_path.is_file():
-            return []
+            return
 
-        workbook = load_workbook(resolved_workbook_path, data_only=False)
-        if worksheet_name not in workbook.sheetnames:
-            raise ValueError(
-                f"Worksheet not found in entity workbook: {worksheet_name}"
-            )
-
-        worksheet = workbook[worksheet_name]
-        expected_headers: List[str] = [field.name for field in fields]
-        actual_headers: List[str] = [
-            str(cell.value or "").strip()
-            for cell in worksheet[1]
-        ]
-        if actual_headers != expected_headers:
-            raise ValueError(
-                "Entity workbook headers do not match the declared fields. "
-                f"Expected {expected_headers}; found {actual_headers}."
-            )
+        workbook = load_workbook(
+            resolved_workbook_path,
+            read_only=True,
+            data_only=False,
+        )
+        try:
+            if worksheet_name not in workbook.sheetnames:
+                raise ValueError(
+                    f"Worksheet not found in entity workbook: {worksheet_name}"
+                )
 
-        records: List[Dict[str, Any]] = []
-        for row in worksheet.iter_rows(
-            min_row=2,
-            max_col=len(expected_headers),
-            values_only=True,
-        ):
-            if not any(value is not None and str(value).strip() for value in row):
-                continue
-            records.append(dict(zip(expected_headers, row)))
+            worksheet = workbook[worksheet_name]
+            expected_headers: List[str] = [field.name for field in fields]
+            rows: Iterator[Sequence[Any]] = worksheet.iter_rows(values_only=True)
+            header_row: Sequence[Any] = next(rows, ())
+            actual_headers: List[str] = [
+                str(value or "").strip()
+                for value in header_row
+            ]
+            if actual_headers != expected_headers:
+                raise ValueError(
+                    "Entity workbook headers do not match the declared fields. "
+                    f"Expected {expected_headers}; found {actual_headers}."
+                )
 
-        workbook.close()
-        return records
+            header_count: int = len(expected_headers)
+            for row in rows:
+                values: List[Any] = list(row[:header_count])
+                if not any(value is not None and str(value).strip() for value in values):
+                    continue
+                values.extend([None] * (header_count - len(values)))
+                yield dict(zip(expected_headers, values))
+        finally:
+            workbook.close()
 
     def generate(
         self,
@@ -101,8 +127,6 @@ class EntityWorkbookAdapter:
     ) -> EntityWorkbookArtifact:
         try:
             from frictionless import Resource, Schema, formats
-            from openpyxl import Workbook
-            from openpyxl.styles import Font
         except ModuleNotFoundError as exc:
             raise ValueError(
                 "The 'openpyxl' and 'frictionless' packages are required "
@@ -124,27 +148,12 @@ class EntityWorkbookAdapter:
             workbook_name=workbook_name,
         )
 
-        workbook = Workbook()
-        worksheet = workbook.active
-        worksheet.title = worksheet_name
-
-        field_names: List[str] = [field.name for field in fields]
-        worksheet.append(field_names)
-        for header_cell in worksheet[1]:
-            header_cell.font = Font(bold=True)
-
-        for record in records:
-            worksheet.append(
-                [
-                    self._to_cell_value(record.get(field_name))
-                    for field_name in field_names
-                ]
-            )
-
-        worksheet.freeze_panes = "A2"
-        self._fit_columns(worksheet)
-        workbook.save(workbook_path)
-        workbook.close()
+        generated_row_count: int = self.write_records(
+            workbook_path=workbook_path,
+            worksheet_name=worksheet_name,
+            fields=fields,
+            records=records,
+        )
 
         workbook_relative_path: str = Path(
             os.path.relpath(
@@ -204,10 +213,89 @@ class EntityWorkbookAdapter:
             workbook_path=workbook_path,
             datapackage_path=resolved_datapackage_path,
             worksheet_name=worksheet_name,
-            generated_row_count=len(records),
+            generated_row_count=generated_row_count,
             validation=validation_payload,
         )
 
+    def write_records(
+        self,
+        *,
+        workbook_path: Path,
+        worksheet_name: str,
+        fields: Sequence[EntityWorkbookField],
+        records: Iterable[Mapping[str, Any]],
+    ) -> int:
+        """Write ``records`` as the ``worksheet_name`` sheet with one save.
+
+        A new workbook, or one holding no other worksheet, is built in
+        openpyxl's write-only mode, so each row is serialized as it is
+        appended instead of being kept as cell objects until the save, and
+        the cost grows linearly with the row count. Column widths have to be
+        known before the first row is written: they are fitted to every
+        value when ``records`` is a sequence, and to the headers alone when
+        it is a one-shot iterable (for example a generator), which is then
+        never held in memory. An existing workbook with other worksheets is
+        loaded instead, so those sheets keep their content and formatting,
+        and only the target sheet is replaced. Either way the workbook is
+        saved to a temporary file that then replaces ``workbook_path``.
+        """
+        try:
+            from openpyxl import Workbook, load_workbook
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Font
+            from openpyxl.utils import get_column_letter
+        except ModuleNotFoundError as exc:
+            raise ValueError(
+                "The 'openpyxl' package is required to write an entity workbook."
+            ) from exc
+
+        field_names: List[str] = [field.name for field in fields]
+        if self._has_other_worksheets(workbook_path, worksheet_name):
+            workbook = load_workbook(workbook_path)
+            sheet_index: Optional[int] = None
+            if worksheet_name in workbook.sheetnames:
+                sheet_index = workbook.sheetnames.index(worksheet_name)
+                workbook.remove(workbook[worksheet_name])
+            worksheet = workbook.create_sheet(worksheet_name, sheet_index)
+        else:
+            workbook = Workbook(write_only=True)
+            worksheet = workbook.create_sheet(worksheet_name)
+
+        # Write-only sheets emit their layout with the first row.
+        worksheet.freeze_panes = "A2"
+        for column_index, width in enumerate(
+            self._column_widths(field_names, records),
+            start=1,
+        ):
+            worksheet.column_dimensions[get_column_letter(column_index)].width = width
+
+        header_cells: List[Any] = []
+        for field_name in field_names:
+            header_cell = WriteOnlyCell(worksheet, value=field_name)
+            header_cell.font = Font(bold=True)
+            header_cells.append(header_cell)
+        worksheet.append(header_cells)
+
+        row_count: int = 0
+        for record in records:
+            worksheet.append(
+                [
+                    self._to_cell_value(record.get(field_name))
+                    for field_name in field_names
+                ]
+            )
+            row_count += 1
+
+        temporary_path: Path = workbook_path.with_name(f".{workbook_path.name}.tmp")
+        try:
+            workbook.save(temporary_path)
+            temporary_path.replace(workbook_path)
+        finally:
+            workbook.close()
+            if temporary_path.exists():
+                temporary_path.unlink()
+        return row_count
+
     def resolve_writable_path(
         self,
         *,
@@ -240,6 +328,21 @@ class EntityWorkbookAdapter:
             f"Could not resolve a writable workbook path under: {output_dir}"
         )
 
+    def _has_other_worksheets(self, workbook_path: Path, worksheet_name: str) -> bool:
+        if not workbook_path.is_file():
+            return False
+        try:
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(workbook_path, read_only=True)
+        except Exception:
+            # An unreadable file is replaced, as a missing one would be.
+            return False
+        try:
+            return any(name != worksheet_name for name in workbook.sheetnames)
+        finally:
+            workbook.close()
+
     def _apply_entity_metadata(
         self,
         *,
@@ -343,13 +446,18 @@ class EntityWorkbookAdapter:
             return json.dumps(value, ensure_ascii=False, sort_keys=True)
         return value
 
-    def _fit_columns(self, worksheet: Any) -> None:
-        for column_cells in worksheet.columns:
-            width: int = max(
-                len(str(cell.value or ""))
-                for cell in column_cells
-            )
-            worksheet.column_dimensions[column_cells[0].column_letter].width = min(
-                max(width + 2, 12),
-                60,
-            )
+    def _column_widths(
+        self,
+        field_names: List[str],
+        records: Iterable[Mapping[str, Any]],
+    ) -> List[int]:
+        widths: List[int] = [len(field_name) for field_name in field_names]
+        if isinstance(records, Sequence):
+            for record in records:
+                for column_index, field_name in enumerate(field_names):
+                    widths[column_index] = max(
+                        widths[column_index],
+                        len(str(self._to_cell_value(record.get(field_name)) or "")),
+                    )
+        return [min(max(width + 2, 12), 60) for width in widths]
+
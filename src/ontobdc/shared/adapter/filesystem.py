@@ -97,3 +97,12 @@ def remove_file(
         "This is commonly a cloud-sync client (OneDrive, Dropbox, etc.) "
         "briefly holding a file handle open -- wait a moment and retry."
     ) from last_error
+
+
+def user_cache_directory() -> Path:
+    """Return OntoBDC's per-user cache directory (``$XDG_CACHE_HOME/ontobdc``, else ``~/.cache/ontobdc``).
+
+    Holds caches that belong to the installation rather than to a project,
+    so they are available before, and without, a project root.
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache").expanduser() / "ontobdc"
@@ -6,10 +6,11 @@ import inspect
 import importlib
 import importlib.util
 from abc import abstractmethod
-from typing import List, Optional, Tuple, Type, Any
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Type
 from rdflib import Graph, URIRef
 from rdflib.namespace import RDF
 from ontobdc.shared.adapter.capability import Capability
+from ontobdc.shared.adapter.plugin_registry import PluginRegistryManifest
 from ontobdc.shared.domain.port.config import ConfigDataPort
 from ontobdc.shared.facade.port.command import CliCommandPort
 from ontobdc.shared.facade.port.logger import LogRepositoryPort
@@ -26,7 +27,13 @@ from ontobdc.shared.adapter.config import ConfigDataAdapter, UnsetProjectRootCon
 class PluginLoader(PluginLoaderPort):
     """
     Base plugin loader responsible for discovering and instantiating dynamic plugins across the application.
+
+    Discovery results are kept in a `PluginRegistryManifest`, so a run with
+    an up-to-date manifest imports only the plugin modules it selects
+    instead of walking and importing every plugin package.
     """
+    _root_package: str = "ontobdc"
+
     def _make_config_data_adapter(self) -> ConfigDataPort:
         try:
             return ConfigDataAdapter()
@@ -114,6 +121,202 @@ class PluginLoader(PluginLoaderPort):
             return None
         return next(iter(spec.submodule_search_locations), None)
 
+    def _plugin_packages(self, resource: str) -> List[str]:
+        return self._list_plugin_folder(resource, self._root_package)
+
+    def _plugin_directories(self, resource: str) -> List[str]:
+        """
+        Directories holding the `resource` plugin modules, resolved without importing them.
+        """
+        if self._root_package == "ontobdc":
+            try:
+                root_directory: Optional[str] = str(self._make_config_data_adapter().script_dir)
+            except Exception:
+                root_directory = None
+        else:
+            root_directory = self._find_installed_package_root(self._root_package)
+        if root_directory is None:
+            return []
+
+        return [
+            os.path.join(root_directory, *pkg_name.split(".")[1:], resource)
+            for pkg_name in self._plugin_packages(resource)
+        ]
+
+    def _registry_key(self, resource: str) -> str:
+        return f"{self._root_package}:{resource}"
+
+    def _registry_distributions(self) -> List[str]:
+        return ["ontobdc", "ontobdc-view", self._root_package.replace("_", "-")]
+
+    def _registered(self, resource: str, select: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Any]:
+        """
+        Loads the `resource` plugins listed in the plugin registry manifest.
+
+        Only the modules holding entries accepted by `select` are imported,
+        plus any module that failed to import when the manifest was built,
+        so its error is reported again. A missing or stale manifest falls
+        back to the full package walk, which rewrites it.
+        """
+        registry: PluginRegistryManifest = PluginRegistryManifest.for_environment()
+        key: str = self._registry_key(resource)
+        signature: str = registry.signature(
+            self._plugin_directories(resource),
+            self._registry_distributions(),
+        )
+        modules: Optional[List[Dict[str, Any]]] = registry.modules(key, signature)
+        if modules is not None:
+            try:
+                return self._load_registered_modules(modules, select)
+            except Exception:
+                # A listed plugin no longer resolves as recorded: rescan.
+                pass
+
+        modules, plugins, complete = self._scan_registered_modules(resource)
+        if complete:
+            registry.store(key, signature, modules)
+        return [plugin for entry, plugin in plugins if select is None or select(entry)]
+
+    def _load_registered_modules(
+        self,
+        modules: List[Dict[str, Any]],
+        select: Optional[Callable[[Dict[str, Any]], bool]],
+    ) -> List[Any]:
+        plugins: List[Any] = []
+        for record in modules:
+            if record.get("failed"):
+                plugins.extend(
+                    plugin
+                    for entry, plugin in self._collect_module_reporting_errors(record)
+                    if select is None or select(entry)
+                )
+                continue
+
+            entries: List[Dict[str, Any]] = [
+                entry for entry in record["plugins"] if select is None or select(entry)
+            ]
+            if not entries:
+                continue
+
+            module = importlib.import_module(record["module"])
+            plugins.extend(self._registered_plugin(module, entry) for entry in entries)
+
+        return plugins
+
+    def _scan_registered_modules(
+        self,
+        resource: str,
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], Any]], bool]:
+        """
+        Walks and imports every `resource` plugin module, as discovery always
+        did, and returns the manifest module records, the discovered
+        `(entry, plugin)` pairs and whether the walk was complete.
+        """
+        modules: List[Dict[str, Any]] = []
+        plugins: List[Tuple[Dict[str, Any], Any]] = []
+        module_names, complete = self._module_names(resource)
+        for package_prefix, name in module_names:
+            record: Dict[str, Any] = {
+                "module": name,
+                "package": package_prefix,
+                "kind": resource,
+                "plugins": [],
+            }
+            try:
+                collected: List[Tuple[Dict[str, Any], Any]] = self._collect_module(resource, name)
+            except Exception as exception:
+                self._report_module_error(record, exception)
+                record["failed"] = True
+                modules.append(record)
+                continue
+
+            record["plugins"] = [entry for entry, _ in collected]
+            plugins.extend(collected)
+            modules.append(record)
+
+        return modules, plugins, complete
+
+    def _collect_module_reporting_errors(self, record: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Any]]:
+        try:
+            return self._collect_module(record["kind"], record["module"])
+        except Exception as exception:
+            self._report_module_error(record, exception)
+            return []
+
+    def _module_names(self, resource: str) -> Tuple[List[Tuple[str, str]], bool]:
+        """
+        Returns `(package_prefix, module_name)` for every module under the
+        plugin packages of `resource`, and whether every package imported.
+        """
+        module_names: List[Tuple[str, str]] = []
+        complete: bool = True
+        for pkg_name in self._plugin_packages(resource):
+            try:
+                package = importlib.import_module(pkg_name)
+            except ImportError as import_error:
+                self._report_package_error(pkg_name, None, import_error)
+                complete = False
+                continue
+
+            if not hasattr(package, "__path__"):
+                continue
+
+            resource_pkg_name = f"{pkg_name}.{resource}"
+            try:
+                resource_package = importlib.import_module(resource_pkg_name)
+            except ImportError as import_error:
+                self._report_package_error(pkg_name, resource_pkg_name, import_error)
+                complete = False
+                continue
+
+            if not hasattr(resource_package, "__path__"):
+                continue
+
+            module_names.extend(self._resource_module_names(resource_package, resource_pkg_name))
+
+        return module_names, complete
+
+    def _resource_module_names(self, resource_package: Any, resource_pkg_name: str) -> List[Tuple[str, str]]:
+        package_prefix = getattr(resource_package, "__name__", resource_pkg_name) + "."
+        return [
+            (package_prefix, name)
+            for _, name, is_pkg in self._walk_packages_recursive(
+                resource_package.__path__,
+                package_prefix,
+                current_depth=1,
+                max_depth=10,
+            )
+            if self._accepts_module(is_pkg)
+        ]
+
+    def _accepts_module(self, is_pkg: bool) -> bool:
+        return True
+
+    def _registry_entry(self, resource: str, attribute: str, obj: Any, **metadata: Any) -> Dict[str, Any]:
+        return {
+            "attribute": attribute,
+            "class": f"{obj.__module__}.{obj.__qualname__}",
+            "kind": resource,
+            "id": getattr(getattr(obj, "METADATA", None), "id", None),
+            **metadata,
+        }
+
+    def _registered_plugin(self, module: Any, entry: Dict[str, Any]) -> Any:
+        return getattr(module, entry["attribute"])
+
+    @abstractmethod
+    def _collect_module(self, resource: str, name: str) -> List[Tuple[Dict[str, Any], Any]]:
+        """
+        Imports module `name` and returns its `(entry, plugin)` pairs.
+        """
+        ...
+
+    def _report_package_error(self, pkg_name: str, resource_pkg_name: Optional[str], error: Exception) -> None:
+        pass
+
+    def _report_module_error(self, record: Dict[str, Any], error: Exception) -> None:
+        pass
+
     @abstractmethod
     def get_all(self, resource: str) -> List[Type[PluginLoaderPort]]:
         """
@@ -125,7 +328,7 @@ class PluginLoader(PluginLoaderPort):
         """
         Retrieves a specific plugin of the specified resource type by its ID.
         """
-        for rsrc in self.get_all(resource):
+        for rsrc in self._registered(resource, lambda entry: entry.get("id") == id):
             metadata: Any = getattr(rsrc, "METADATA", None)
             metadata_id: Any = getattr(metadata, "id", None)
             if isinstance(metadata_id, str) and metadata_id == id:
@@ -148,59 +351,36 @@ class CapabilityLoader(PluginLoader):
         """
         Retrieves all available capability plugins discovered in the application's plugin folders.
         """
-        capabilities: List[Type[CapabilityPort]] = []
-        for pkg_name in self._list_plugin_folder(resource):
-            try:
-                package = importlib.import_module(pkg_name)
-            except ImportError:
-                continue
+        return self._registered(resource)
 
-            if not hasattr(package, "__path__"):
+    def _collect_module(self, resource: str, name: str) -> List[Tuple[Dict[str, Any], Any]]:
+        capabilities: List[Tuple[Dict[str, Any], Any]] = []
+        module = importlib.import_module(name)
+        for attribute, obj in inspect.getmembers(module):
+            if not inspect.isclass(obj):
                 continue
-
-            resource_pkg_name = f"{pkg_name}.{resource}"
             try:
-                resource_package = importlib.import_module(resource_pkg_name)
-            except ImportError:
+                if not issubclass(obj, Capability):
+                    continue
+            except TypeError:
                 continue
 
-            if not hasattr(resource_package, "__path__"):
+            metadata_obj: Any = getattr(obj, "METADATA", None)
+            if not isinstance(metadata_obj, CapabilityMetadata):
+                continue
+            if not metadata_obj.id:
                 continue
 
-            package_prefix = getattr(resource_package, "__name__", resource_pkg_name) + "."
-            for _, name, _ in self._walk_packages_recursive(
-                resource_package.__path__,
-                package_prefix,
-                current_depth=1,
-                max_depth=10,
-            ):
-                try:
-                    module = importlib.import_module(name)
-                    for _, obj in inspect.getmembers(module):
-                        if not inspect.isclass(obj):
-                            continue
-                        try:
-                            if not issubclass(obj, Capability):
-                                continue
-                        except TypeError:
-                            continue
-
-                        metadata_obj: Any = getattr(obj, "METADATA", None)
-                        if not isinstance(metadata_obj, CapabilityMetadata):
-                            continue
-                        if not metadata_obj.id:
-                            continue
-
-                        capabilities.append(obj)
-                except Exception as e:
-                    print(
-                        f"[CapabilityLoader] Error loading module {name}: {e}",
-                        file=sys.stderr,
-                    )
-                    continue
+            capabilities.append((self._registry_entry(resource, attribute, obj), obj))
 
         return capabilities
 
+    def _report_module_error(self, record: Dict[str, Any], error: Exception) -> None:
+        print(
+            f"[CapabilityLoader] Error loading module {record['module']}: {error}",
+            file=sys.stderr,
+        )
+
 
 class ComponentLoader(PluginLoader):
     """
@@ -210,7 +390,7 @@ class ComponentLoader(PluginLoader):
     Component descriptors are discovered both from this package's own
     view/plugin/component/ (via _list_plugin_folder, like every other
     plugin resource — <domain>/plugin/<resource>/) and directly from
-    ontobdc_view's component/plugin/ (see _load_ontobdc_view_components).
+    ontobdc_view's component/plugin/ (see _ontobdc_view_component_directory).
     ontobdc_view inverts the last two segments deliberately — component/
     is the primary organizing concept there (plugin/ sits beside
     component/asset/, its JS counterpart) — which doesn't fit
@@ -219,6 +399,8 @@ class ComponentLoader(PluginLoader):
     so it's resolved as a one-off rather than forced through it.
     """
 
+    _match_index: Optional["ComponentMatchIndex"] = None
+
     def get(self, id: str) -> Type[ComponentPort]:
         """
         Retrieves a component plugin by its unique ID.
@@ -229,81 +411,79 @@ class ComponentLoader(PluginLoader):
         """
         Retrieves all available component plugins discovered in the application's plugin folders.
         """
-        components: List[Type[ComponentPort]] = []
-        for pkg_name in self._list_plugin_folder(resource):
-            try:
-                package = importlib.import_module(pkg_name)
-            except ImportError:
-                continue
+        return self._registered(resource)
 
-            if not hasattr(package, "__path__"):
-                continue
+    def _plugin_directories(self, resource: str) -> List[str]:
+        directories: List[str] = super()._plugin_directories(resource)
+        view_directory: Optional[str] = self._ontobdc_view_component_directory(resource)
+        if view_directory is not None:
+            directories.append(view_directory)
+        return directories
 
-            resource_pkg_name = f"{pkg_name}.{resource}"
-            try:
-                resource_package = importlib.import_module(resource_pkg_name)
-            except ImportError:
-                continue
+    def _module_names(self, resource: str) -> Tuple[List[Tuple[str, str]], bool]:
+        module_names, complete = super()._module_names(resource)
+        if self._ontobdc_view_component_directory(resource) is None:
+            return module_names, complete
 
-            if not hasattr(resource_package, "__path__"):
-                continue
+        try:
+            resource_package = importlib.import_module("ontobdc_view.component.plugin")
+        except ImportError:
+            return module_names, complete
 
-            components.extend(self._collect_components(resource_package))
+        if not hasattr(resource_package, "__path__"):
+            return module_names, complete
 
-        if resource == "component":
-            components.extend(self._load_ontobdc_view_components())
+        module_names.extend(
+            self._resource_module_names(resource_package, "ontobdc_view.component.plugin")
+        )
+        return module_names, complete
 
-        return components
+    def _ontobdc_view_component_directory(self, resource: str) -> Optional[str]:
+        if resource != "component":
+            return None
 
-    def _load_ontobdc_view_components(self) -> List[Type[ComponentPort]]:
         view_root = self._find_installed_package_root("ontobdc_view")
         if view_root is None:
-            return []
+            return None
 
-        if not os.path.isdir(os.path.join(view_root, "component", "plugin")):
-            return []
+        view_directory: str = os.path.join(view_root, "component", "plugin")
+        if not os.path.isdir(view_directory):
+            return None
 
-        try:
-            resource_package = importlib.import_module("ontobdc_view.component.plugin")
-        except ImportError:
-            return []
+        return view_directory
 
-        if not hasattr(resource_package, "__path__"):
-            return []
-
-        return self._collect_components(resource_package)
-
-    def _collect_components(self, resource_package: Any) -> List[Type[ComponentPort]]:
-        components: List[Type[ComponentPort]] = []
-        package_prefix = getattr(resource_package, "__name__", "") + "."
-        for _, name, _ in self._walk_packages_recursive(
-            resource_package.__path__,
-            package_prefix,
-            current_depth=1,
-            max_depth=10,
-        ):
+    def _collect_module(self, resource: str, name: str) -> List[Tuple[Dict[str, Any], Any]]:
+        components: List[Tuple[Dict[str, Any], Any]] = []
+        module = importlib.import_module(name)
+        for attribute, obj in inspect.getmembers(module):
+            if not inspect.isclass(obj):
+                continue
             try:
-                module = importlib.import_module(name)
-                for _, obj in inspect.getmembers(module):
-                    if not inspect.isclass(obj):
-                        continue
-                    try:
-                        if not issubclass(obj, ComponentPort) or obj is ComponentPort:
-                            continue
-                    except TypeError:
-                        continue
-
-                    metadata_obj: Any = getattr(obj, "METADATA", None)
-                    if not isinstance(metadata_obj, ComponentMetadata):
-                        continue
-
-                    components.append(obj)
-            except Exception as e:
-                print(f"[ComponentLoader] Error loading module {name}: {e}", file=sys.stderr)
+                if not issubclass(obj, ComponentPort) or obj is ComponentPort:
+                    continue
+            except TypeError:
                 continue
 
+            metadata_obj: Any = getattr(obj, "METADATA", None)
+            if not isinstance(metadata_obj, ComponentMetadata):
+                continue
+
+            components.append((
+                self._registry_entry(
+                    resource,
+                    attribute,
+                    obj,
+                    tile_class=metadata_obj.tile_class,
+                    required_uris=list(metadata_obj.required_uris or []),
+                ),
+                obj,
+            ))
+
         return components
 
+    def _report_module_error(self, record: Dict[str, Any], error: Exception) -> None:
+        print(f"[ComponentLoader] Error loading module {record['module']}: {error}", file=sys.stderr)
+
     def match(
         self,
         graph: Graph,
@@ -316,19 +496,7 @@ class ComponentLoader(PluginLoader):
         and never match here, since matching them against an arbitrary
         entity would be vacuous.
         """
-        matched: List[Type[ComponentPort]] = []
-        for component_type in self.get_all():
-            required_uris: List[str] = component_type.METADATA.required_uris
-            if not required_uris:
-                continue
-
-            if all(
-                self._entity_satisfies_uri(graph, entity, uri)
-                for uri in required_uris
-            ):
-                matched.append(component_type)
-
-        return matched
+        return self._component_match_index().match(graph, entity)
 
     def match_tile_class(self, tile_class: str) -> List[Type[ComponentPort]]:
         """
@@ -337,18 +505,63 @@ class ComponentLoader(PluginLoader):
         Used for Chrome Tile requests, which have no entity to infer a match
         from and must name the wanted class directly.
         """
+        return self._component_match_index().match_tile_class(tile_class)
+
+    def _component_match_index(self) -> "ComponentMatchIndex":
+        # Built once per process, like the import cache the components live in.
+        if ComponentLoader._match_index is None:
+            ComponentLoader._match_index = ComponentMatchIndex(self.get_all())
+        return ComponentLoader._match_index
+
+
+class ComponentMatchIndex:
+    """
+    Lookup tables over a fixed list of components for `ComponentLoader.match`
+    and `match_tile_class`.
+
+    A Content Tile component matches an entity when each of its
+    `required_uris` is one of the entity's `rdf:type`s or one of its
+    predicates. The index maps each required URI to the components that
+    require it, so matching collects the entity's types and predicates in
+    one pass over its triples and tests only the components sharing at least
+    one of them, instead of probing the graph per component and URI.
+    Results keep discovery order.
+    """
+
+    def __init__(self, components: List[Type[ComponentPort]]) -> None:
+        self._components: List[Type[ComponentPort]] = list(components)
+        self._required: List[FrozenSet[URIRef]] = []
+        self._by_required_uri: Dict[URIRef, List[int]] = {}
+        self._by_tile_class: Dict[str, List[Type[ComponentPort]]] = {}
+        for position, component_type in enumerate(self._components):
+            required_uris: FrozenSet[URIRef] = frozenset(
+                URIRef(uri) for uri in component_type.METADATA.required_uris or []
+            )
+            self._required.append(required_uris)
+            for uri in required_uris:
+                self._by_required_uri.setdefault(uri, []).append(position)
+            self._by_tile_class.setdefault(component_type.METADATA.tile_class, []).append(component_type)
+
+    def match(self, graph: Graph, entity: URIRef) -> List[Type[ComponentPort]]:
+        satisfied: Set[URIRef] = set()
+        for predicate, value in graph.predicate_objects(entity):
+            satisfied.add(predicate)
+            if predicate == RDF.type and isinstance(value, URIRef):
+                satisfied.add(value)
+
+        candidates: Set[int] = {
+            position
+            for uri in satisfied
+            for position in self._by_required_uri.get(uri, ())
+        }
         return [
-            component_type
-            for component_type in self.get_all()
-            if component_type.METADATA.tile_class == tile_class
+            self._components[position]
+            for position in sorted(candidates)
+            if self._required[position] <= satisfied
         ]
 
-    @staticmethod
-    def _entity_satisfies_uri(graph: Graph, entity: URIRef, uri: str) -> bool:
-        term = URIRef(uri)
-        if (entity, RDF.type, term) in graph:
-            return True
-        return any(predicate == term for predicate in graph.predicates(entity))
+    def match_tile_class(self, tile_class: str) -> List[Type[ComponentPort]]:
+        return list(self._by_tile_class.get(tile_class, ()))
 
 
 class ParameterLoader(PluginLoader):
@@ -385,55 +598,62 @@ class ParameterLoader(PluginLoader):
         exception message so the operator can fix the plugin instead of
         wondering why a declared strategy never runs.
         """
-        strategies: List[Type[CliContextStrategyPort]] = []
-        for pkg_name in self._list_plugin_folder(resource):
-            try:
-                package = importlib.import_module(pkg_name)
-            except ImportError as import_error:
-                if self._logger is not None:
-                    self._logger.log_warning(
-                        "ParameterLoader: skipping plugin domain package "
-                        f"'{pkg_name}' (ImportError: {import_error})"
-                    )
-                continue
+        return self._registered(resource)
 
-            if not hasattr(package, "__path__"):
-                continue
-
-            resource_pkg_name = f"{pkg_name}.{resource}"
-            try:
-                resource_package = importlib.import_module(resource_pkg_name)
-            except ImportError as import_error:
-                if self._logger is not None:
-                    self._logger.log_warning(
-                        "ParameterLoader: skipping resource package "
-                        f"'{resource_pkg_name}' inside '{pkg_name}' "
-                        f"(ImportError: {import_error})"
-                    )
-                continue
-
-            if not hasattr(resource_package, "__path__"):
-                continue
-
-            package_prefix = getattr(resource_package, "__name__", resource_pkg_name) + "."
-            for _, name, _ in self._walk_packages_recursive(resource_package.__path__, package_prefix, current_depth=1, max_depth=10):
-                try:
-                    module = importlib.import_module(name)
-                    for _, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj)
-                                and issubclass(obj, CliContextStrategyPort)
-                                and obj is not CliContextStrategyPort):
-                            strategies.append(obj())
-                except Exception as exception:
-                    if self._logger is not None:
-                        self._logger.log_warning(
-                            "ParameterLoader: discarding strategy module "
-                            f"'{name}' — {type(exception).__name__}: {exception}"
-                        )
-                    continue
+    def get_named(self, names: Iterable[str], resource: str = "parameter") -> List[CliContextStrategyPort]:
+        """
+        Retrieves the parameter strategy plugins whose ``METADATA.name`` is in
+        `names`, importing only their modules when the plugin registry
+        manifest is current.
+        """
+        wanted: Set[str] = {str(name).strip() for name in names}
+        return self._registered(resource, lambda entry: entry.get("name") in wanted)
+
+    def _collect_module(self, resource: str, name: str) -> List[Tuple[Dict[str, Any], Any]]:
+        strategies: List[Tuple[Dict[str, Any], Any]] = []
+        module = importlib.import_module(name)
+        for attribute, obj in inspect.getmembers(module):
+            if (inspect.isclass(obj)
+                    and issubclass(obj, CliContextStrategyPort)
+                    and obj is not CliContextStrategyPort):
+                parameter_name: Any = getattr(getattr(obj, "METADATA", None), "name", None)
+                strategies.append((
+                    self._registry_entry(
+                        resource,
+                        attribute,
+                        obj,
+                        name=parameter_name.strip() if isinstance(parameter_name, str) else None,
+                    ),
+                    obj(),
+                ))
 
         return strategies
 
+    def _registered_plugin(self, module: Any, entry: Dict[str, Any]) -> Any:
+        return super()._registered_plugin(module, entry)()
+
+    def _report_package_error(self, pkg_name: str, resource_pkg_name: Optional[str], error: Exception) -> None:
+        if self._logger is None:
+            return
+        if resource_pkg_name is None:
+            self._logger.log_warning(
+                "ParameterLoader: skipping plugin domain package "
+                f"'{pkg_name}' (ImportError: {error})"
+            )
+            return
+        self._logger.log_warning(
+            "ParameterLoader: skipping resource package "
+            f"'{resource_pkg_name}' inside '{pkg_name}' "
+            f"(ImportError: {error})"
+        )
+
+    def _report_module_error(self, record: Dict[str, Any], error: Exception) -> None:
+        if self._logger is not None:
+            self._logger.log_warning(
+                "ParameterLoader: discarding strategy module "
+                f"'{record['module']}' — {type(error).__name__}: {error}"
+            )
+
 
 class CommandLoader(PluginLoader, CommandLoaderPort):
     """
@@ -454,61 +674,58 @@ class CommandLoader(PluginLoader, CommandLoaderPort):
         """
         Retrieves all available command plugins mapped to the specified logical component.
         """
-        commands: List[Type[CliCommandPort]] = []
+        return list(dict.fromkeys(self._registered(resource)))
 
-        for pkg_name in [pkg for pkg in self._list_plugin_folder(resource, self._root_package) if pkg.split('.')[1] == self._logical_component]:
-            try:
-                package = importlib.import_module(pkg_name)
-            except ImportError as e:
-                self._logger.log_warning(f"Error loading module {pkg_name}: {e}")
-                continue
+    def _plugin_packages(self, resource: str) -> List[str]:
+        return [
+            pkg for pkg in self._list_plugin_folder(resource, self._root_package)
+            if pkg.split('.')[1] == self._logical_component
+        ]
 
-            if not hasattr(package, "__path__"):
+    def _registry_key(self, resource: str) -> str:
+        return f"{super()._registry_key(resource)}:{self._logical_component}"
+
+    def _collect_module(self, resource: str, name: str) -> List[Tuple[Dict[str, Any], Any]]:
+        commands: List[Tuple[Dict[str, Any], Any]] = []
+        module = importlib.import_module(name)
+        # Force evaluate module classes
+        for attribute, obj in inspect.getmembers(module):
+            if not (inspect.isclass(obj)
+                    and issubclass(obj, CliCommandPort)
+                    and obj is not CliCommandPort):
                 continue
-
-            resource_pkg_name = f"{pkg_name}.{resource}"
-
-            try:
-                resource_package = importlib.import_module(resource_pkg_name)
-            except ImportError as e:
-                self._logger.log_warning(f"Error loading module {resource_pkg_name}: {e}")
+            # A command module may import another domain's
+            # command class (e.g. to delegate/proxy to it) —
+            # that import makes it visible to inspect.getmembers
+            # too, but it belongs to ITS OWN declared domain, not
+            # whichever domain's directory this module happens to
+            # live under. Filtering on the class's own
+            # METADATA.logical_component (rather than the module
+            # path it was found via) keeps a domain's discovered
+            # command list scoped to commands that actually
+            # declare themselves as belonging to it — a plain
+            # re-export (`from ontobdc... import X`) still counts,
+            # since X's own METADATA is unchanged either way.
+            command_metadata = getattr(obj, "METADATA", None)
+            if getattr(command_metadata, "logical_component", None) != self._logical_component:
                 continue
+            commands.append((
+                self._registry_entry(
+                    resource,
+                    attribute,
+                    obj,
+                    logical_component=self._logical_component,
+                ),
+                obj,
+            ))
 
-            if not hasattr(resource_package, "__path__"):
-                continue
+        return commands
 
-            package_prefix = getattr(resource_package, "__name__", resource_pkg_name) + "."
-            for _, name, _ in self._walk_packages_recursive(resource_package.__path__, package_prefix, current_depth=1, max_depth=10):
-                try:
-                    module = importlib.import_module(name)
-                    # Force evaluate module classes
-                    for _, obj in inspect.getmembers(module):
-                        if not (inspect.isclass(obj)
-                                and issubclass(obj, CliCommandPort)
-                                and obj is not CliCommandPort):
-                            continue
-                        # A command module may import another domain's
-                        # command class (e.g. to delegate/proxy to it) —
-                        # that import makes it visible to inspect.getmembers
-                        # too, but it belongs to ITS OWN declared domain, not
-                        # whichever domain's directory this module happens to
-                        # live under. Filtering on the class's own
-                        # METADATA.logical_component (rather than the module
-                        # path it was found via) keeps a domain's discovered
-                        # command list scoped to commands that actually
-                        # declare themselves as belonging to it — a plain
-                        # re-export (`from ontobdc... import X`) still counts,
-                        # since X's own METADATA is unchanged either way.
-                        command_metadata = getattr(obj, "METADATA", None)
-                        if getattr(command_metadata, "logical_component", None) != self._logical_component:
-                            continue
-                        if obj not in commands:
-                            commands.append(obj)
-                except Exception as e:
-                    self._logger.log_warning(f"{package_prefix}{name} raised the error: {e}")
-                    continue
+    def _report_package_error(self, pkg_name: str, resource_pkg_name: Optional[str], error: Exception) -> None:
+        self._logger.log_warning(f"Error loading module {resource_pkg_name or pkg_name}: {error}")
 
-        return commands
+    def _report_module_error(self, record: Dict[str, Any], error: Exception) -> None:
+        self._logger.log_warning(f"{record['package']}{record['module']} raised the error: {error}")
 
 class CheckLoader(PluginLoader):
     """
@@ -521,50 +738,7 @@ class CheckLoader(PluginLoader):
         """
         Retrieves all check and hotfix modules as a list of tuples.
         """
-        checks: List[Tuple[object, object]] = []
-
-        for pkg_name in self._list_plugin_folder(resource):
-            try:
-                package = importlib.import_module(pkg_name)
-            except ImportError as e:
-                self._logger.log_warning(f"Error loading module {pkg_name}: {e}")
-                continue
-
-            if not hasattr(package, "__path__"):
-                continue
-
-            resource_pkg_name = f"{pkg_name}.{resource}"
-            try:
-                resource_package = importlib.import_module(resource_pkg_name)
-            except ImportError as e:
-                self._logger.log_warning(f"Error loading module {resource_pkg_name}: {e}")
-                continue
-
-            if not hasattr(resource_package, "__path__"):
-                continue
-
-            package_prefix = getattr(resource_package, "__name__", resource_pkg_name) + "."
-            for _, name, is_pkg in self._walk_packages_recursive(resource_package.__path__, package_prefix, current_depth=1, max_depth=10):
-                if not is_pkg:
-                    continue
-
-                check_module_name = f"{name}.check"
-                hotfix_module_name = f"{name}.hotfix"
-                try:
-                    check_module = importlib.import_module(check_module_name)
-                    if not hasattr(check_module, "main"):
-                        continue
-
-                    hotfix_module = None
-                    try:
-                        hotfix_module = importlib.import_module(hotfix_module_name)
-                    except ImportError:
-                        hotfix_module = None
-
-                    checks.append((check_module, hotfix_module))
-                except Exception as e:
-                    self._logger.log_warning(f"{package_prefix}{name} raised the error: {e}")
-                    continue
+        checks: List[Tuple[object, object]] = self._registered(resource)
 
         self._logger.log_info(f"Loaded {len(checks)} check plugins")
 
@@ -578,10 +752,46 @@ class CheckLoader(PluginLoader):
             return None
 
         normalized_id = id.replace("-", "_")
-        for check_module, hotfix_module in self.get_all(resource):
+        for check_module, hotfix_module in self._registered(resource, lambda entry: entry.get("id") == normalized_id):
             module_name = getattr(check_module, "__name__", "")
             plugin_id = module_name.split(".")[-2] if "." in module_name else module_name
             if plugin_id == normalized_id:
                 return (check_module, hotfix_module)
 
         return None
+
+    def _accepts_module(self, is_pkg: bool) -> bool:
+        return is_pkg
+
+    def _collect_module(self, resource: str, name: str) -> List[Tuple[Dict[str, Any], Any]]:
+        check_module = importlib.import_module(f"{name}.check")
+        if not hasattr(check_module, "main"):
+            return []
+
+        hotfix_module = self._import_hotfix_module(name)
+        entry: Dict[str, Any] = {
+            "attribute": None,
+            "class": None,
+            "kind": resource,
+            "id": name.split(".")[-1],
+            "hotfix": hotfix_module is not None,
+        }
+        return [(entry, (check_module, hotfix_module))]
+
+    def _registered_plugin(self, module: Any, entry: Dict[str, Any]) -> Any:
+        check_module = importlib.import_module(f"{module.__name__}.check")
+        hotfix_module = self._import_hotfix_module(module.__name__) if entry.get("hotfix") else None
+        return (check_module, hotfix_module)
+
+    @staticmethod
+    def _import_hotfix_module(name: str) -> Optional[object]:
+        try:
+            return importlib.import_module(f"{name}.hotfix")
+        except ImportError:
+            return None
+
+    def _report_package_error(self, pkg_name: str, resource_pkg_name: Optional[str], error: Exception) -> None:
+        self._logger.log_warning(f"Error loading module {resource_pkg_name or pkg_name}: {error}")
+
+    def _report_module_error(self, record: Dict[str, Any], error: Exception) -> None:
+        self._logger.log_warning(f"{record['package']}{record['module']} raised the error: {error}")
@@ -0,0 +1,65 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from rdflib import Graph, Literal, URIRef
+
+
+class LocalNameIndex:
+    """`(subject, predicate local name) -> [objects]` view over an rdflib graph.
+
+    Facade, vector and context graphs are read across several ontology
+    namespaces, so their predicates are matched by local name (the part
+    after `#` or the last `/`) rather than by full URI. Matching that way
+    against `graph.triples((subject, None, None))` costs a scan of every
+    predicate of the subject per lookup; this builds the map once per graph
+    so each lookup is a dictionary access. The index is a snapshot: build a
+    new one after mutating the graph.
+    """
+
+    def __init__(self, graph: Graph) -> None:
+        self._objects: Dict[Tuple[Any, str], List[Any]] = {}
+        self._subjects: Dict[str, List[Any]] = {}
+        for subject, predicate, obj in graph:
+            local_name: str = self.local_name(predicate)
+            key: Tuple[Any, str] = (subject, local_name)
+            objects: Optional[List[Any]] = self._objects.get(key)
+            if objects is None:
+                self._objects[key] = [obj]
+                self._subjects.setdefault(local_name, []).append(subject)
+            else:
+                objects.append(obj)
+
+    @staticmethod
+    def local_name(value: Any) -> str:
+        raw_value: str = str(value or "").strip()
+        if "#" in raw_value:
+            return raw_value.rsplit("#", 1)[-1].strip()
+        return raw_value.rstrip("/").rsplit("/", 1)[-1].strip()
+
+    def objects(self, subject: Any, local_name: str) -> List[Any]:
+        return list(self._objects.get((subject, local_name), ()))
+
+    def subjects(self, local_name: str) -> List[Any]:
+        return list(self._subjects.get(local_name, ()))
+
+    def subject_objects(self, local_name: str) -> Iterator[Tuple[Any, Any]]:
+        for subject in self._subjects.get(local_name, ()):
+            for obj in self._objects[(subject, local_name)]:
+                yield subject, obj
+
+    def contains(self, subject: Any, local_name: str, obj: Any = None) -> bool:
+        objects: List[Any] = self._objects.get((subject, local_name), [])
+        if obj is None:
+            return bool(objects)
+        return obj in objects
+
+    def first_literal(self, subject: Any, local_name: str) -> Optional[Literal]:
+        for obj in self._objects.get((subject, local_name), ()):
+            if isinstance(obj, Literal):
+                return obj
+        return None
+
+    def first_uri(self, subject: Any, local_name: str) -> Optional[URIRef]:
+        for obj in self._objects.get((subject, local_name), ()):
+            if isinstance(obj, URIRef):
+                return obj
+        return None
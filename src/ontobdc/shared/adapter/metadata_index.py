@@ -0,0 +1,159 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class MetadataFileLocationIndex:
+    """Persistent index of where named metadata files sit in a container tree.
+
+    Replaces ``container_path.rglob(name)`` for lookups such as the project
+    dashboard's ``project.ttl``. Each indexed directory stores its
+    ``st_mtime_ns``, its subdirectories and which of ``file_names`` it
+    holds. A directory's mtime changes whenever an entry is added, removed
+    or renamed in it, so a refresh stats every directory but only lists the
+    ones that changed. A directory modified within the last
+    ``_RACY_WINDOW_NS`` is stored without an mtime and listed again next
+    time, so a file created in the same timestamp tick as the listing is not
+    missed on coarse-grained filesystems. Symlinked directories, the
+    index's own directory and directories named in
+    ``excluded_directory_names`` are not traversed.
+    """
+
+    INDEX_FILENAME: str = "metadata-file-index.json"
+    INDEX_VERSION: int = 1
+    _RACY_WINDOW_NS: int = 2_000_000_000
+
+    def __init__(
+        self,
+        root_path: Path,
+        index_path: Path,
+        *,
+        file_names: Iterable[str],
+        excluded_directory_names: Iterable[str] = (),
+    ) -> None:
+        self._root_path: Path = Path(root_path).expanduser().resolve()
+        self._index_path: Path = Path(index_path).expanduser().resolve()
+        self._file_names: Tuple[str, ...] = tuple(sorted(set(file_names)))
+        self._excluded_directory_names: Tuple[str, ...] = tuple(sorted(set(excluded_directory_names)))
+
+    @classmethod
+    def for_container(cls, container_path: Path, *, file_names: Iterable[str]) -> "MetadataFileLocationIndex":
+        container: Path = Path(container_path).expanduser().resolve()
+        return cls(
+            container,
+            container / ".__ontobdc__" / "cache" / cls.INDEX_FILENAME,
+            file_names=file_names,
+        )
+
+    @property
+    def index_path(self) -> Path:
+        return self._index_path
+
+    def locations(self, file_name: str) -> List[Path]:
+        """Return every ``file_name`` under the root, sorted by relative path."""
+        if file_name not in self._file_names:
+            raise ValueError(f"File name is not indexed: {file_name}")
+        directories: Dict[str, List[Any]] = self.refresh()
+        return [
+            self._root_path / relative_directory / file_name if relative_directory else self._root_path / file_name
+            for relative_directory in sorted(directories)
+            if file_name in directories[relative_directory][2]
+        ]
+
+    def refresh(self) -> Dict[str, List[Any]]:
+        """Bring the index up to date with the tree and return its directory entries."""
+        cached: Dict[str, List[Any]] = self._load()
+        directories: Dict[str, List[Any]] = {}
+        changed: bool = False
+        pending: List[str] = [""]
+        while pending:
+            relative_directory: str = pending.pop()
+            directory_path: Path = self._root_path / relative_directory if relative_directory else self._root_path
+            try:
+                mtime_ns: int = os.stat(directory_path).st_mtime_ns
+            except OSError:
+                changed = True
+                continue
+
+            entry: Optional[List[Any]] = cached.get(relative_directory)
+            if entry is None or entry[0] != mtime_ns:
+                entry = self._scan(directory_path, mtime_ns)
+                changed = True
+            directories[relative_directory] = entry
+            pending.extend(
+                f"{relative_directory}/{name}" if relative_directory else name
+                for name in entry[1]
+            )
+
+        if changed or set(directories) != set(cached):
+            self._save(directories)
+        return directories
+
+    def _scan(self, directory_path: Path, mtime_ns: int) -> List[Any]:
+        subdirectories: List[str] = []
+        matches: List[str] = []
+        try:
+            with os.scandir(directory_path) as entries:
+                for dir_entry in entries:
+                    try:
+                        if dir_entry.is_dir(follow_symlinks=False):
+                            if dir_entry.name in self._excluded_directory_names:
+                                continue
+                            # The index's own directory changes on every save.
+                            if Path(dir_entry.path) != self._index_path.parent:
+                                subdirectories.append(dir_entry.name)
+                        elif dir_entry.name in self._file_names and dir_entry.is_file():
+                            matches.append(dir_entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            return [None, [], []]
+
+        if time.time_ns() - mtime_ns < self._RACY_WINDOW_NS:
+            stored_mtime: Optional[int] = None
+        else:
+            stored_mtime = mtime_ns
+        return [stored_mtime, sorted(subdirectories), sorted(matches)]
+
+    def _load(self) -> Dict[str, List[Any]]:
+        if not self._index_path.is_file():
+            return {}
+        try:
+            payload: Any = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != self.INDEX_VERSION
+            or payload.get("file_names") != list(self._file_names)
+            or payload.get("excluded_directory_names") != list(self._excluded_directory_names)
+        ):
+            return {}
+        return {
+            str(relative_directory): list(entry)
+            for relative_directory, entry in dict(payload.get("directories") or {}).items()
+            if isinstance(entry, list) and len(entry) == 3
+        }
+
+    def _save(self, directories: Dict[str, List[Any]]) -> None:
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path: Path = self._index_path.with_name(f".{self._index_path.name}.tmp")
+            temporary_path.write_text(
+                json.dumps(
+                    {
+                        "version": self.INDEX_VERSION,
+                        "file_names": list(self._file_names),
+                        "excluded_directory_names": list(self._excluded_directory_names),
+                        "directories": directories,
+                    },
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+            temporary_path.replace(self._index_path)
+        except OSError:
+            # A read-only container still resolves locations; it just lists the tree again next time.
+            return
@@ -5,7 +5,8 @@ from pathlib import Path
 from rdflib import Literal
 from rdflib.graph import Graph
 from rdflib.namespace import Namespace
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple
 
 from ontobdc.shared.adapter.config import ConfigDataAdapter
 from ontobdc.shared.domain.exception.config import ProjectRootDirectoryNotSetError
@@ -238,6 +239,83 @@ def _resolve_file_with_extensions(
     return None
 
 
+# Stable prefix -> namespace registry, built once at import and read-only.
+_NAMESPACES: Mapping[str, Namespace] = MappingProxyType({
+    "cv": Namespace("http://rdfs.org/resume-rdf/cv.rdfs#"),
+    "xsd": Namespace("http://www.w3.org/2001/XMLSchema#"),
+    "peo": Namespace("http://w3id.org/peo#"),
+    "sh": Namespace("http://www.w3.org/ns/shacl#"),
+    "rdf": Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#"),
+    "rdfs": Namespace("http://www.w3.org/2000/01/rdf-schema#"),
+    "obdc": Namespace("http://ontobdc.org/ontology/domain/ns.ttl#"),
+    "obdc_code": Namespace("http://ontobdc.org/ontology/domain/code.ttl#"),
+    "obdc_test": Namespace("http://ontobdc.org/ontology/domain/test.ttl#"),
+    "obdc_view": Namespace("http://datacenter.app.br/ontology/ontobdc/domain/view.ttl#"),
+    "obdc_tile": Namespace("http://datacenter.app.br/ontology/ontobdc/domain/tile.ttl#"),
+    "obdc_file": Namespace("http://datacenter.app.br/ontology/ontobdc/domain/file.ttl#"),
+    "obdc_abox_surface_layouts": Namespace(
+        "http://datacenter.app.br/ontology/ontobdc/abox/default_surface_layouts.ttl#"
+    ),
+    "ibim": Namespace("https://infobim.org/ontology/ns#"),
+    "ibim_view": Namespace("http://datacenter.app.br/ontology/infobim/domain/view.ttl#"),
+    "ibim_presentation": Namespace(
+        "http://datacenter.app.br/ontology/infobim/domain/presentation.ttl#"
+    ),
+    "ibim_tile": Namespace("http://datacenter.app.br/ontology/infobim/domain/tile.ttl#"),
+    "olia": Namespace("http://purl.org/olia/olia.owl#"),
+    "ct": Namespace("http://standards.iso.org/iso/21597/-1/ed-1/en/Container#"),
+    "fnct": Namespace("http://w3id.org/function/ontology#"),
+    "dcat": Namespace("http://www.w3.org/ns/dcat#"),
+    "void": Namespace("http://rdfs.org/ns/void#"),
+    "schema": Namespace("https://schema.org/"),
+    "prov": Namespace("http://www.w3.org/ns/prov#"),
+    "ontouml": Namespace("https://w3id.org/ontouml#"),
+    "sdo": Namespace("https://w3id.org/okn/o/sd#"),
+    "owl": Namespace("http://www.w3.org/2002/07/owl#"),
+    "dcterms": Namespace("http://purl.org/dc/terms/"),
+    "social_ns": Namespace(
+        "http://datacenter.app.br/ontology/social/entity/ns.ttl#"
+    ),
+    "pe_entity": Namespace(
+        "http://datacenter.app.br/ontology/productivity/entity/ns.ttl#"
+    ),
+    "pe_entity_work_stream": Namespace(
+        "http://datacenter.app.br/ontology/productivity/entity/work_stream/ns.ttl#"
+    ),
+    "bsi_element_ifc_work_schedule": Namespace(
+        "http://datacenter.app.br/ontology/bsi/element/ifc_work_schedule/type.ttl#"
+    ),
+    "sales_entity_sales_funnel": Namespace(
+        "http://datacenter.app.br/ontology/sales/entity/sales_funnel/type.ttl#"
+    ),
+    "sales_entity_sales_opportunity": Namespace(
+        "http://datacenter.app.br/ontology/sales/entity/sales_opportunity/type.ttl#"
+    ),
+    "social_entity_person": Namespace(
+        "http://datacenter.app.br/ontology/social/entity/person/type.ttl#"
+    ),
+    "social_entity_contact_point": Namespace(
+        "http://datacenter.app.br/ontology/social/entity/contact_point/type.ttl#"
+    ),
+    "social_entity_weblink": Namespace(
+        "http://datacenter.app.br/ontology/social/entity/weblink/type.ttl#"
+    ),
+    "social_entity_document": Namespace(
+        "http://datacenter.app.br/ontology/social/entity/document/type.ttl#"
+    ),
+    "pe_entity_document": Namespace(
+        "http://datacenter.app.br/ontology/productivity/entity/document/type.ttl#"
+    ),
+    "pe_entity_enrichment_annotation": Namespace(
+        "http://datacenter.app.br/ontology/productivity/entity/enrichment_annotation/type.ttl#"
+    ),
+    "pe_entity_visual_representation_type": Namespace(
+        "http://datacenter.app.br/ontology/productivity/entity/visual_representation_type/type.ttl#"
+    ),
+    "ifco": Namespace("https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/OWL#"),
+})
+
+
 class OntologyConfigAdapter(OntologyConfigPort):
     """
     Central adapter for all ontology access in OntoBDC.
@@ -293,99 +371,29 @@ class OntologyConfigAdapter(OntologyConfigPort):
     ``not found in <dir>`` message.
 
     :meth:`get_ontology_namespace_by_prefix` remains a lightweight in-memory
-    lookup; every stable W3C / ISO / industry prefix map is cached here so
-    callers never have to touch the filesystem just to build a
+    lookup; every stable W3C / ISO / industry prefix map is registered once
+    per process in the read-only :data:`_NAMESPACES` mapping so callers never
+    have to touch the filesystem just to build a
     :class:`rdflib.namespace.Namespace`. New project prefixes MUST be added
-    to this dictionary before they are used anywhere in the codebase to keep
+    to that mapping before they are used anywhere in the codebase to keep
     prefix→IRI binding consistent between import-time module constants and
     runtime callers.
     """
 
+    _parsed_ontologies: ClassVar[Dict[str, Tuple[Tuple[int, int], Graph]]] = {}
+
     def __init__(self, config_adapter: ConfigDataPort) -> None:
         self._config_adapter: ConfigDataPort = config_adapter
 
     def get_ontology_namespace_by_prefix(self, prefix: str) -> Optional[Namespace]:
         """
-        Return the in-memory cached :class:`Namespace` for a stable prefix.
+        Return the :class:`Namespace` registered in :data:`_NAMESPACES` for a
+        stable prefix.
 
         Never touches the filesystem; never raises (returns ``None`` for
         unknown prefixes, matching :class:`OntologyConfigPort` contract).
         """
-        ontology_list: Dict[str, Namespace] = {
-            "cv": Namespace("http://rdfs.org/resume-rdf/cv.rdfs#"),
-            "xsd": Namespace("http://www.w3.org/2001/XMLSchema#"),
-            "peo": Namespace("http://w3id.org/peo#"),
-            "sh": Namespace("http://www.w3.org/ns/shacl#"),
-            "rdf": Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#"),
-            "rdfs": Namespace("http://www.w3.org/2000/01/rdf-schema#"),
-            "obdc": Namespace("http://ontobdc.org/ontology/domain/ns.ttl#"),
-            "obdc_code": Namespace("http://ontobdc.org/ontology/domain/code.ttl#"),
-            "obdc_test": Namespace("http://ontobdc.org/ontology/domain/test.ttl#"),
-            "obdc_view": Namespace("http://datacenter.app.br/ontology/ontobdc/domain/view.ttl#"),
-            "obdc_tile": Namespace("http://datacenter.app.br/ontology/ontobdc/domain/tile.ttl#"),
-            "obdc_file": Namespace("http://datacenter.app.br/ontology/ontobdc/domain/file.ttl#"),
-            "obdc_abox_surface_layouts": Namespace(
-                "http://datacenter.app.br/ontology/ontobdc/abox/default_surface_layouts.ttl#"
-            ),
-            "ibim": Namespace("https://infobim.org/ontology/ns#"),
-            "ibim_view": Namespace("http://datacenter.app.br/ontology/infobim/domain/view.ttl#"),
-            "ibim_presentation": Namespace(
-                "http://datacenter.app.br/ontology/infobim/domain/presentation.ttl#"
-            ),
-            "ibim_tile": Namespace("http://datacenter.app.br/ontology/infobim/domain/tile.ttl#"),
-            "olia": Namespace("http://purl.org/olia/olia.owl#"),
-            "ct": Namespace("http://standards.iso.org/iso/21597/-1/ed-1/en/Container#"),
-            "fnct": Namespace("http://w3id.org/function/ontology#"),
-            "dcat": Namespace("http://www.w3.org/ns/dcat#"),
-            "void": Namespace("http://rdfs.org/ns/void#"),
-            "schema": Namespace("https://schema.org/"),
-            "prov": Namespace("http://www.w3.org/ns/prov#"),
-            "ontouml": Namespace("https://w3id.org/ontouml#"),
-            "sdo": Namespace("https://w3id.org/okn/o/sd#"),
-            "owl": Namespace("http://www.w3.org/2002/07/owl#"),
-            "dcterms": Namespace("http://purl.org/dc/terms/"),
-            "social_ns": Namespace(
-                "http://datacenter.app.br/ontology/social/entity/ns.ttl#"
-            ),
-            "pe_entity": Namespace(
-                "http://datacenter.app.br/ontology/productivity/entity/ns.ttl#"
-            ),
-            "pe_entity_work_stream": Namespace(
-                "http://datacenter.app.br/ontology/productivity/entity/work_stream/ns.ttl#"
-            ),
-            "bsi_element_ifc_work_schedule": Namespace(
-                "http://datacenter.app.br/ontology/bsi/element/ifc_work_schedule/type.ttl#"
-            ),
-            "sales_entity_sales_funnel": Namespace(
-                "http://datacenter.app.br/ontology/sales/entity/sales_funnel/type.ttl#"
-            ),
-            "sales_entity_sales_opportunity": Namespace(
-                "http://datacenter.app.br/ontology/sales/entity/sales_opportunity/type.ttl#"
-            ),
-            "social_entity_person": Namespace(
-                "http://datacenter.app.br/ontology/social/entity/person/type.ttl#"
-            ),
-            "social_entity_contact_point": Namespace(
-                "http://datacenter.app.br/ontology/social/entity/contact_point/type.ttl#"
-            ),
-            "social_entity_weblink": Namespace(
-                "http://datacenter.app.br/ontology/social/entity/weblink/type.ttl#"
-            ),
-            "social_entity_document": Namespace(
-                "http://datacenter.app.br/ontology/social/entity/document/type.ttl#"
-            ),
-            "pe_entity_document": Namespace(
-                "http://datacenter.app.br/ontology/productivity/entity/document/type.ttl#"
-            ),
-            "pe_entity_enrichment_annotation": Namespace(
-                "http://datacenter.app.br/ontology/productivity/entity/enrichment_annotation/type.ttl#"
-            ),
-            "pe_entity_visual_representation_type": Namespace(
-                "http://datacenter.app.br/ontology/productivity/entity/visual_representation_type/type.ttl#"
-            ),
-            "ifco": Namespace("https://standards.buildingsmart.org/IFC/RELEASE/IFC4/ADD2_TC1/OWL#"),
-        }
-        return ontology_list.get(prefix, None)
+        return _NAMESPACES.get(prefix, None)
 
     # ------------------------------------------------------------------ path
 
@@ -533,9 +541,26 @@ class OntologyConfigAdapter(OntologyConfigPort):
         file is one of the canonical RDF suffixes listed in
         :data:`_SUPPORTED_EXTENSIONS` and the project ship only Turtle
         ontologies today.
+
+        Each resolved file is parsed at most once per process while its
+        ``st_mtime_ns``/``st_size`` are unchanged; every call returns its own
+        copy of the parsed graph.
         """
+        ontology_path: str = self.get_ontology_path(prefix, type)
+        stat_result = Path(ontology_path).stat()
+        signature: Tuple[int, int] = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached: Optional[Tuple[Tuple[int, int], Graph]] = self._parsed_ontologies.get(ontology_path)
+        if cached is None or cached[0] != signature:
+            parsed_graph: Graph = Graph()
+            parsed_graph.parse(ontology_path, format="turtle")
+            cached = (signature, parsed_graph)
+            self._parsed_ontologies[ontology_path] = cached
+
+        # Callers own the returned graph, so hand out a copy of the parsed one.
         ontology_graph: Graph = Graph()
-        ontology_graph.parse(self.get_ontology_path(prefix, type), format="turtle")
+        for namespace_prefix, namespace in cached[1].namespaces():
+            ontology_graph.bind(namespace_prefix, namespace, override=True)
+        ontology_graph.addN((subject, predicate, value, ontology_graph) for subject, predicate, value in cached[1])
         return ontology_graph
 
     # ---------------------------------------------------------------- literal
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import sys
+from importlib import metadata as importlib_metadata
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Iterable, List, Optional
+
+from ontobdc.shared.adapter.filesystem import user_cache_directory
+
+
+class PluginRegistryManifest:
+    """Persistent manifest of the plugins `PluginLoader` discovers.
+
+    Discovery walks each plugin package and imports every module in it to
+    inspect its classes. The manifest records the outcome per loader key:
+    every walked module in discovery order and, for each plugin class it
+    holds, the attribute name, qualified class name, kind and the metadata
+    loaders select on (id, logical component, parameter name, tile class,
+    required URIs). With a current manifest a loader imports only the
+    modules of the plugins it actually selects.
+
+    Each key is stored with a signature built from the installed
+    `ontobdc`/`ontobdc-view` (and downstream root package) versions plus
+    the relative path, ``st_mtime_ns`` and size of every ``.py`` file under
+    the key's plugin directories, so an upgrade, an edited plugin or an
+    added/removed module rebuilds it on the next run. Signatures are
+    computed once per process, matching the import cache, which does not
+    pick up edited modules within a process either.
+
+    The manifest lives in `user_cache_directory()`, one file per Python
+    environment, since plugins are discovered before, and independently
+    of, any project root.
+    """
+
+    MANIFEST_VERSION: ClassVar[int] = 1
+
+    _instances: ClassVar[Dict[str, "PluginRegistryManifest"]] = {}
+
+    def __init__(self, manifest_path: Path) -> None:
+        self._manifest_path: Path = Path(manifest_path).expanduser().resolve()
+        self._resources: Optional[Dict[str, Dict[str, Any]]] = None
+        self._signatures: Dict[str, str] = {}
+
+    @classmethod
+    def for_environment(cls) -> "PluginRegistryManifest":
+        """Return the shared manifest of the running Python environment."""
+        environment_key: str = hashlib.sha256(
+            os.path.realpath(sys.prefix).encode("utf-8")
+        ).hexdigest()[:16]
+        manifest_path: Path = user_cache_directory() / f"plugin-registry-{environment_key}.json"
+        if str(manifest_path) not in cls._instances:
+            cls._instances[str(manifest_path)] = cls(manifest_path)
+        return cls._instances[str(manifest_path)]
+
+    @property
+    def manifest_path(self) -> Path:
+        return self._manifest_path
+
+    def signature(self, directories: Iterable[str], distributions: Iterable[str]) -> str:
+        """Return the staleness signature of plugin `directories` and `distributions`."""
+        directory_paths: List[str] = sorted(dict.fromkeys(str(directory) for directory in directories))
+        distribution_names: List[str] = sorted(dict.fromkeys(distributions))
+        memo_key: str = "\0".join([*distribution_names, "", *directory_paths])
+        if memo_key in self._signatures:
+            return self._signatures[memo_key]
+
+        digest = hashlib.sha256(f"{self.MANIFEST_VERSION}\0".encode("ascii"))
+        for distribution_name in distribution_names:
+            try:
+                version: str = importlib_metadata.version(distribution_name)
+            except importlib_metadata.PackageNotFoundError:
+                version = ""
+            digest.update(f"{distribution_name}={version}\0".encode("utf-8"))
+
+        for directory_path in directory_paths:
+            digest.update(f"{directory_path}\0".encode("utf-8"))
+            for current_directory, directory_names, file_names in os.walk(directory_path):
+                directory_names[:] = sorted(name for name in directory_names if name != "__pycache__")
+                for file_name in sorted(file_names):
+                    if not file_name.endswith(".py"):
+                        continue
+                    file_path: str = os.path.join(current_directory, file_name)
+                    try:
+                        stat_result: os.stat_result = os.stat(file_path)
+                    except OSError:
+                        continue
+                    digest.update(
+                        f"{os.path.relpath(file_path, directory_path)}\0"
+                        f"{stat_result.st_mtime_ns}\0{stat_result.st_size}\0".encode("utf-8")
+                    )
+
+        self._signatures[memo_key] = digest.hexdigest()
+        return self._signatures[memo_key]
+
+    def modules(self, key: str, signature: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the module records stored for `key`, or ``None`` when missing or stale."""
+        resource: Optional[Dict[str, Any]] = self._load().get(key)
+        if not isinstance(resource, dict) or resource.get("signature") != signature:
+            return None
+        modules: Any = resource.get("modules")
+        if not isinstance(modules, list) or not all(isinstance(record, dict) for record in modules):
+            return None
+        return modules
+
+    def store(self, key: str, signature: str, modules: List[Dict[str, Any]]) -> None:
+        resources: Dict[str, Dict[str, Any]] = self._load()
+        resources[key] = {"signature": signature, "modules": modules}
+        try:
+            self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path: Path = self._manifest_path.with_name(
+                f".{self._manifest_path.name}.{os.getpid()}.tmp"
+            )
+            temporary_path.write_text(
+                json.dumps(
+                    {"version": self.MANIFEST_VERSION, "resources": resources},
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+            temporary_path.replace(self._manifest_path)
+        except OSError:
+            # A read-only cache still loads plugins; it just scans again next run.
+            return
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._resources is not None:
+            return self._resources
+
+        self._resources = {}
+        if self._manifest_path.is_file():
+            try:
+                payload: Any = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, dict) and payload.get("version") == self.MANIFEST_VERSION:
+                self._resources = {
+                    str(key): dict(resource)
+                    for key, resource in dict(payload.get("resources") or {}).items()
+                    if isinstance(resource, dict)
+                }
+        return self._resources
@@ -6,7 +6,8 @@ import hashlib
 import requests
 import unicodedata
 from functools import lru_cache
-from typing import List, Callable
+from importlib import metadata as importlib_metadata
+from typing import Callable, Dict, Iterable, List
 from rdflib.term import _is_valid_uri
 
 
@@ -86,17 +87,23 @@ def is_valid_uri(uri: str) -> bool:
     return True
 
 def to_lemma(value: str, language: str = "en") -> str:
+    token_list: List[str] = [
+        lemmatize_token(token, language=language)
+        for token in lemma_tokens(value)
+    ]
+    return " ".join(token_list).strip()
+
+
+def lemma_tokens(value: str) -> List[str]:
+    """
+    Splits a value into the ASCII, lowercase tokens `to_lemma` lemmatizes.
+    """
     normalized_value: str = unicodedata.normalize("NFKD", str(value or "").strip())
     ascii_value: str = normalized_value.encode("ascii", "ignore").decode("ascii")
     lowercase_value: str = ascii_value.lower()
     lowercase_value = re.sub(r"\be[-\s]+mail\b", "email", lowercase_value)
     tokenized_value: str = re.sub(r"[^a-z0-9]+", " ", lowercase_value).strip()
-    token_list: List[str] = [
-        lemmatize_token(token, language=language)
-        for token in tokenized_value.split()
-        if token
-    ]
-    return " ".join(token_list).strip()
+    return [token for token in tokenized_value.split() if token]
 
 
 def lemmatize_token(token: str, language: str = "en") -> str:
@@ -106,14 +113,52 @@ def lemmatize_token(token: str, language: str = "en") -> str:
 
     spacy_language = _get_spacy_language(language)
     document = spacy_language(normalized_token)
+    return _document_lemma(document, normalized_token)
+
+
+def lemmatize_tokens(tokens: Iterable[str], language: str = "en") -> Dict[str, str]:
+    """
+    Maps every distinct token to its lemma with a single spaCy `pipe` call.
+    """
+    distinct_tokens: List[str] = list(
+        dict.fromkeys(str(token or "").strip() for token in tokens if str(token or "").strip())
+    )
+    if not distinct_tokens:
+        return {}
+
+    spacy_language = _get_spacy_language(language)
+    return {
+        token: _document_lemma(document, token)
+        for token, document in zip(distinct_tokens, spacy_language.pipe(distinct_tokens))
+    }
+
+
+def lemmatizer_fingerprint(language: str = "en") -> str:
+    """
+    Identifies the spaCy pipeline `lemmatize_tokens` uses, without loading it: the language plus the installed `spacy` and `spacy-lookups-data` versions.
+    """
+    versions: List[str] = []
+    for distribution_name in ("spacy", "spacy-lookups-data"):
+        try:
+            versions.append(f"{distribution_name}={importlib_metadata.version(distribution_name)}")
+        except importlib_metadata.PackageNotFoundError:
+            versions.append(f"{distribution_name}=")
+    return " ".join([_spacy_language_code(language), *versions])
+
+
+def _spacy_language_code(language: str) -> str:
+    return str(language or "en").lower().split("-", 1)[0].split("_", 1)[0]
+
+
+def _document_lemma(document, token: str) -> str:
     if len(document) == 0:
-        return normalized_token.lower()
+        return token.lower()
 
     lemma_value: str = str(document[0].lemma_ or "").strip().lower()
     if lemma_value:
         return lemma_value
 
-    return normalized_token.lower()
+    return token.lower()
 
 
 @lru_cache(maxsize=8)
@@ -123,7 +168,7 @@ def _get_spacy_language(language: str):
     except ImportError as exc:
         raise ValueError("The 'spacy' package is required to lemmatize tokens.") from exc
 
-    normalized_language: str = str(language or "en").lower().split("-", 1)[0].split("_", 1)[0]
+    normalized_language: str = _spacy_language_code(language)
 
     try:
         nlp = spacy.blank(normalized_language)
@@ -1,15 +1,33 @@
-import os
-import tempfile
+import hashlib
+import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, ClassVar, Dict, List, Optional, Type
 
+import sismic
 import yaml
 from sismic.interpreter import Interpreter
-from sismic.io import import_from_yaml
+from sismic.io.datadict import import_from_dict
 from sismic.model import Statechart
 
+from ontobdc.shared.adapter.filesystem import user_cache_directory
+
 
 class StateWorkerAdapter:
+    """Drive a state adapter through a sismic statechart loaded from YAML.
+
+    Statechart definitions are cached by the SHA-256 of the file's bytes
+    and the sismic version: in memory for the process, and on disk under
+    `user_cache_directory()/statecharts` once sismic's schema and
+    statechart validation have accepted them. A cached definition is
+    turned into a `Statechart` with `import_from_dict` and validation
+    skipped, with no YAML parse and no temporary file.
+    """
+
+    STATECHART_CACHE_VERSION: ClassVar[int] = 1
+    MAX_CACHED_STATECHARTS: ClassVar[int] = 64
+
+    _statechart_cache: ClassVar[Dict[str, Dict[str, Any]]] = {}
+
     def __init__(
         self,
         state_adapter: Type[Any],
@@ -23,6 +41,7 @@ class StateWorkerAdapter:
         self._handler: Any = handler
         self._logger: Any = logger
         self._statechart_file_path: Path = statechart_file_path
+        self._statechart_cache_key: str = ""
         self._statechart_data: Dict[str, Any] = self._load_statechart_data()
         self._bind_state_adapter_metadata()
 
@@ -78,8 +97,21 @@ class StateWorkerAdapter:
         return visited_states
 
     def _load_statechart_data(self) -> Dict[str, Any]:
-        with open(self._statechart_file_path, "r", encoding="utf-8") as file_handle:
-            return yaml.safe_load(file_handle) or {}
+        source: bytes = Path(self._statechart_file_path).read_bytes()
+        self._statechart_cache_key = hashlib.sha256(
+            f"{self.STATECHART_CACHE_VERSION}\0{sismic.__version__}\0".encode("utf-8") + source
+        ).hexdigest()
+
+        cached: Optional[Dict[str, Any]] = self._statechart_cache.get(self._statechart_cache_key)
+        if cached is None:
+            cached_data: Optional[Dict[str, Any]] = self._read_cached_statechart_data()
+            if cached_data is not None:
+                cached = {"data": cached_data, "validated": True}
+            else:
+                cached = {"data": yaml.safe_load(source.decode("utf-8")) or {}, "validated": False}
+            self._statechart_cache[self._statechart_cache_key] = cached
+
+        return cached["data"]
 
     def _bind_state_adapter_metadata(self) -> None:
         statechart_data: object = self._statechart_data.get("statechart")
@@ -143,18 +175,56 @@ class StateWorkerAdapter:
         cleaned_data: Dict[str, Any] = self._remove_presentation_metadata(
             self._statechart_data
         )
-        file_descriptor: int
-        temp_path: str
-        file_descriptor, temp_path = tempfile.mkstemp(suffix=".yaml")
+        cached: Dict[str, Any] = self._statechart_cache.setdefault(
+            self._statechart_cache_key,
+            {"data": self._statechart_data, "validated": False},
+        )
+        if cached["validated"]:
+            return import_from_dict(cleaned_data, ignore_schema=True, ignore_validation=True)
 
-        try:
-            with os.fdopen(file_descriptor, "w", encoding="utf-8") as temp_file:
-                yaml.dump(cleaned_data, temp_file)
+        statechart: Statechart = import_from_dict(cleaned_data)
+        cached["validated"] = True
+        self._write_cached_statechart_data()
+        return statechart
+
+    def _cached_statechart_path(self) -> Path:
+        return user_cache_directory() / "statecharts" / f"{self._statechart_cache_key}.json"
 
-            return import_from_yaml(filepath=temp_path)
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+    def _read_cached_statechart_data(self) -> Optional[Dict[str, Any]]:
+        try:
+            payload: Any = json.loads(self._cached_statechart_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != self.STATECHART_CACHE_VERSION:
+            return None
+        statechart_data: Any = payload.get("statechart")
+        return statechart_data if isinstance(statechart_data, dict) else None
+
+    def _write_cached_statechart_data(self) -> None:
+        cache_path: Path = self._cached_statechart_path()
+        try:
+            serialized: str = json.dumps(
+                {"version": self.STATECHART_CACHE_VERSION, "statechart": self._statechart_data},
+                sort_keys=True,
+            )
+        except (TypeError, ValueError):
+            # Not representable as JSON (e.g. YAML timestamps): keep it in memory only.
+            return
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path: Path = cache_path.with_name(f".{cache_path.name}.tmp")
+            temporary_path.write_text(serialized, encoding="utf-8")
+            temporary_path.replace(cache_path)
+            stored: List[Path] = sorted(
+                cache_path.parent.glob("*.json"),
+                key=lambda path: path.stat().st_mtime_ns,
+                reverse=True,
+            )
+            for stale_path in stored[self.MAX_CACHED_STATECHARTS:]:
+                stale_path.unlink(missing_ok=True)
+        except OSError:
+            # A read-only cache still runs the machine; it just validates again next run.
+            return
 
     def _is_final_state(self, state_name: str) -> bool:
         statechart_data: Dict[str, Any] = self._statechart_data.get("statechart", {})
@@ -0,0 +1,269 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import DCTERMS, OWL, PROV, RDF
+
+from ontobdc.storage.adapter.attachment.error import DatasetAttachError
+from ontobdc.storage.adapter.attachment.graph import (
+    AttachmentGraphNamespaceBootstrap,
+)
+from ontobdc.storage.adapter.bootstrap import StorageBootstrap
+
+AttachmentGraphNamespaceBootstrap.initialize()
+_CT = AttachmentGraphNamespaceBootstrap.CT
+_OBDC = AttachmentGraphNamespaceBootstrap.OBDC
+
+
+def _dataset_facts(dataset_file: str) -> Dict[str, Any]:
+    """Parse one `dataset.ttl` into the plain facts attachment validates."""
+    graph: Graph = Graph()
+    try:
+        graph.parse(dataset_file, format="turtle")
+    except Exception:
+        return {"readable": False}
+
+    subjects: List[str] = [
+        str(subject)
+        for subject in graph.subjects(RDF.type, _OBDC.EntityDataset)
+        if isinstance(subject, URIRef)
+    ]
+    values: Dict[str, List[List[str]]] = {}
+    if len(subjects) == 1:
+        subject: URIRef = URIRef(subjects[0])
+        for key, predicate in AttachmentDatasetIndex.PREDICATES:
+            values[key] = [
+                [AttachmentDatasetIndex.term_kind(value), str(value)]
+                for value in graph.objects(subject, predicate)
+            ]
+    return {
+        "readable": True,
+        "subjects": subjects,
+        "values": values,
+        "ontology_subjects": [
+            str(subject)
+            for subject in graph.subjects(RDF.type, OWL.Ontology)
+            if isinstance(subject, URIRef)
+        ],
+    }
+
+
+class AttachmentDatasetIndex:
+    """Pre-parsed facts of every `dataset.ttl` of a container, for attachment.
+
+    Inspecting a container validates each direct child dataset's
+    identifier, location, container reference and entity references. The
+    facts those checks read are extracted once per file and stored under
+    `.__ontobdc__/cache/dataset-attachment-index.json`, keyed by dataset
+    directory name and the SHA-256 of the file's bytes, so a container
+    that was copied or moved, which is the usual attach case, still reuses
+    them. Hashing is far cheaper than an rdflib parse; only new or changed
+    files are parsed, in a process pool once there are at least
+    `PARALLEL_PARSE_MIN_DATASETS` of them. Validation then runs over the
+    loaded facts with the same messages `AttachmentGraphOperations` raises.
+    """
+
+    INDEX_FILENAME: str = "dataset-attachment-index.json"
+    INDEX_VERSION: int = 1
+    PARALLEL_PARSE_MIN_DATASETS: int = 32
+    PREDICATES: Tuple[Tuple[str, URIRef], ...] = (
+        ("identifier", DCTERMS.identifier),
+        ("location", PROV.atLocation),
+        ("container", _OBDC.belongsToDataContainer),
+        ("title", DCTERMS.title),
+        ("description", DCTERMS.description),
+        ("creation_date", _CT.creationDate),
+        ("data_entities", _OBDC.hasDataEntity),
+    )
+
+    def __init__(self, index_path: Path, *, max_workers: Optional[int] = None) -> None:
+        self._index_path: Path = Path(index_path).expanduser().resolve()
+        self._max_workers: int = max(1, max_workers or (os.cpu_count() or 1))
+
+    @classmethod
+    def for_container(cls, container_path: Path, *, max_workers: Optional[int] = None) -> "AttachmentDatasetIndex":
+        return cls(
+            Path(container_path).expanduser().resolve() / ".__ontobdc__" / "cache" / cls.INDEX_FILENAME,
+            max_workers=max_workers,
+        )
+
+    @property
+    def index_path(self) -> Path:
+        return self._index_path
+
+    @staticmethod
+    def term_kind(value: Any) -> str:
+        if isinstance(value, Literal):
+            return "literal"
+        if isinstance(value, URIRef):
+            return "uri"
+        return "node"
+
+    def inspect_datasets(
+        self,
+        dataset_paths: List[Path],
+        container_subject: URIRef,
+    ) -> List[Dict[str, Any]]:
+        """Return the attachment record of every dataset, in `dataset_paths` order."""
+        facts: List[Dict[str, Any]] = self.dataset_facts(dataset_paths)
+        return [
+            self.dataset_record(dataset_path, dataset_facts, container_subject)
+            for dataset_path, dataset_facts in zip(dataset_paths, facts)
+        ]
+
+    def dataset_facts(self, dataset_paths: List[Path]) -> List[Dict[str, Any]]:
+        cached: Dict[str, Dict[str, Any]] = self._load()
+        indexed: Dict[str, Dict[str, Any]] = {}
+        facts: List[Optional[Dict[str, Any]]] = []
+        missing: List[Tuple[int, str, str]] = []
+        for position, dataset_path in enumerate(dataset_paths):
+            dataset_file: Path = StorageBootstrap.get_dataset_storage_file_path(dataset_path)
+            try:
+                digest: str = hashlib.sha256(dataset_file.read_bytes()).hexdigest()
+            except OSError:
+                facts.append({"readable": False})
+                continue
+            entry: Optional[Dict[str, Any]] = cached.get(dataset_path.name)
+            if entry is not None and entry.get("sha256") == digest:
+                indexed[dataset_path.name] = entry
+                facts.append(entry)
+                continue
+            facts.append(None)
+            missing.append((position, dataset_path.name, digest))
+
+        parsed: List[Dict[str, Any]] = self._parse(
+            [
+                str(StorageBootstrap.get_dataset_storage_file_path(dataset_paths[position]))
+                for position, _, _ in missing
+            ]
+        )
+        for (position, name, digest), dataset_facts in zip(missing, parsed):
+            entry = {"sha256": digest, **dataset_facts}
+            facts[position] = entry
+            if dataset_facts.get("readable"):
+                indexed[name] = entry
+
+        if missing or set(indexed) != set(cached):
+            self._save(indexed)
+        return [dict(item or {"readable": False}) for item in facts]
+
+    @classmethod
+    def dataset_record(
+        cls,
+        dataset_path: Path,
+        facts: Dict[str, Any],
+        container_subject: URIRef,
+    ) -> Dict[str, Any]:
+        dataset_file: Path = StorageBootstrap.get_dataset_storage_file_path(dataset_path)
+        if not facts.get("readable"):
+            raise DatasetAttachError(f"Could not read Turtle graph: {dataset_file}")
+        subjects: List[str] = list(facts.get("subjects") or [])
+        if len(subjects) != 1:
+            raise DatasetAttachError(
+                f"Expected exactly one dataset subject, found {len(subjects)}."
+            )
+        values: Dict[str, List[List[str]]] = dict(facts.get("values") or {})
+
+        source_dataset_id: str = cls._required(values, "identifier", "literal", "dataset identifier")
+        source_dataset_location: str = cls._required(values, "location", "uri", "dataset location")
+        source_container_subject: str = cls._required(
+            values, "container", "uri", "dataset container reference"
+        )
+        if source_container_subject != str(container_subject):
+            raise DatasetAttachError(
+                "Dataset container reference does not match the imported "
+                f"container: {dataset_path}"
+            )
+        for key, label in (
+            ("title", "dataset title"),
+            ("description", "dataset description"),
+            ("creation_date", "dataset creation date"),
+        ):
+            cls._required(values, key, "literal", label)
+
+        ontology_subjects: List[str] = list(facts.get("ontology_subjects") or [])
+        if len(ontology_subjects) != 1:
+            raise DatasetAttachError(
+                f"Expected exactly one dataset ontology subject: {dataset_file}"
+            )
+        data_entities: List[str] = [
+            value for kind, value in values.get("data_entities") or [] if kind == "uri"
+        ]
+        if len(data_entities) != 1:
+            raise DatasetAttachError(
+                f"Expected exactly one dataset data entity: {dataset_file}"
+            )
+        return {
+            "path": str(dataset_path),
+            "file": str(dataset_file),
+            "source_subject": subjects[0],
+            "source_id": source_dataset_id,
+            "source_location": source_dataset_location,
+            "source_container_subject": source_container_subject,
+            "source_ontology_subjects": ontology_subjects,
+            "source_data_entities": data_entities,
+        }
+
+    @staticmethod
+    def _required(
+        values: Dict[str, List[List[str]]],
+        key: str,
+        kind: str,
+        label: str,
+    ) -> str:
+        # Same checks and messages as AttachmentGraphOperations.required_literal/required_uri.
+        candidates: List[List[str]] = list(values.get(key) or [])
+        if len(candidates) != 1 or not str(candidates[0][1]).strip():
+            raise DatasetAttachError(f"Expected exactly one {label}.")
+        if candidates[0][0] != kind:
+            article: str = "a literal" if kind == "literal" else "a URI"
+            raise DatasetAttachError(f"Expected {label} to be {article}.")
+        return str(candidates[0][1]).strip()
+
+    def _parse(self, dataset_files: List[str]) -> List[Dict[str, Any]]:
+        workers: int = min(self._max_workers, len(dataset_files))
+        if workers > 1 and len(dataset_files) >= self.PARALLEL_PARSE_MIN_DATASETS:
+            chunksize: int = max(1, len(dataset_files) // (workers * 4))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(_dataset_facts, dataset_files, chunksize=chunksize))
+            except (BrokenProcessPool, NotImplementedError, OSError):
+                # No usable worker processes here: parse in-process.
+                pass
+        return [_dataset_facts(dataset_file) for dataset_file in dataset_files]
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self._index_path.is_file():
+            return {}
+        try:
+            payload: Any = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != self.INDEX_VERSION:
+            return {}
+        return {
+            str(name): dict(entry)
+            for name, entry in dict(payload.get("datasets") or {}).items()
+            if isinstance(entry, dict)
+        }
+
+    def _save(self, datasets: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path: Path = self._index_path.with_name(f".{self._index_path.name}.tmp")
+            temporary_path.write_text(
+                json.dumps(
+                    {"version": self.INDEX_VERSION, "datasets": datasets},
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+            temporary_path.replace(self._index_path)
+        except OSError:
+            # A read-only container still attaches; it just parses again next time.
+            return
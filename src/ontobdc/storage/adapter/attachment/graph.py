@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Set, Tuple, Type
 
 from rdflib import Graph, Literal, URIRef
 from rdflib.namespace import DCTERMS, OWL, PROV, RDF, XSD, Namespace
@@ -143,25 +143,58 @@ class AttachmentGraphOperations:
         cls,
         graph: Graph,
         mapping: Dict[URIRef, URIRef],
+        *,
+        in_place: bool = False,
     ) -> Graph:
-        rewritten: Graph = Graph()
-        for prefix, namespace in graph.namespaces():
-            rewritten.bind(prefix, namespace)
+        """Return ``graph`` with every subject/object in ``mapping`` replaced.
+
+        By default the result is a new graph, filled with one ``addN`` pass.
+        With ``in_place=True`` only the triples that mention a mapped URI are
+        looked up through the graph's indexes and replaced, so the cost
+        follows the number of rewritten triples rather than the graph size;
+        ``graph`` itself is returned.
+        """
+        rewritten: Graph = graph if in_place else Graph()
+        if not in_place:
+            for prefix, namespace in graph.namespaces():
+                rewritten.bind(prefix, namespace)
         rewritten.bind("dcterms", DCTERMS)
         rewritten.bind("ct", AttachmentGraphNamespaceBootstrap.CT)
         rewritten.bind("prov", PROV)
         rewritten.bind("xsd", XSD)
         rewritten.bind("obdc", AttachmentGraphNamespaceBootstrap.OBDC)
         rewritten.bind("owl", OWL)
-        for subject, predicate, object_value in graph:
-            rewritten.add(
+
+        if not in_place:
+            rewritten.addN(
                 (
                     mapping.get(subject, subject),
                     predicate,
                     mapping.get(object_value, object_value),
+                    rewritten,
                 )
+                for subject, predicate, object_value in graph
             )
-        return rewritten
+            return rewritten
+
+        affected: Set[Tuple[Any, Any, Any]] = set()
+        for source, target in mapping.items():
+            if source == target:
+                continue
+            affected.update(graph.triples((source, None, None)))
+            affected.update(graph.triples((None, None, source)))
+        for triple in affected:
+            graph.remove(triple)
+        graph.addN(
+            (
+                mapping.get(subject, subject),
+                predicate,
+                mapping.get(object_value, object_value),
+                graph,
+            )
+            for subject, predicate, object_value in affected
+        )
+        return graph
 
     @classmethod
     def set_single(
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Collection, Dict, FrozenSet, List
 
 from rdflib import Graph, URIRef
 from rdflib.namespace import DCTERMS, PROV, RDF
@@ -83,9 +83,11 @@ class AttachmentMetadataService:
         target_container_id: str = attachment_plan["target_container_id"]
         target_container_location: str = attachment_plan["target_container_location"]
         mapping: Dict[URIRef, URIRef] = AttachmentPlanner.uri_mapping(attachment_plan)
+        container_baseline: FrozenSet[Any] = frozenset(container_graph)
         rewritten_container: Graph = AttachmentGraphOperations.rewrite_graph(
             container_graph,
             mapping,
+            in_place=True,
         )
         AttachmentGraphOperations.set_single(
             rewritten_container,
@@ -107,6 +109,7 @@ class AttachmentMetadataService:
             storage_file,
             StorageIndexAttachError,
         )
+        storage_baseline: FrozenSet[Any] = frozenset(storage_graph)
         self._prune_conflicting_container_nodes(
             storage_graph=storage_graph,
             attachment_plan=attachment_plan,
@@ -174,8 +177,13 @@ class AttachmentMetadataService:
             container_file: rewritten_container,
             storage_file: storage_graph,
         }
+        baselines: Dict[Path, Collection[Any]] = {
+            container_file: container_baseline,
+            storage_file: storage_baseline,
+        }
         for dataset in attachment_plan["datasets"]:
             payloads[Path(dataset["file"])] = dataset["_rewritten_graph"]
+            baselines[Path(dataset["file"])] = dataset["_source_triples"]
 
         AttachmentTransactionCoordinator(
             context,
@@ -183,7 +191,10 @@ class AttachmentMetadataService:
             self._plan_parameter,
         ).ensure_backup()
         try:
-            AttachmentTransactionCoordinator.write_graphs_transactionally(payloads)
+            AttachmentTransactionCoordinator.write_graphs_transactionally(
+                payloads,
+                baselines,
+            )
         except Exception as error:
             AttachmentTransactionCoordinator(
                 context,
@@ -230,9 +241,11 @@ class AttachmentMetadataService:
                 dataset_file,
                 DatasetAttachError,
             )
+            dataset["_source_triples"] = frozenset(dataset_graph)
             rewritten: Graph = AttachmentGraphOperations.rewrite_graph(
                 dataset_graph,
                 mapping,
+                in_place=True,
             )
             dataset_subject: URIRef = AttachmentGraphOperations.single_subject(
                 rewritten,
@@ -4,11 +4,13 @@ from typing import Any, Dict, List, Optional, Set
 from urllib.parse import quote
 
 from rdflib import Graph, URIRef
-from rdflib.namespace import DCTERMS, OWL, PROV, RDF
+from rdflib.namespace import DCTERMS, PROV, RDF
 
 from ontobdc.cli.domain.port.context import CliContextPort
+from ontobdc.storage.adapter.attachment.dataset_index import (
+    AttachmentDatasetIndex,
+)
 from ontobdc.storage.adapter.attachment.error import (
-    DatasetAttachError,
     IdentityConflictError,
     InvalidContainerGraphError,
     InvalidContainerPathError,
@@ -168,10 +170,12 @@ class AttachmentPlanner:
             storage_file, StorageIndexAttachError
         )
 
-        datasets: List[Dict[str, Any]] = [
-            self._inspect_dataset(dataset_path, container_subject)
-            for dataset_path in self._dataset_paths(container_path)
-        ]
+        datasets: List[Dict[str, Any]] = self._dataset_index(
+            container_path
+        ).inspect_datasets(
+            self._dataset_paths(container_path),
+            container_subject,
+        )
         attachment_plan: Dict[str, Any] = {
             "root_path": str(root_path),
             "container_path": str(container_path),
@@ -373,90 +377,5 @@ class AttachmentPlanner:
         )
 
     @classmethod
-    def _inspect_dataset(
-        cls,
-        dataset_path: Path,
-        container_subject: URIRef,
-    ) -> Dict[str, Any]:
-        dataset_file: Path = StorageBootstrap.get_dataset_storage_file_path(
-            dataset_path
-        )
-        dataset_graph: Graph = AttachmentGraphOperations.load_graph(
-            dataset_file, DatasetAttachError
-        )
-        dataset_subject: URIRef = AttachmentGraphOperations.single_subject(
-            dataset_graph,
-            RDF.type,
-            _OBDC.EntityDataset,
-            DatasetAttachError,
-            "dataset",
-        )
-        source_dataset_id: str = AttachmentGraphOperations.required_literal(
-            dataset_graph,
-            dataset_subject,
-            DCTERMS.identifier,
-            DatasetAttachError,
-            "dataset identifier",
-        )
-        source_dataset_location: str = AttachmentGraphOperations.required_uri(
-            dataset_graph,
-            dataset_subject,
-            PROV.atLocation,
-            DatasetAttachError,
-            "dataset location",
-        )
-        source_container_subject: str = AttachmentGraphOperations.required_uri(
-            dataset_graph,
-            dataset_subject,
-            _OBDC.belongsToDataContainer,
-            DatasetAttachError,
-            "dataset container reference",
-        )
-        if source_container_subject != str(container_subject):
-            raise DatasetAttachError(
-                "Dataset container reference does not match the imported "
-                f"container: {dataset_path}"
-            )
-        for predicate, label in (
-            (DCTERMS.title, "dataset title"),
-            (DCTERMS.description, "dataset description"),
-            (_CT.creationDate, "dataset creation date"),
-        ):
-            AttachmentGraphOperations.required_literal(
-                dataset_graph,
-                dataset_subject,
-                predicate,
-                DatasetAttachError,
-                label,
-            )
-        ontology_subjects: List[str] = [
-            str(subject)
-            for subject in dataset_graph.subjects(RDF.type, OWL.Ontology)
-            if isinstance(subject, URIRef)
-        ]
-        if len(ontology_subjects) != 1:
-            raise DatasetAttachError(
-                f"Expected exactly one dataset ontology subject: {dataset_file}"
-            )
-        data_entities: List[str] = [
-            str(value)
-            for value in dataset_graph.objects(
-                dataset_subject,
-                _OBDC.hasDataEntity,
-            )
-            if isinstance(value, URIRef)
-        ]
-        if len(data_entities) != 1:
-            raise DatasetAttachError(
-                f"Expected exactly one dataset data entity: {dataset_file}"
-            )
-        return {
-            "path": str(dataset_path),
-            "file": str(dataset_file),
-            "source_subject": str(dataset_subject),
-            "source_id": source_dataset_id,
-            "source_location": source_dataset_location,
-            "source_container_subject": source_container_subject,
-            "source_ontology_subjects": ontology_subjects,
-            "source_data_entities": data_entities,
-        }
+    def _dataset_index(cls, container_path: Path) -> AttachmentDatasetIndex:
+        return AttachmentDatasetIndex.for_container(container_path)
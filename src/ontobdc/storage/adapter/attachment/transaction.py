@@ -1,7 +1,8 @@
+import os
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional, Tuple
 
 from rdflib import Graph
 
@@ -23,12 +24,25 @@ class AttachmentTransactionCoordinator:
     * Performing the temp-file + replace pattern used by the
       multi-graph writer so a partial write can never be observed on disk.
 
+    Because every write replaces a file instead of editing it in place, a
+    backup does not need its own copy of the bytes: it is a reflink
+    (``FICLONE``, on btrfs/XFS and similar) or, failing that, a hardlink
+    that keeps the original inode alive after the replace, and only a full
+    copy when neither is possible. Backups are kept next to the storage
+    index so both links stay on the same filesystem. Restoring replaces the
+    live file with a clone of the backup in the same way, and the graph
+    writer journals each original under a second name the same way before
+    replacing it. Graphs whose triples did not change are not rewritten.
+
     Context, plan, and plan-parameter are supplied once to the constructor
     so the first four operations do not require repeating them on every
     call. The pure graph writer is intentionally exposed as a classmethod
     because it has no dependency on CLI state.
     """
 
+    # linux/fs.h: _IOW(0x94, 9, int)
+    _FICLONE: int = 0x40049409
+
     _CONTEXT_PARAMETER_NAMES: tuple[str, ...] = (
         "container",
         "container_id",
@@ -62,7 +76,9 @@ class AttachmentTransactionCoordinator:
         backups: Any = self._plan.get("backups")
         if isinstance(backups, list) and backups:
             return
-        backup_dir: Path = Path(tempfile.mkdtemp(prefix="ontobdc-attach-"))
+        backup_dir: Path = self._make_backup_dir(
+            Path(self._plan["storage_file"]).parent
+        )
         source_files: List[Path] = [
             Path(self._plan["container_file"]),
             Path(self._plan["storage_file"]),
@@ -72,7 +88,7 @@ class AttachmentTransactionCoordinator:
         try:
             for index, source in enumerate(source_files):
                 backup: Path = backup_dir / f"{index:04d}-{source.name}"
-                shutil.copy2(source, backup)
+                self._clone_file(source, backup)
                 backup_entries.append(
                     {"source": str(source), "backup": str(backup)}
                 )
@@ -113,7 +129,12 @@ class AttachmentTransactionCoordinator:
                 source: Path = Path(entry["source"])
                 backup: Path = Path(entry["backup"])
                 source.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(backup, source)
+                restoring: Path = source.with_name(
+                    f".{source.name}.attach.restore"
+                )
+                restoring.unlink(missing_ok=True)
+                self._clone_file(backup, restoring)
+                restoring.replace(source)
             except Exception as error:
                 failures.append(f"{entry}: {error}")
         if failures:
@@ -126,16 +147,29 @@ class AttachmentTransactionCoordinator:
     def write_graphs_transactionally(
         cls,
         payloads: Dict[Path, Graph],
-    ) -> None:
+        baselines: Optional[Dict[Path, Collection[Tuple[Any, Any, Any]]]] = None,
+    ) -> List[Path]:
+        """Write every graph of ``payloads`` or none of them; return the paths written.
+
+        A path whose graph has exactly the triples of its ``baselines``
+        entry (the triples it was loaded with) and that still exists is
+        left untouched, without being serialized.
+        """
+        baselines = baselines or {}
+        changed: Dict[Path, Graph] = {
+            path: graph
+            for path, graph in payloads.items()
+            if path not in baselines
+            or not path.is_file()
+            or not cls._has_same_triples(graph, baselines[path])
+        }
         serialized: Dict[Path, bytes] = {
             path: graph.serialize(format="turtle", encoding="utf-8")
-            for path, graph in payloads.items()
+            for path, graph in changed.items()
         }
         temporary_paths: Dict[Path, Path] = {}
-        original_bytes: Dict[Path, Optional[bytes]] = {
-            path: path.read_bytes() if path.is_file() else None
-            for path in serialized
-        }
+        journal_paths: Dict[Path, Optional[Path]] = {}
+        replaced: List[Path] = []
         try:
             for path, content in serialized.items():
                 path.parent.mkdir(parents=True, exist_ok=True)
@@ -143,15 +177,24 @@ class AttachmentTransactionCoordinator:
                 temporary.write_bytes(content)
                 temporary_paths[path] = temporary
             for path, temporary in temporary_paths.items():
+                # Journal the original under a second name before replacing it.
+                journal: Optional[Path] = None
+                if path.is_file():
+                    journal = path.with_name(f".{path.name}.attach.orig")
+                    journal.unlink(missing_ok=True)
+                    cls._clone_file(path, journal)
+                journal_paths[path] = journal
                 temporary.replace(path)
+                replaced.append(path)
         except Exception as error:
             rollback_failures: List[str] = []
-            for path, content in original_bytes.items():
+            for path in replaced:
                 try:
-                    if content is None:
+                    journal = journal_paths[path]
+                    if journal is None:
                         path.unlink(missing_ok=True)
                     else:
-                        path.write_bytes(content)
+                        journal.replace(path)
                 except Exception as rollback_error:
                     rollback_failures.append(f"{path}: {rollback_error}")
             if rollback_failures:
@@ -162,3 +205,63 @@ class AttachmentTransactionCoordinator:
         finally:
             for temporary in temporary_paths.values():
                 temporary.unlink(missing_ok=True)
+            for journal in journal_paths.values():
+                if journal is not None:
+                    journal.unlink(missing_ok=True)
+        return replaced
+
+    @classmethod
+    def _has_same_triples(
+        cls,
+        graph: Graph,
+        baseline: Collection[Tuple[Any, Any, Any]],
+    ) -> bool:
+        return len(graph) == len(baseline) and all(
+            triple in baseline for triple in graph
+        )
+
+    @classmethod
+    def _make_backup_dir(cls, preferred_parent: Path) -> Path:
+        try:
+            return Path(
+                tempfile.mkdtemp(
+                    prefix=".ontobdc-attach-",
+                    dir=str(preferred_parent),
+                )
+            )
+        except OSError:
+            return Path(tempfile.mkdtemp(prefix="ontobdc-attach-"))
+
+    @classmethod
+    def _clone_file(cls, source: Path, target: Path) -> None:
+        """Give ``target`` the bytes of ``source``, sharing storage where possible."""
+        if cls._reflink(source, target):
+            return
+        try:
+            os.link(source, target)
+            return
+        except OSError:
+            pass
+        shutil.copy2(source, target)
+
+    @classmethod
+    def _reflink(cls, source: Path, target: Path) -> bool:
+        try:
+            import fcntl
+        except ImportError:
+            return False
+        try:
+            with source.open("rb") as source_stream, target.open("xb") as target_stream:
+                try:
+                    fcntl.ioctl(target_stream.fileno(), cls._FICLONE, source_stream.fileno())
+                except OSError:
+                    cloned: bool = False
+                else:
+                    cloned = True
+        except OSError:
+            return False
+        if not cloned:
+            target.unlink(missing_ok=True)
+            return False
+        shutil.copystat(source, target)
+        return True
@@ -6,7 +6,7 @@ import re
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Set
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Set, Tuple
 from urllib.parse import unquote, urlparse
 from urllib.request import url2pathname
 
@@ -243,6 +243,33 @@ class ContainerDataPackageSynchronizer:
         ]
         return sorted({p for p in relative_paths if p.strip()})
 
+    @classmethod
+    def list_container_inventory(
+        cls, container_path: Path
+    ) -> Tuple[List[str], List[str]]:
+        """Return ``list_resource_paths`` and ``list_container_file_paths`` from one walk.
+
+        Callers that need both listings (the view source fingerprints) avoid
+        walking the container tree twice.
+        """
+        resolved_container_path: Path = container_path.expanduser().resolve()
+        resource_paths: Set[str] = set()
+        file_paths: Set[str] = set()
+        for file_path in cls._iter_container_file_paths(container_path):
+            relative_path: str = file_path.relative_to(
+                resolved_container_path
+            ).as_posix()
+            if not relative_path.strip():
+                continue
+            if FrictionlessFormatRegistry.supports(
+                file_path.suffix.lower().lstrip(".")
+            ):
+                resource_paths.add(relative_path)
+            if not cls.is_file_blocked_from_publication(file_path.name):
+                file_paths.add(relative_path)
+
+        return sorted(resource_paths), sorted(file_paths)
+
     def sync(self, container_path: Path) -> ContainerDataPackageSyncResult:
         resolved_container_path: Path = container_path.expanduser().resolve()
         if not resolved_container_path.is_dir():
@@ -330,6 +357,98 @@ class ContainerDataPackageSynchronizer:
             removed_resource_count=removed_resource_count,
         )
 
+    def sync_resource(
+        self,
+        container_path: Path,
+        relative_path: str,
+    ) -> ContainerDataPackageSyncResult:
+        """Refresh the descriptor entry of one container file, leaving the rest as-is.
+
+        For callers that just wrote a single file into an already
+        synchronized container: the entry is added, updated in place or
+        removed (when the file is gone or not frictionless-compatible) at
+        the position ``sync`` would give it, without walking the container
+        or rebuilding the other descriptors. The descriptor is only
+        rewritten when the entry changed.
+        """
+        resolved_container_path: Path = container_path.expanduser().resolve()
+        if not resolved_container_path.is_dir():
+            raise ValueError(
+                f"Container path is not a directory: {resolved_container_path}"
+            )
+
+        marker_dir: Path = resolved_container_path / StorageLayoutConstants.ONTOBDC_DIRECTORY_NAME
+        marker_dir.mkdir(parents=True, exist_ok=True)
+        datapackage_path: Path = (
+            marker_dir / self._CONTAINER_DATAPACKAGE_FILE_NAME
+        )
+
+        descriptor: Dict[str, Any] = self._load_descriptor(datapackage_path)
+        original_resources: List[Dict[str, Any]] = self._resource_descriptors(
+            descriptor
+        )
+        normalized_path: str = Path(relative_path).as_posix()
+        file_path: Path = resolved_container_path / normalized_path
+        is_resource: bool = (
+            file_path.is_file()
+            and FrictionlessFormatRegistry.supports(
+                file_path.suffix.lower().lstrip(".")
+            )
+        )
+
+        current_descriptor: Optional[Dict[str, Any]] = None
+        resources: List[Dict[str, Any]] = []
+        insert_at: int = 0
+        local_resource_count: int = 0
+        for resource_descriptor in original_resources:
+            managed_path: Optional[str] = self._managed_container_path(
+                resource_descriptor=resource_descriptor,
+                datapackage_path=datapackage_path,
+                container_path=resolved_container_path,
+            )
+            if managed_path == normalized_path:
+                if current_descriptor is None:
+                    current_descriptor = dict(resource_descriptor)
+                    insert_at = len(resources)
+                continue
+            if managed_path is not None:
+                local_resource_count += 1
+                if current_descriptor is None and managed_path < normalized_path:
+                    insert_at = len(resources) + 1
+            resources.append(dict(resource_descriptor))
+
+        added_resource_count: int = 0
+        updated_resource_count: int = 0
+        removed_resource_count: int = 0
+        if is_resource:
+            synchronized_descriptor: Dict[str, Any] = self._build_local_descriptor(
+                relative_path=normalized_path,
+                container_path=resolved_container_path,
+                datapackage_path=datapackage_path,
+                existing_descriptor=current_descriptor,
+            )
+            resources.insert(insert_at, synchronized_descriptor)
+            if current_descriptor is None:
+                added_resource_count = 1
+            elif synchronized_descriptor != current_descriptor:
+                updated_resource_count = 1
+        elif current_descriptor is not None:
+            removed_resource_count = 1
+
+        if added_resource_count or updated_resource_count or removed_resource_count:
+            descriptor.setdefault("name", "ontobdc_container")
+            descriptor["resources"] = resources
+            self._write_descriptor(datapackage_path, descriptor)
+
+        return ContainerDataPackageSyncResult(
+            datapackage_path=datapackage_path,
+            resource_count=len(resources),
+            local_resource_count=local_resource_count + int(is_resource),
+            added_resource_count=added_resource_count,
+            updated_resource_count=updated_resource_count,
+            removed_resource_count=removed_resource_count,
+        )
+
     def _load_descriptor(self, datapackage_path: Path) -> Dict[str, Any]:
         if not datapackage_path.is_file():
             return {}
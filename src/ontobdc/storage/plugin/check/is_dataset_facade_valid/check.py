@@ -5,6 +5,7 @@ from rdflib import Graph, URIRef
 from rdflib.namespace import DCTERMS, RDF
 
 from ontobdc.shared.adapter.config import UnsetProjectRootConfigDataAdapter
+from ontobdc.shared.adapter.local_name_index import LocalNameIndex
 from ontobdc.shared.adapter.ontology import OntologyConfigAdapter
 from ontobdc.storage.adapter.bootstrap import (
     get_dataset_storage_file_path,
@@ -94,13 +95,6 @@ def _resolve_facade_uri(
     return values[0]
 
 
-def _local_name(predicate: URIRef) -> str:
-    predicate_value: str = str(predicate).strip()
-    if "#" in predicate_value:
-        return predicate_value.rsplit("#", 1)[-1].strip()
-    return predicate_value.rstrip("/").rsplit("/", 1)[-1].strip()
-
-
 def _facade_describes(
     facade_graph: Graph,
     entity_type: URIRef,
@@ -111,15 +105,14 @@ def _facade_describes(
     the facade concept must expose at least one *hasFacadeField* — matching
     the structure ContainerEntityInstanceRepository reads for LIST.
     """
-    is_linked: bool = any(
-        _local_name(predicate) == "hasDataEntityFacade"
+    if not any(
+        LocalNameIndex.local_name(predicate) == "hasDataEntityFacade"
         for _, predicate, _ in facade_graph.triples((entity_type, None, facade_uri))
-    )
-    if not is_linked:
+    ):
         return False
 
     return any(
-        _local_name(predicate) == "hasFacadeField"
+        LocalNameIndex.local_name(predicate) == "hasFacadeField"
         for _, predicate, _ in facade_graph.triples((facade_uri, None, None))
     )
 
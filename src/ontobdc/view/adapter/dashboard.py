@@ -12,11 +12,13 @@ from rdflib.namespace import DCTERMS, RDF, RDFS
 
 from ontobdc.cli.domain.port.context import CliContextPort
 from ontobdc.storage.adapter.manifest import ContainerDataPackageSynchronizer
+from ontobdc.view.adapter.fingerprint import SourceFingerprintService
+from ontobdc.shared.adapter.metadata_index import MetadataFileLocationIndex
 from ontobdc.view.adapter.publication import (
     calculate_options_fingerprint,
     calculate_source_fingerprint,
-    gather_view_data,
     is_data_gathered,
+    load_or_gather_view_data,
     resolve_container_path,
     resolve_view_options,
 )
@@ -432,9 +434,14 @@ _FALLBACK_LOGO_SVG = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 400
 
 def generate_project_dashboard(context: CliContextPort) -> Dict[str, Any]:
     """Generate the approved InfoBIM project dashboard at the container root."""
+    with SourceFingerprintService.run():
+        return _generate_project_dashboard(context)
+
+
+def _generate_project_dashboard(context: CliContextPort) -> Dict[str, Any]:
     container_path = resolve_container_path(context)
     options = resolve_view_options(context)
-    payload = gather_view_data(context)
+    payload = load_or_gather_view_data(context)
     project = _project_metadata(container_path, payload)
 
     source_fingerprint = str(payload["source_fingerprint"])
@@ -453,7 +460,12 @@ def generate_project_dashboard(context: CliContextPort) -> Dict[str, Any]:
             options_fingerprint=options_fingerprint,
         ),
     )
-    ContainerDataPackageSynchronizer().sync(container_path)
+    # The other resources were synchronized when the view data was gathered,
+    # and is_data_gathered() only reuses that data while they are unchanged.
+    ContainerDataPackageSynchronizer().sync_resource(
+        container_path,
+        index_path.name,
+    )
 
     return {
         "container_path": str(container_path),
@@ -471,6 +483,11 @@ def generate_project_dashboard(context: CliContextPort) -> Dict[str, Any]:
 
 
 def is_project_dashboard_generated(context: CliContextPort) -> bool:
+    with SourceFingerprintService.run():
+        return _is_project_dashboard_generated(context)
+
+
+def _is_project_dashboard_generated(context: CliContextPort) -> bool:
     try:
         container_path = resolve_container_path(context)
         options = resolve_view_options(context)
@@ -549,16 +566,17 @@ def _project_metadata_files(container_path: Path) -> Iterable[Path]:
         if candidate.is_file():
             yield candidate
 
-    try:
-        for candidate in container_path.rglob("project.ttl"):
-            resolved = candidate.resolve()
-            if resolved in yielded:
-                continue
-            yielded.add(resolved)
-            if candidate.is_file():
-                yield candidate
-    except OSError:
-        return
+    index = MetadataFileLocationIndex.for_container(
+        container_path,
+        file_names=("project.ttl",),
+    )
+    for candidate in index.locations("project.ttl"):
+        resolved = candidate.resolve()
+        if resolved in yielded:
+            continue
+        yielded.add(resolved)
+        if candidate.is_file():
+            yield candidate
 
 
 def _project_subject(graph: Graph) -> Optional[URIRef]:
@@ -0,0 +1,243 @@
+import hashlib
+import json
+import os
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ontobdc.storage.adapter.bootstrap import StorageBootstrap, StoragePathStatHelper
+from ontobdc.storage.adapter.manifest import ContainerDataPackageSynchronizer
+
+
+class SourceFingerprintService:
+    """Fingerprints of the container files a view is built from.
+
+    Each file contributes its container-relative path plus, in the default
+    ``stat`` mode, its size and ``st_mtime_ns``; inode, link count, owner
+    and device are left out so a checkout or copy that keeps timestamps
+    keeps the fingerprint. In ``content`` mode it contributes the SHA-256
+    of its bytes instead, which is stable across copies, clones and
+    machines. Content hashes are cached per file under
+    `.__ontobdc__/cache/source-fingerprints.json` and reused while the
+    file's ``st_mtime_ns``/``st_size`` match, so only changed files are
+    read again. The mode defaults to the ``ONTOBDC_FINGERPRINT_MODE``
+    environment variable, falling back to ``stat``.
+
+    Both fingerprints come from a single walk of the container tree. Inside
+    ``run()`` the walk and the fingerprints are also memoized per container
+    and mode, so the publication checks of one command share them.
+    """
+
+    CACHE_FILENAME: ClassVar[str] = "source-fingerprints.json"
+    CACHE_VERSION: ClassVar[int] = 1
+    MODE_ENVIRONMENT_VARIABLE: ClassVar[str] = "ONTOBDC_FINGERPRINT_MODE"
+    MODES: ClassVar[Tuple[str, ...]] = ("stat", "content")
+
+    _run_memo: ClassVar[Optional[Dict[Tuple[str, str, str], Any]]] = None
+    _run_depth: ClassVar[int] = 0
+
+    def __init__(self, container_path: Path, *, mode: Optional[str] = None) -> None:
+        self._container_path: Path = Path(container_path).expanduser().resolve()
+        self._mode: str = str(
+            mode or os.environ.get(self.MODE_ENVIRONMENT_VARIABLE) or "stat"
+        ).strip().lower()
+        if self._mode not in self.MODES:
+            raise ValueError(
+                f"Unsupported fingerprint mode: {self._mode}. "
+                f"Supported values: {', '.join(self.MODES)}."
+            )
+        self._entries: Optional[Dict[str, List[Any]]] = None
+        self._entries_changed: bool = False
+
+    @classmethod
+    @contextmanager
+    def run(cls) -> Iterator[None]:
+        """Memoize walks and fingerprints until the outermost block exits."""
+        if not cls._run_depth:
+            cls._run_memo = {}
+        cls._run_depth += 1
+        try:
+            yield
+        finally:
+            cls._run_depth -= 1
+            if not cls._run_depth:
+                cls._run_memo = None
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def cache_path(self) -> Path:
+        return self._container_path / ".__ontobdc__" / "cache" / self.CACHE_FILENAME
+
+    def resource_paths(self) -> List[str]:
+        """`ContainerDataPackageSynchronizer.list_resource_paths`, from the shared walk."""
+        return list(self._inventory()[0])
+
+    def container_file_paths(self) -> List[str]:
+        """`ContainerDataPackageSynchronizer.list_container_file_paths`, from the shared walk."""
+        return list(self._inventory()[1])
+
+    def source_fingerprint(self, *, excluded_paths: Iterable[str] = ()) -> str:
+        """Fingerprint `container.ttl` and the Data Package resources of the container."""
+        excluded: Tuple[str, ...] = tuple(sorted(set(excluded_paths)))
+        return self._memoized(
+            f"source:{','.join(excluded)}",
+            lambda: self._source_fingerprint(excluded),
+        )
+
+    def surface_fingerprint(self, *, excluded_paths: Iterable[str] = ()) -> str:
+        """Fingerprint everything the Surface's DATA_GATHERED step reads.
+
+        The source fingerprint only covers the frictionless-parseable
+        resources of the Data Package. The Surface also lists every
+        container file and merges each direct child dataset's
+        ``dataset.ttl``, ``linkset/facade.ttl``, ``datapackage.json`` and
+        payload files, so those are covered as well.
+        """
+        excluded: Tuple[str, ...] = tuple(sorted(set(excluded_paths)))
+        return self._memoized(
+            f"surface:{','.join(excluded)}",
+            lambda: self._surface_fingerprint(excluded),
+        )
+
+    def _source_fingerprint(self, excluded: Tuple[str, ...]) -> str:
+        digest = self._new_digest()
+        metadata_path: Path = StorageBootstrap.get_container_storage_file_path(self._container_path)
+        if not metadata_path.is_file():
+            raise ValueError(f"Container metadata not found: {metadata_path}")
+        self._update_digest(digest, self._relative_path(metadata_path))
+        for relative_path in self._inventory()[0]:
+            if relative_path not in excluded:
+                self._update_digest(digest, relative_path)
+        self._save_entries()
+        return digest.hexdigest()
+
+    def _surface_fingerprint(self, excluded: Tuple[str, ...]) -> str:
+        digest = self._new_digest()
+        digest.update(self.source_fingerprint(excluded_paths=excluded).encode("ascii"))
+        for relative_path in self._inventory()[1]:
+            self._update_digest(digest, relative_path)
+
+        for dataset_path in sorted(
+            candidate
+            for candidate in self._container_path.iterdir()
+            if candidate.is_dir()
+            and StorageBootstrap.get_dataset_storage_file_path(candidate).is_file()
+        ):
+            metadata_directory: Path = StorageBootstrap.get_ontobdc_directory(dataset_path)
+            for metadata_path in (
+                StorageBootstrap.get_dataset_storage_file_path(dataset_path),
+                metadata_directory / "linkset" / "facade.ttl",
+                metadata_directory / "datapackage.json",
+            ):
+                if metadata_path.is_file():
+                    self._update_digest(digest, self._relative_path(metadata_path))
+            for relative_path in ContainerDataPackageSynchronizer.list_container_file_paths(dataset_path):
+                self._update_digest(digest, f"{dataset_path.name}/{relative_path}")
+        self._save_entries()
+        return digest.hexdigest()
+
+    def _inventory(self) -> Tuple[List[str], List[str]]:
+        return self._memoized(
+            "inventory",
+            lambda: ContainerDataPackageSynchronizer.list_container_inventory(self._container_path),
+        )
+
+    def _memoized(self, kind: str, compute: Any) -> Any:
+        memo: Optional[Dict[Tuple[str, str, str], Any]] = type(self)._run_memo
+        if memo is None:
+            return compute()
+        key: Tuple[str, str, str] = (str(self._container_path), self._mode, kind)
+        if key not in memo:
+            memo[key] = compute()
+        return memo[key]
+
+    def _new_digest(self) -> Any:
+        return hashlib.sha256(f"{self._mode}\0".encode("ascii"))
+
+    def _relative_path(self, file_path: Path) -> str:
+        return file_path.relative_to(self._container_path).as_posix()
+
+    def _update_digest(self, digest: Any, relative_path: str) -> None:
+        file_path: Path = StorageBootstrap.to_extended_length_path(self._container_path / relative_path)
+        stat_result: Any = StoragePathStatHelper.safe_stat(file_path)
+        if stat_result is None:
+            raise ValueError(f"Cannot stat resource for fingerprint: {self._container_path / relative_path}")
+
+        digest.update(relative_path.encode("utf-8"))
+        digest.update(b"\0")
+        if self._mode == "content":
+            digest.update(bytes.fromhex(self._content_hash(file_path, relative_path, stat_result)))
+        else:
+            digest.update(
+                struct.pack(
+                    "<QQ",
+                    int(stat_result.st_size) & 0xFFFFFFFFFFFFFFFF,
+                    int(stat_result.st_mtime_ns) & 0xFFFFFFFFFFFFFFFF,
+                )
+            )
+        digest.update(b"\0")
+
+    def _content_hash(self, file_path: Path, relative_path: str, stat_result: Any) -> str:
+        entries: Dict[str, List[Any]] = self._load_entries()
+        signature: List[int] = [int(stat_result.st_mtime_ns), int(stat_result.st_size)]
+        entry: Optional[List[Any]] = entries.get(relative_path)
+        if entry is not None and entry[:2] == signature:
+            return str(entry[2])
+
+        file_digest = hashlib.sha256()
+        try:
+            with file_path.open("rb") as stream:
+                for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+                    file_digest.update(chunk)
+        except OSError as error:
+            raise ValueError(f"Cannot read resource for fingerprint: {file_path}") from error
+        entries[relative_path] = [*signature, file_digest.hexdigest()]
+        self._entries_changed = True
+        return file_digest.hexdigest()
+
+    def _load_entries(self) -> Dict[str, List[Any]]:
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if self.cache_path.is_file():
+            try:
+                payload: Any = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            if isinstance(payload, dict) and payload.get("version") == self.CACHE_VERSION:
+                self._entries = {
+                    str(relative_path): list(entry)
+                    for relative_path, entry in dict(payload.get("files") or {}).items()
+                    if isinstance(entry, list) and len(entry) == 3
+                }
+        return self._entries
+
+    def _save_entries(self) -> None:
+        if not self._entries_changed or self._entries is None:
+            return
+        self._entries_changed = False
+        entries: Dict[str, List[Any]] = {
+            relative_path: entry
+            for relative_path, entry in self._entries.items()
+            if (self._container_path / relative_path).exists()
+        }
+        self._entries = entries
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path: Path = self.cache_path.with_name(f".{self.cache_path.name}.tmp")
+            temporary_path.write_text(
+                json.dumps(
+                    {"version": self.CACHE_VERSION, "files": entries},
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+            temporary_path.replace(self.cache_path)
+        except OSError:
+            # A read-only container still fingerprints; it just re-reads the files next time.
+            return
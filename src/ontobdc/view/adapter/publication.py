@@ -5,7 +5,6 @@ import html
 import json
 import mimetypes
 import re
-import struct
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
@@ -17,7 +16,6 @@ from ontobdc.cli.domain.port.context import CliContextPort
 from ontobdc.storage.adapter.bootstrap import (
     StorageBootstrap,
     StorageNamespaceBootstrap,
-    StoragePathStatHelper,
 )
 from ontobdc.storage.adapter.manifest import (
     ContainerDataPackageSynchronizer,
@@ -28,6 +26,7 @@ from ontobdc.storage.plugin.check.is_container_datapackage_frictionless_valid.ho
 from ontobdc.storage.plugin.check.is_container_datapackage_ro_crate_synced.hotfix import (
     main as hotfix_container_datapackage_ro_crate_synced,
 )
+from ontobdc.view.adapter.fingerprint import SourceFingerprintService
 
 StorageNamespaceBootstrap.initialize()
 _OBDC = StorageNamespaceBootstrap.OBDC
@@ -121,7 +120,7 @@ def is_publishable(context: CliContextPort) -> bool:
         _container_metadata(container_path)
         descriptor = _load_datapackage(container_path)
         expected_paths = set(
-            ContainerDataPackageSynchronizer.list_resource_paths(container_path)
+            SourceFingerprintService(container_path).resource_paths()
         )
         described_paths = set(
             _descriptor_local_paths(container_path, descriptor)
@@ -187,12 +186,21 @@ def is_data_gathered(context: CliContextPort) -> bool:
         return False
 
 
+def load_or_gather_view_data(context: CliContextPort) -> Dict[str, Any]:
+    """Return the gathered view data, re-gathering only when it is stale."""
+    if not is_data_gathered(context):
+        return gather_view_data(context)
+    return _load_view_data(resolve_container_path(context))
+
+
 def generate_container_view(context: CliContextPort) -> Dict[str, Any]:
+    with SourceFingerprintService.run():
+        return _generate_container_view(context)
+
+
+def _generate_container_view(context: CliContextPort) -> Dict[str, Any]:
     container_path = resolve_container_path(context)
-    if not is_data_gathered(context):
-        payload = gather_view_data(context)
-    else:
-        payload = _load_view_data(container_path)
+    payload = load_or_gather_view_data(context)
 
     index_path = container_path / GENERATED_INDEX_FILE
     _atomic_write_text(index_path, _render_html(payload))
@@ -209,6 +217,11 @@ def generate_container_view(context: CliContextPort) -> Dict[str, Any]:
 
 
 def is_generated(context: CliContextPort) -> bool:
+    with SourceFingerprintService.run():
+        return _is_generated(context)
+
+
+def _is_generated(context: CliContextPort) -> bool:
     try:
         container_path = resolve_container_path(context)
         options = resolve_view_options(context)
@@ -240,28 +253,19 @@ def view_data_path(container_path: Path) -> Path:
 
 
 def calculate_source_fingerprint(container_path: Path) -> str:
-    resolved = container_path.expanduser().resolve()
-    digest = hashlib.sha256()
-
-    metadata_path = StorageBootstrap.get_container_storage_file_path(resolved)
-    if not metadata_path.is_file():
-        raise ValueError(f"Container metadata not found: {metadata_path}")
-    _update_file_digest(
-        digest,
-        metadata_path,
-        ".__ontobdc__/container.ttl",
+    return SourceFingerprintService(container_path).source_fingerprint(
+        excluded_paths=(GENERATED_INDEX_FILE,)
     )
 
-    for relative_path in ContainerDataPackageSynchronizer.list_resource_paths(resolved):
-        if relative_path == GENERATED_INDEX_FILE:
-            continue
-        _update_file_digest(
-            digest,
-            resolved / relative_path,
-            relative_path,
-        )
 
-    return digest.hexdigest()
+def calculate_surface_source_fingerprint(container_path: Path) -> str:
+    """Fingerprint everything the Surface's DATA_GATHERED step reads.
+
+    See ``SourceFingerprintService.surface_fingerprint``.
+    """
+    return SourceFingerprintService(container_path).surface_fingerprint(
+        excluded_paths=(GENERATED_INDEX_FILE,)
+    )
 
 
 def calculate_options_fingerprint(options: Dict[str, str]) -> str:
@@ -273,42 +277,6 @@ def calculate_options_fingerprint(options: Dict[str, str]) -> str:
     return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
 
 
-def _update_file_digest(
-    digest: Any,
-    file_path: Path,
-    relative_path: str,
-) -> None:
-    safe_path: Path = StorageBootstrap.to_extended_length_path(file_path)
-    stat_result: Any = StoragePathStatHelper.safe_stat(safe_path)
-    if stat_result is None:
-        raise ValueError(f"Cannot stat resource for fingerprint: {file_path}")
-
-    size: int = int(stat_result.st_size)
-    mtime_ns: int = int(stat_result.st_mtime_ns)
-    ino: int = int(getattr(stat_result, "st_ino", 0))
-    dev: int = int(getattr(stat_result, "st_dev", 0))
-    nlink: int = int(getattr(stat_result, "st_nlink", 0))
-    mode: int = int(getattr(stat_result, "st_mode", 0))
-    uid: int = int(getattr(stat_result, "st_uid", 0))
-    gid: int = int(getattr(stat_result, "st_gid", 0))
-
-    digest.update(relative_path.encode("utf-8"))
-    digest.update(b"\0")
-    digest.update(
-        struct.pack(
-            "<QQQQQQQ",
-            size & 0xFFFFFFFFFFFFFFFF,
-            mtime_ns & 0xFFFFFFFFFFFFFFFF,
-            ino & 0xFFFFFFFFFFFFFFFF,
-            dev & 0xFFFFFFFFFFFFFFFF,
-            nlink & 0xFFFFFFFFFFFFFFFF,
-            mode & 0xFFFFFFFFFFFFFFFF,
-            (uid << 32 | (gid & 0xFFFFFFFF)) & 0xFFFFFFFFFFFFFFFF,
-        )
-    )
-    digest.update(b"\0")
-
-
 def _container_metadata(container_path: Path) -> Dict[str, str]:
     metadata_path = StorageBootstrap.get_container_storage_file_path(container_path)
     if not metadata_path.is_file():
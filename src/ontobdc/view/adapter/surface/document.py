@@ -2,7 +2,7 @@ import html
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 
 STATE_META_NAME = "ontobdc:surface-state"
@@ -16,6 +16,189 @@ SURFACE_TAG = "onto-presentation-surface"
 _CUSTOM_ELEMENT_RE = re.compile(r"^[a-z][a-z0-9._-]*-[a-z0-9._-]+$")
 
 
+_SCRIPT_BLOCK_RE = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+_SCRIPT_ID_RE = re.compile(r"\bid=[\"']([^\"']*)[\"']", re.IGNORECASE)
+_STATE_MARKER_RE = re.compile(
+    rf"<meta\s+name=[\"']{re.escape(STATE_META_NAME)}[\"']"
+    rf"\s+content=[\"']([^\"']*)[\"']\s*/?>",
+    re.IGNORECASE,
+)
+
+_SegmentKey = Optional[Tuple[str, str]]
+
+
+class SurfaceDocument:
+    """A Surface `index.html` parsed once into addressable segments.
+
+    The document is split around every `<script id=...>` block, the state
+    marker `<meta>` and the first `</head>` and `</body>`; everything else
+    is kept as opaque text. Replacing a script block or the state marker
+    swaps one segment, and inserting one splices new segments in front of
+    the closing tag, so neither re-scans the HTML. `text` joins the
+    segments once per edited version. Whole-document rewrites (tile markup,
+    component scripts) go through `replace_text`, which re-indexes.
+
+    Derived values, e.g. check results, can be cached per version with
+    `memo`; any edit drops them. Output is byte-identical to the
+    module-level string functions, which remain the reference behaviour.
+    """
+
+    def __init__(self, text: str) -> None:
+        self._segments: List[List[Any]] = []
+        self._text: Optional[str] = None
+        self._memo: Dict[str, Any] = {}
+        self._index(text)
+
+    def copy(self) -> "SurfaceDocument":
+        clone = SurfaceDocument.__new__(SurfaceDocument)
+        clone._segments = [list(segment) for segment in self._segments]
+        clone._text = self._text
+        clone._memo = {}
+        return clone
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "".join(segment[1] for segment in self._segments)
+        return self._text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def replace_text(self, text: str) -> "SurfaceDocument":
+        if text != self._text:
+            self._index(text)
+        return self
+
+    def state_marker(self) -> Optional[str]:
+        segment = self._segment(("marker", ""))
+        if segment is None:
+            return None
+        match = _STATE_MARKER_RE.match(segment[1])
+        value = match.group(1).strip() if match else ""
+        return value or None
+
+    def set_state_marker(self, state_name: str) -> "SurfaceDocument":
+        marker = (
+            f'<meta name="{STATE_META_NAME}" '
+            f'content="{html.escape(state_name, quote=True)}">'
+        )
+        return self._upsert(("marker", ""), marker, "head")
+
+    def script_body(self, script_id: str) -> Optional[str]:
+        segment = self._segment(("script", script_id))
+        if segment is None:
+            return None
+        block: str = segment[1]
+        return block[block.index(">") + 1 : block.rindex("</")]
+
+    def json_script(self, script_id: str) -> Any:
+        body = self.script_body(script_id)
+        if body is None:
+            raise ValueError(f"Missing script: {script_id}")
+        return json.loads(body.replace("<\\/", "</"))
+
+    def upsert_json_script(
+        self,
+        script_id: str,
+        payload: Any,
+        script_type: str = "application/json",
+    ) -> "SurfaceDocument":
+        return self._upsert(
+            ("script", script_id), _json_script(script_id, payload, script_type), "head"
+        )
+
+    def upsert_raw_script(
+        self,
+        script_id: str,
+        script_type: str,
+        body: str,
+    ) -> "SurfaceDocument":
+        return self._upsert(
+            ("script", script_id), _raw_script(script_id, script_type, body), "head"
+        )
+
+    def _index(self, text: str) -> None:
+        spans: List[Tuple[int, int, Tuple[str, str]]] = []
+        seen_keys = set()
+        for match in _SCRIPT_BLOCK_RE.finditer(text):
+            opening = match.group(0)[: match.group(0).index(">") + 1]
+            id_match = _SCRIPT_ID_RE.search(opening)
+            key = ("script", id_match.group(1)) if id_match else None
+            if key is not None and key not in seen_keys:
+                seen_keys.add(key)
+                spans.append((match.start(), match.end(), key))
+        script_spans = [(start, end) for start, end, _ in spans]
+
+        def outside_scripts(start: int, end: int) -> bool:
+            return not any(
+                start < script_end and script_start < end
+                for script_start, script_end in script_spans
+            )
+
+        for match in _STATE_MARKER_RE.finditer(text):
+            if outside_scripts(match.start(), match.end()):
+                spans.append((match.start(), match.end(), ("marker", "")))
+                break
+        for tag in ("head", "body"):
+            closing = f"</{tag}>"
+            position = text.find(closing)
+            while position != -1 and not outside_scripts(position, position + len(closing)):
+                position = text.find(closing, position + 1)
+            if position != -1:
+                spans.append((position, position + len(closing), ("close", tag)))
+
+        segments: List[List[Any]] = []
+        cursor = 0
+        for start, end, key in sorted(spans):
+            if start < cursor:
+                continue
+            if start > cursor:
+                segments.append([None, text[cursor:start]])
+            segments.append([key, text[start:end]])
+            cursor = end
+        if cursor < len(text):
+            segments.append([None, text[cursor:]])
+        self._segments = segments
+        self._changed(text)
+
+    def _segment(self, key: Tuple[str, str]) -> Optional[List[Any]]:
+        for segment in self._segments:
+            if segment[0] == key:
+                return segment
+        return None
+
+    def _upsert(self, key: Tuple[str, str], block: str, closing_tag: str) -> "SurfaceDocument":
+        segment = self._segment(key)
+        if segment is not None:
+            segment[1] = block
+            self._changed()
+            return self
+        closing = self._segment(("close", closing_tag))
+        if closing is None:
+            raise ValueError(
+                f"Surface document is missing a closing <{closing_tag}> tag; "
+                "refusing to insert content into a malformed document."
+            )
+        position = self._segments.index(closing)
+        self._segments[position:position] = [[None, "  "], [key, block], [None, "\n"]]
+        self._changed()
+        return self
+
+    def _changed(self, text: Optional[str] = None) -> None:
+        self._text = text
+        self._memo = {}
+
+
+def surface_text(document: Union[str, SurfaceDocument]) -> str:
+    return document.text if isinstance(document, SurfaceDocument) else document
+
+
 def resolve_surface_path(raw_path: Any) -> Path:
     if not isinstance(raw_path, (str, Path)) or not str(raw_path).strip():
         raise ValueError("surface_path is required")
@@ -92,7 +275,9 @@ def set_state_marker(document: str, state_name: str) -> str:
     return _insert_before_closing_tag(document, "head", marker)
 
 
-def get_state_marker(document: str) -> Optional[str]:
+def get_state_marker(document: Union[str, SurfaceDocument]) -> Optional[str]:
+    if isinstance(document, SurfaceDocument):
+        return document.state_marker()
     pattern = re.compile(
         rf"<meta\s+name=[\"']{re.escape(STATE_META_NAME)}[\"']"
         rf"\s+content=[\"']([^\"']+)[\"']\s*/?>",
@@ -128,14 +313,18 @@ def upsert_json_script(
     return _insert_before_closing_tag(document, "head", replacement)
 
 
+def _raw_script(script_id: str, script_type: str, body: str) -> str:
+    safe_body = body.replace("</script>", "<\\/script>")
+    return f'<script type="{script_type}" id="{script_id}">\n{safe_body}\n</script>'
+
+
 def upsert_raw_script(
     document: str,
     script_id: str,
     script_type: str,
     body: str,
 ) -> str:
-    safe_body = body.replace("</script>", "<\\/script>")
-    replacement = f'<script type="{script_type}" id="{script_id}">\n{safe_body}\n</script>'
+    replacement = _raw_script(script_id, script_type, body)
     pattern = re.compile(
         rf"<script\b[^>]*\bid=[\"']{re.escape(script_id)}[\"'][^>]*>"
         rf".*?</script>",
@@ -146,7 +335,9 @@ def upsert_raw_script(
     return _insert_before_closing_tag(document, "head", replacement)
 
 
-def extract_json_script(document: str, script_id: str) -> Any:
+def extract_json_script(document: Union[str, SurfaceDocument], script_id: str) -> Any:
+    if isinstance(document, SurfaceDocument):
+        return document.json_script(script_id)
     pattern = re.compile(
         rf"<script\b[^>]*\bid=[\"']{re.escape(script_id)}[\"'][^>]*>"
         rf"(.*?)</script>",
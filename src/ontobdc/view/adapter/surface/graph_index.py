@@ -0,0 +1,79 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class IndexedGraphNodes(list):
+    """The Surface JSON-LD node list, plus `@id` and `@type` lookups.
+
+    Entity view renderers receive the graph as `graph_nodes`; resolving a
+    related entity by scanning that list costs a pass over every node, per
+    lookup, per page. This is still the plain list those renderers expect
+    (it serializes and iterates exactly like one), built once per
+    publication run with the lookups a renderer can use instead:
+    `node(id)`, `nodes_of_type(type_uri)`, and `neighbourhood(node)`, the
+    nodes a node references through `{"@id": ...}` values plus the nodes
+    that reference it. The index is a snapshot of the list at construction;
+    mutating the list afterwards does not update it.
+    """
+
+    def __init__(self, nodes: Iterable[Dict[str, Any]] = ()) -> None:
+        super().__init__(nodes)
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_type: Dict[str, List[Dict[str, Any]]] = {}
+        self._referrers: Dict[str, List[str]] = {}
+        for node in self:
+            node_id: str = str(node.get("@id") or "")
+            if node_id:
+                self._by_id.setdefault(node_id, node)
+            for type_uri in self.type_uris(node):
+                self._by_type.setdefault(type_uri, []).append(node)
+            if node_id:
+                for referenced_id in self._referenced_ids(node):
+                    self._referrers.setdefault(referenced_id, []).append(node_id)
+
+    def __reduce__(self) -> Tuple[Any, Tuple[List[Dict[str, Any]]]]:
+        # Ship only the nodes to worker processes; the lookups are rebuilt there.
+        return (IndexedGraphNodes, (list(self),))
+
+    @staticmethod
+    def type_uris(node: Dict[str, Any]) -> List[str]:
+        raw_type = node.get("@type")
+        if isinstance(raw_type, str):
+            return [raw_type]
+        if isinstance(raw_type, list):
+            return [str(item) for item in raw_type]
+        return []
+
+    def node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        return self._by_id.get(str(node_id or ""))
+
+    def nodes_of_type(self, type_uri: str) -> List[Dict[str, Any]]:
+        return list(self._by_type.get(str(type_uri or ""), ()))
+
+    def neighbourhood(self, node: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the nodes `node` references or is referenced by, in graph order of discovery."""
+        node_id: str = str(node.get("@id") or "")
+        seen: Set[str] = {node_id}
+        related: List[Dict[str, Any]] = []
+        for related_id in [*self._referenced_ids(node), *self._referrers.get(node_id, ())]:
+            if related_id in seen:
+                continue
+            seen.add(related_id)
+            related_node: Optional[Dict[str, Any]] = self._by_id.get(related_id)
+            if related_node is not None:
+                related.append(related_node)
+        return related
+
+    def _referenced_ids(self, node: Dict[str, Any]) -> Iterator[str]:
+        for key, value in node.items():
+            if key == "@id":
+                continue
+            yield from self._value_ids(value)
+
+    def _value_ids(self, value: Any) -> Iterator[str]:
+        if isinstance(value, list):
+            for item in value:
+                yield from self._value_ids(item)
+        elif isinstance(value, dict):
+            referenced_id: Any = value.get("@id")
+            if isinstance(referenced_id, str) and referenced_id:
+                yield referenced_id
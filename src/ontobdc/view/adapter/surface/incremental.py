@@ -0,0 +1,101 @@
+import hashlib
+import json
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ontobdc.cli.domain.port.context import CliContextPort
+from ontobdc.view.adapter.publication import (
+    calculate_options_fingerprint,
+    calculate_surface_source_fingerprint,
+)
+from ontobdc.view.adapter.surface.context import SurfaceContextAdapter
+
+
+class SurfaceRunStamp:
+    """Fingerprints of the inputs the last completed `ontobdc view` run used.
+
+    The Surface pipeline's inputs fall into two stages: the container and
+    dataset data that `DATA_GATHERED` materializes (`data`), and everything
+    only the HTML Surface itself depends on, i.e. the view options, the
+    configured Surface layouts file and the installed `ontobdc`/
+    `ontobdc-view` versions (`surface`). `ViewCommand` compares the current
+    fingerprints with the stamp to decide how much of the previous run's
+    output it can keep. The stamp lives under
+    `.__ontobdc__/view/surface-stamp.json`, outside the ETL state directory
+    that a data change removes.
+    """
+
+    STAMP_FILENAME: str = "surface-stamp.json"
+    STAMP_VERSION: int = 1
+
+    def __init__(self, container_path: Path) -> None:
+        self._container_path: Path = Path(container_path).expanduser().resolve()
+
+    @property
+    def path(self) -> Path:
+        return self._container_path / ".__ontobdc__" / "view" / self.STAMP_FILENAME
+
+    def fingerprints(self, context: CliContextPort) -> Dict[str, str]:
+        return {
+            "data": calculate_surface_source_fingerprint(self._container_path),
+            "surface": self._surface_fingerprint(context),
+        }
+
+    def load(self) -> Dict[str, str]:
+        if not self.path.is_file():
+            return {}
+        try:
+            payload: Any = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != self.STAMP_VERSION:
+            return {}
+        return {
+            str(key): str(value)
+            for key, value in dict(payload.get("fingerprints") or {}).items()
+        }
+
+    def save(self, fingerprints: Dict[str, str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path: Path = self.path.with_name(f".{self.path.name}.tmp")
+        temporary_path.write_text(
+            json.dumps(
+                {"version": self.STAMP_VERSION, "fingerprints": fingerprints},
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+        )
+        temporary_path.replace(self.path)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+    def _surface_fingerprint(self, context: CliContextPort) -> str:
+        digest = hashlib.sha256()
+        digest.update(
+            calculate_options_fingerprint(
+                {
+                    name: str(context.get_parameter_value(name) or "")
+                    for name in ("view_type", "representation", "language")
+                }
+            ).encode("ascii")
+        )
+        for distribution in ("ontobdc", "ontobdc-view"):
+            digest.update(f"{distribution}={self._distribution_version(distribution)}\0".encode("utf-8"))
+
+        layouts_path: Optional[Path] = None
+        try:
+            layouts_path = SurfaceContextAdapter().surface_layouts_path(context)
+        except Exception:
+            layouts_path = None
+        if layouts_path is not None and layouts_path.is_file():
+            digest.update(hashlib.sha256(layouts_path.read_bytes()).digest())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _distribution_version(distribution: str) -> str:
+        try:
+            return version(distribution)
+        except PackageNotFoundError:
+            return ""
@@ -10,6 +10,7 @@ from ontobdc.shared.domain.port.capability import CapabilityPort
 from ontobdc.shared.facade.adapter.logger import NullLogRepository
 from ontobdc.shared.facade.port.logger import LogRepositoryPort
 from ontobdc.view.adapter.surface.context import SurfaceContextAdapter
+from ontobdc.view.adapter.surface.session import SurfaceDocumentSession
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
 from ontobdc.view.domain.port.surface_machine import (
     SurfaceGenerationProcessStatePort,
@@ -176,10 +177,14 @@ class SurfaceGenerationStateTransitionHandler(SurfaceGenerationStateTransitionHa
         stop_state: SurfaceGenerationProcessStatePort,
     ) -> List[str]:
         worker = self._make_worker()
-        return worker.work(stop_state=stop_state)
+        with SurfaceDocumentSession.deferred_writes():
+            return worker.work(stop_state=stop_state)
 
     def execute(self) -> CommandResponse:
-        visited_states = self._make_worker().work()
+        # Every state edits the same in-memory Surface; index.html is written
+        # once when the run ends (or fails, keeping the last completed state).
+        with SurfaceDocumentSession.deferred_writes():
+            visited_states = self._make_worker().work()
         return CommandResponse(
             title="Presentation Surface Generated",
             description="The offline HTML Presentation Surface reached surface_validated.",
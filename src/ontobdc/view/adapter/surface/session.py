@@ -0,0 +1,89 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from ontobdc.view.adapter.surface.document import SurfaceDocument, read_surface, write_surface
+
+
+class SurfaceDocumentSession:
+    """Process-wide store of parsed Surface documents, keyed by path.
+
+    Capabilities and checks of one `ontobdc view` run all read the same
+    `index.html`; this keeps one parsed `SurfaceDocument` per path so the
+    checks share its cached results instead of each re-reading and
+    re-scanning the file. A cached document is reused while the file's
+    `st_mtime_ns`/`st_size` still match what was read or written, so an
+    edit made outside the session is picked up on the next `load`.
+
+    Inside `deferred_writes()` a `store` only replaces the in-memory
+    document; the file is serialized and written once when the outermost
+    block exits, including when it exits with an exception, so a failed
+    state still leaves the last completed state on disk for the next run
+    to resume from. Outside it, `store` writes through immediately.
+    """
+
+    _documents: Dict[Path, Tuple[Optional[Tuple[int, int]], SurfaceDocument]] = {}
+    _pending: Set[Path] = set()
+    _defer_depth: int = 0
+
+    @classmethod
+    def load(cls, path: Path) -> SurfaceDocument:
+        """Return the shared document of `path`; callers must not edit it (see `copy`)."""
+        path = Path(path)
+        cached = cls._documents.get(path)
+        if path in cls._pending and cached is not None:
+            return cached[1]
+        signature = cls._signature(path)
+        if signature is None:
+            cls._documents.pop(path, None)
+            raise FileNotFoundError(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        document = SurfaceDocument(read_surface(path))
+        cls._documents[path] = (signature, document)
+        return document
+
+    @classmethod
+    def exists(cls, path: Path) -> bool:
+        path = Path(path)
+        return path in cls._pending or path.is_file()
+
+    @classmethod
+    def store(cls, path: Path, document: SurfaceDocument) -> None:
+        path = Path(path)
+        if cls._defer_depth:
+            cls._documents[path] = (None, document)
+            cls._pending.add(path)
+            return
+        cls._write(path, document)
+
+    @classmethod
+    def flush(cls) -> None:
+        for path in sorted(cls._pending):
+            cls._write(path, cls._documents[path][1])
+        cls._pending.clear()
+
+    @classmethod
+    @contextmanager
+    def deferred_writes(cls) -> Iterator[None]:
+        cls._defer_depth += 1
+        try:
+            yield
+        finally:
+            cls._defer_depth -= 1
+            if not cls._defer_depth:
+                cls.flush()
+
+    @classmethod
+    def _write(cls, path: Path, document: SurfaceDocument) -> None:
+        write_surface(path, document.text)
+        cls._pending.discard(path)
+        cls._documents[path] = (cls._signature(path), document)
+
+    @staticmethod
+    def _signature(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
@@ -4,7 +4,8 @@ from typing import Callable
 
 from ontobdc.cli.domain.port.context import CliContextPort
 from ontobdc.view.adapter.surface.context import SurfaceContextAdapter
-from ontobdc.view.adapter.surface.document import read_surface, write_surface
+from ontobdc.view.adapter.surface.document import SurfaceDocument
+from ontobdc.view.adapter.surface.session import SurfaceDocumentSession
 
 
 class SurfaceTransformationAdapter:
@@ -13,7 +14,9 @@ class SurfaceTransformationAdapter:
     Composed by each `surface_*` capability instead of inherited, so a
     capability's type hierarchy stays limited to the Capability contract it
     actually implements — this adapter is not itself a Capability and has no
-    METADATA.
+    METADATA. Documents are read from and stored into
+    `SurfaceDocumentSession`, so every capability and check of a run works
+    on the same parsed `SurfaceDocument`.
     """
 
     _REQUIRE_CHECK_MAX_ATTEMPTS: int = 10
@@ -26,12 +29,13 @@ class SurfaceTransformationAdapter:
     def path(self, context: CliContextPort) -> Path:
         return self._context_adapter.surface_path(context)
 
-    def read(self, context: CliContextPort) -> str:
-        return read_surface(self.path(context))
+    def read(self, context: CliContextPort) -> SurfaceDocument:
+        """Return an editable copy of the run's shared Surface document."""
+        return SurfaceDocumentSession.load(self.path(context)).copy()
 
-    def write(self, context: CliContextPort, document: str) -> Path:
+    def write(self, context: CliContextPort, document: SurfaceDocument) -> Path:
         path = self.path(context)
-        write_surface(path, document)
+        SurfaceDocumentSession.store(path, document)
         context.set_parameter_value("surface_path", str(path))
         return path
 
@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from urllib.parse import quote
 
 from rdflib import Graph, Literal, URIRef
@@ -8,6 +8,7 @@ from rdflib.namespace import DCTERMS, RDF
 
 from ontobdc.cli.domain.port.context import CliContextPort
 from ontobdc.shared.adapter.capability import TransformationCapability
+from ontobdc.shared.adapter.local_name_index import LocalNameIndex
 from ontobdc.shared.domain.model.capability import CapabilityMetadata
 from ontobdc.storage.adapter.bootstrap import (
     StorageBootstrap,
@@ -244,12 +245,15 @@ class DataGatheredCapability(TransformationCapability):
             facade_graph.parse(str(facade_path), format="turtle")
         except Exception:
             return
+        facade_index: LocalNameIndex = LocalNameIndex(facade_graph)
+        row_indexes: Dict[URIRef, Dict[str, Dict[str, Any]]] = {}
 
         for entity_subject in entity_subjects:
             self._add_entity_field_values(
                 graph=graph,
                 local_graph=local_graph,
-                facade_graph=facade_graph,
+                facade_index=facade_index,
+                row_indexes=row_indexes,
                 dataset_path=dataset_path,
                 entity_subject=entity_subject,
             )
@@ -259,7 +263,8 @@ class DataGatheredCapability(TransformationCapability):
         *,
         graph: Graph,
         local_graph: Graph,
-        facade_graph: Graph,
+        facade_index: LocalNameIndex,
+        row_indexes: Dict[URIRef, Dict[str, Dict[str, Any]]],
         dataset_path: Path,
         entity_subject: URIRef,
     ) -> None:
@@ -273,7 +278,7 @@ class DataGatheredCapability(TransformationCapability):
         entity_type: URIRef = entity_types[0]
 
         fields: List[Dict[str, Any]] = self._resolve_facade_fields(
-            facade_graph, entity_type
+            facade_index, entity_type
         )
         if not fields:
             return
@@ -285,7 +290,15 @@ class DataGatheredCapability(TransformationCapability):
             return
         entity_identifier: str = str(identifiers[0]).strip()
 
-        row: Any = self._find_entity_row(dataset_path, entity_type, entity_identifier)
+        row_index: Optional[Dict[str, Dict[str, Any]]] = row_indexes.get(entity_type)
+        if row_index is None:
+            row_index = self._build_entity_row_index(
+                dataset_path,
+                entity_type,
+                columns=[str(field.get("name") or "").strip() for field in fields],
+            )
+            row_indexes[entity_type] = row_index
+        row: Optional[Dict[str, Any]] = row_index.get(entity_identifier)
         if row is None:
             return
 
@@ -304,52 +317,47 @@ class DataGatheredCapability(TransformationCapability):
 
     def _resolve_facade_fields(
         self,
-        facade_graph: Graph,
+        facade_index: LocalNameIndex,
         entity_type: URIRef,
     ) -> List[Dict[str, Any]]:
-        facade_subjects: List[URIRef] = [
-            obj
-            for _, predicate, obj in facade_graph.triples((entity_type, None, None))
-            if isinstance(obj, URIRef)
-            and self._local_name(predicate) == "hasDataEntityFacade"
-        ]
-        if not facade_subjects:
+        facade_subject: Optional[URIRef] = facade_index.first_uri(
+            entity_type, "hasDataEntityFacade"
+        )
+        if facade_subject is None:
             return []
 
         fields: List[Dict[str, Any]] = []
-        for _, predicate, field_subject in facade_graph.triples(
-            (facade_subjects[0], None, None)
-        ):
-            if (
-                self._local_name(predicate) != "hasFacadeField"
-                or not isinstance(field_subject, URIRef)
-            ):
+        for field_subject in facade_index.objects(facade_subject, "hasFacadeField"):
+            if not isinstance(field_subject, URIRef):
                 continue
 
-            identifier: Any = None
-            mapped_property: Any = None
-            for _, field_predicate, obj in facade_graph.triples(
-                (field_subject, None, None)
-            ):
-                local_name = self._local_name(field_predicate)
-                if local_name == "identifier":
-                    identifier = obj
-                elif local_name == "mapsToProperty" and isinstance(obj, URIRef):
-                    mapped_property = obj
-
-            if identifier is None:
+            identifiers: List[Any] = facade_index.objects(field_subject, "identifier")
+            if not identifiers:
                 continue
             fields.append(
-                {"name": str(identifier).strip(), "mapped_property": mapped_property}
+                {
+                    "name": str(identifiers[-1]).strip(),
+                    "mapped_property": facade_index.first_uri(field_subject, "mapsToProperty"),
+                }
             )
         return fields
 
-    def _find_entity_row(
+    def _build_entity_row_index(
         self,
         dataset_path: Path,
         entity_type: URIRef,
-        entity_identifier: str,
-    ) -> Any:
+        *,
+        columns: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Read the entity's instances once and key them by `GlobalId`.
+
+        Built lazily per (dataset, entity type) and reused for every entity
+        subject of that type, so a dataset with N entities costs one
+        resource read per type instead of one full read per entity. The
+        first row wins on a duplicate `GlobalId`, matching the old linear
+        scan. Only `GlobalId` and the facade's own columns are read from
+        each streamed row, and only those are kept in the instance cache.
+        """
         from ontobdc.context.adapter.dataset_instance import (
             DatasetEntityInstanceRepository,
         )
@@ -358,22 +366,18 @@ class DataGatheredCapability(TransformationCapability):
             repository = DatasetEntityInstanceRepository(
                 dataset_path=str(dataset_path),
                 entity=str(entity_type),
+                use_cache=True,
             )
-            payload: Dict[str, Any] = repository.list_instances()
+            row_index: Dict[str, Dict[str, Any]] = {}
+            for instance in repository.iter_instances(
+                columns=["GlobalId", *columns]
+            ):
+                global_id: str = str(instance.get("GlobalId") or "").strip()
+                if global_id and global_id not in row_index:
+                    row_index[global_id] = instance
         except Exception:
-            return None
-
-        for instance in list(payload.get("instances") or []):
-            if str(instance.get("GlobalId") or "").strip() == entity_identifier:
-                return instance
-        return None
-
-    @staticmethod
-    def _local_name(predicate: Any) -> str:
-        predicate_value: str = str(predicate).strip()
-        if "#" in predicate_value:
-            return predicate_value.rsplit("#", 1)[-1].strip()
-        return predicate_value.rstrip("/").rsplit("/", 1)[-1].strip()
+            return {}
+        return row_index
 
     def _dataset_paths(self, context: CliContextPort) -> List[Path]:
         container_path = self._container_path(context)
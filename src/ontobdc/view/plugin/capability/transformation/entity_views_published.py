@@ -1,14 +1,20 @@
+import hashlib
 import json
 import os
 import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 from ontobdc.cli.domain.port.context import CliContextPort
 from ontobdc.shared.adapter.capability import TransformationCapability
 from ontobdc.shared.domain.model.capability import CapabilityMetadata
-from ontobdc.view.adapter.surface.document import JSONLD_ID, extract_json_script, set_state_marker
+from ontobdc.view.adapter.surface.document import JSONLD_ID, SurfaceDocument, extract_json_script
+from ontobdc.view.adapter.surface.graph_index import IndexedGraphNodes
+from ontobdc.view.adapter.surface.session import SurfaceDocumentSession
 from ontobdc.view.adapter.surface.transformation import SurfaceTransformationAdapter
 from ontobdc.view.adapter.work_stream_script_machine import (
     WorkStreamScriptGenerationStateTransitionHandler,
@@ -19,6 +25,7 @@ from ontobdc.view.plugin.check.is_entity_views_published.check import (
 )
 
 _WORK_STREAM_PATH_SEGMENT = "work_stream"
+_MANIFEST_VERSION = 1
 
 
 def _atomic_write_text(path: Path, content: str, *, durable: bool = False) -> None:
@@ -44,6 +51,60 @@ def _atomic_write_text(path: Path, content: str, *, durable: bool = False) -> No
         raise
 
 
+class _BatchedPageWriter:
+    """Write published pages without a per-file fsync, then sync each
+    touched directory once on `close()`.
+
+    Every page still goes through `_atomic_write_text`'s temp-file-and-
+    replace, so a reader never sees a half-written page; the single
+    directory fsync per `path_segment` makes the batch's renames durable
+    without paying the storage round-trip once per page. Directories cannot
+    be opened for fsync on Windows, where `close()` is a no-op.
+    """
+
+    def __init__(self) -> None:
+        self._directories: Set[Path] = set()
+
+    def write(self, path: Path, content: str) -> None:
+        _atomic_write_text(path, content, durable=False)
+        self._directories.add(path.parent)
+
+    def close(self) -> None:
+        if os.name == "nt":
+            return
+        for directory in sorted(self._directories):
+            try:
+                fd = os.open(str(directory), os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        self._directories.clear()
+
+
+# Worker-process state for the render pool: the graph is shipped once per
+# worker through the pool initializer instead of once per rendered entity.
+_render_graph_nodes: IndexedGraphNodes = IndexedGraphNodes()
+
+
+def _init_render_worker(graph_nodes: IndexedGraphNodes) -> None:
+    global _render_graph_nodes
+    _render_graph_nodes = graph_nodes
+
+
+def _render_node(index: int) -> Optional[Dict[str, str]]:
+    import ontobdc_view
+
+    node = _render_graph_nodes[index]
+    return ontobdc_view.render_entity_view(
+        IndexedGraphNodes.type_uris(node), node, graph_nodes=_render_graph_nodes
+    )
+
+
 class EntityViewsPublishedCapability(TransformationCapability):
     """Publish a standalone detail page for every entity `ontobdc_view` has
     a Page renderer for.
@@ -51,10 +112,26 @@ class EntityViewsPublishedCapability(TransformationCapability):
     Mostly thin orchestration: this capability enumerates entities from the
     already-resolved Surface JSON-LD and delegates rendering (and the
     decision of whether an entity type has a page at all) entirely to
-    `ontobdc_view.render_entity_view`. It has no HTML/Jinja logic and no
-    separate staleness check — every run regenerates every matched page
-    fresh, the same way `index.html` itself has no incremental repair
-    step, just full regeneration.
+    `ontobdc_view.render_entity_view`. It has no HTML/Jinja logic.
+
+    Staleness is tracked in `.__ontobdc__/view/entity-views.json`: the hash
+    of the Surface JSON-LD graph, the installed `ontobdc-view` version and
+    the SHA-256 of every page published from them. Every page embeds the
+    whole graph (`graph_nodes`), so any graph change invalidates every
+    page; when neither the graph nor the renderer changed and every
+    recorded page is still on disk, rendering is skipped entirely. A
+    re-rendered page whose HTML did not change is not rewritten either.
+
+    The graph is handed to the renderer as an `IndexedGraphNodes`: still
+    the node list `render_entity_view` has always received, plus `@id`/
+    `@type` lookups built once per run for renderers that resolve related
+    entities.
+
+    Graphs of at least `PARALLEL_RENDER_MIN_NODES` nodes are rendered in a
+    process pool (`render_entity_view` is pure CPU-bound Jinja work), with
+    the graph handed to each worker once; pages are written in graph order
+    as results arrive. A pool that cannot start or breaks mid-run falls
+    back to rendering the remaining nodes in this process.
 
     One exception to "no per-entity-type knowledge": once at least one
     WorkStream page is published, this also drives
@@ -94,8 +171,11 @@ class EntityViewsPublishedCapability(TransformationCapability):
         },
     )
 
-    def __init__(self) -> None:
+    PARALLEL_RENDER_MIN_NODES: int = 64
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
         self._surface = SurfaceTransformationAdapter()
+        self._max_workers: int = max(1, max_workers or (os.cpu_count() or 1))
 
     def label(self, lang: str = "en") -> str:
         return SurfaceGenerationProcessState.ENTITY_VIEWS_PUBLISHED.label(lang)
@@ -111,7 +191,7 @@ class EntityViewsPublishedCapability(TransformationCapability):
             import ontobdc_view
         except ImportError:
             document = self._surface.read(context)
-            document = set_state_marker(document, "entity_views_published")
+            document.set_state_marker("entity_views_published")
             self._surface.write(context, document)
             return {
                 "resulting_state": SurfaceGenerationProcessState.ENTITY_VIEWS_PUBLISHED,
@@ -128,10 +208,31 @@ class EntityViewsPublishedCapability(TransformationCapability):
         _dbg_t_read: float = time.perf_counter()
         #endregion
         container_path = self._surface.path(context).parent
-        nodes = self._entity_nodes(document)
+        nodes = IndexedGraphNodes(self._entity_nodes(document))
+        manifest_path = self.manifest_path(container_path)
+        previous_manifest = self._load_manifest(manifest_path)
+        graph_hash = hashlib.sha256(
+            json.dumps(nodes, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        renderer_version = self._renderer_version(ontobdc_view)
+        previous_pages: Dict[str, str] = dict(previous_manifest.get("pages") or {})
+        pages: Dict[str, str] = {}
 
         published: List[str] = []
         work_stream_page_published: bool = False
+        reused: bool = (
+            previous_manifest.get("graph") == graph_hash
+            and previous_manifest.get("renderer") == renderer_version
+            and all(Path(page_path).is_file() for page_path in previous_pages)
+        )
+        if reused:
+            pages = previous_pages
+            published = list(previous_pages)
+            work_stream_page_published = any(
+                Path(page_path).parent.name == _WORK_STREAM_PATH_SEGMENT
+                for page_path in previous_pages
+            )
+            nodes = []
         #region debug-point (infobim-view-slow-crash): H1 detailed loop instrumentation
         _dbg_loop_total: int = 0
         _dbg_skipped_render: int = 0
@@ -139,14 +240,14 @@ class EntityViewsPublishedCapability(TransformationCapability):
         _dbg_render_seconds: float = 0.0
         _dbg_write_seconds: float = 0.0
         #endregion
-        for node in nodes:
+        writer = _BatchedPageWriter()
+        rendered = self._render(ontobdc_view, nodes)
+        for _node in nodes:
             #region debug-point (infobim-view-slow-crash): H1 per-iteration counters
             _dbg_loop_total += 1
             _dbg_r0: float = time.perf_counter()
             #endregion
-            result = ontobdc_view.render_entity_view(
-                self._type_uris(node), node, graph_nodes=nodes
-            )
+            result = next(rendered)
             #region debug-point (infobim-view-slow-crash): H1 per-iteration timer
             _dbg_r1: float = time.perf_counter()
             _dbg_render_seconds += _dbg_r1 - _dbg_r0
@@ -170,10 +271,13 @@ class EntityViewsPublishedCapability(TransformationCapability):
             #region debug-point (infobim-view-slow-crash): H1 write timer (includes fsync)
             _dbg_w0: float = time.perf_counter()
             #endregion
-            _atomic_write_text(target_path, html)
+            page_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
+            if previous_pages.get(str(target_path)) != page_hash or not target_path.is_file():
+                writer.write(target_path, html)
             #region debug-point (infobim-view-slow-crash): H1 write timer stop
             _dbg_write_seconds += time.perf_counter() - _dbg_w0
             #endregion
+            pages[str(target_path)] = page_hash
             published.append(str(target_path))
             if path_segment == _WORK_STREAM_PATH_SEGMENT:
                 work_stream_page_published = True
@@ -181,6 +285,9 @@ class EntityViewsPublishedCapability(TransformationCapability):
         work_stream_scripts_generated: List[str] = []
         work_stream_scripts_error: str = ""
         if work_stream_page_published:
+            # The WorkStream scripts' freshness is judged against index.html's
+            # mtime, so the Surface must be on disk before they are written.
+            SurfaceDocumentSession.flush()
             try:
                 script_response = WorkStreamScriptGenerationStateTransitionHandler(
                     context
@@ -191,10 +298,23 @@ class EntityViewsPublishedCapability(TransformationCapability):
             except Exception as exc:  # noqa: BLE001 - see docstring: never blocks other pages
                 work_stream_scripts_error = str(exc)
 
+        writer.close()
+
+        if not reused:
+            self._save_manifest(
+                manifest_path,
+                {
+                    "version": _MANIFEST_VERSION,
+                    "graph": graph_hash,
+                    "renderer": renderer_version,
+                    "pages": pages,
+                },
+            )
+
         #region debug-point (infobim-view-slow-crash): H1 after-loop timers
         _dbg_t_loop_done: float = time.perf_counter()
         #endregion
-        document = set_state_marker(document, "entity_views_published")
+        document.set_state_marker("entity_views_published")
         #region debug-point (infobim-view-slow-crash): state marker timer
         _dbg_t_state: float = time.perf_counter()
         #endregion
@@ -207,6 +327,7 @@ class EntityViewsPublishedCapability(TransformationCapability):
             "resulting_state": SurfaceGenerationProcessState.ENTITY_VIEWS_PUBLISHED,
             "published_view_count": len(published),
             "published_view_paths": published,
+            "entity_views_reused": reused,
             "work_stream_scripts_generated": work_stream_scripts_generated,
             "work_stream_scripts_error": work_stream_scripts_error,
             #region debug-point (infobim-view-slow-crash): inject H1 evidence
@@ -233,7 +354,38 @@ class EntityViewsPublishedCapability(TransformationCapability):
     def is_satisfied(self, context: CliContextPort) -> bool:
         return self.check(context)
 
-    def _entity_nodes(self, document: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def manifest_path(container_path: Path) -> Path:
+        return Path(container_path) / ".__ontobdc__" / "view" / "entity-views.json"
+
+    def _load_manifest(self, manifest_path: Path) -> Dict[str, Any]:
+        if not manifest_path.is_file():
+            return {}
+        try:
+            payload: Any = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get("version") != _MANIFEST_VERSION:
+            return {}
+        return payload
+
+    def _save_manifest(self, manifest_path: Path, manifest: Dict[str, Any]) -> None:
+        try:
+            _atomic_write_text(manifest_path, json.dumps(manifest, sort_keys=True))
+        except OSError:
+            # Without a manifest the next run just renders every page again.
+            return
+
+    def _renderer_version(self, module: Any) -> str:
+        module_version: Optional[str] = getattr(module, "__version__", None)
+        if module_version:
+            return str(module_version)
+        try:
+            return version("ontobdc-view")
+        except PackageNotFoundError:
+            return ""
+
+    def _entity_nodes(self, document: SurfaceDocument) -> List[Dict[str, Any]]:
         try:
             graph = extract_json_script(document, JSONLD_ID)
         except (ValueError, json.JSONDecodeError):
@@ -245,9 +397,35 @@ class EntityViewsPublishedCapability(TransformationCapability):
         return []
 
     def _type_uris(self, node: Dict[str, Any]) -> List[str]:
-        raw_type = node.get("@type")
-        if isinstance(raw_type, str):
-            return [raw_type]
-        if isinstance(raw_type, list):
-            return [str(item) for item in raw_type]
-        return []
+        return IndexedGraphNodes.type_uris(node)
+
+    def _render(
+        self,
+        module: Any,
+        nodes: List[Dict[str, Any]],
+    ) -> Iterator[Optional[Dict[str, str]]]:
+        """Yield `render_entity_view`'s result for every node, in order."""
+        done: int = 0
+        workers: int = min(self._max_workers, len(nodes))
+        if workers > 1 and len(nodes) >= self.PARALLEL_RENDER_MIN_NODES:
+            chunksize: int = max(1, len(nodes) // (workers * 4))
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_render_worker,
+                    initargs=(nodes,),
+                ) as executor:
+                    for result in executor.map(
+                        _render_node, range(len(nodes)), chunksize=chunksize
+                    ):
+                        yield result
+                        done += 1
+                return
+            except (BrokenProcessPool, NotImplementedError, OSError):
+                # No usable worker processes here: finish in-process.
+                pass
+
+        for node in nodes[done:]:
+            yield module.render_entity_view(
+                self._type_uris(node), node, graph_nodes=nodes
+            )
@@ -9,7 +9,6 @@ from ontobdc.view.adapter.surface.document import (
     MATCHES_ID,
     assemble_surface_markup,
     extract_json_script,
-    set_state_marker,
 )
 from ontobdc.view.adapter.surface.transformation import SurfaceTransformationAdapter
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
@@ -72,22 +71,24 @@ class SurfaceAssembledCapability(TransformationCapability):
         _dbg_t_extract: float = time.perf_counter()
         _dbg_markup_t0: float = time.perf_counter()
         #endregion
-        document = assemble_surface_markup(document, matches)
+        document.replace_text(assemble_surface_markup(document.text, matches))
         #region debug-point (infobim-view-slow-crash): markup timer
         _dbg_t_markup: float = time.perf_counter()
         _dbg_regex_t0: float = time.perf_counter()
         #endregion
-        document = re.sub(
-            r"<onto-presentation-surface\b(?![^>]*\bdata-ontobdc-assembled=)",
-            '<onto-presentation-surface data-ontobdc-assembled="true"',
-            document,
-            flags=re.IGNORECASE,
+        document.replace_text(
+            re.sub(
+                r"<onto-presentation-surface\b(?![^>]*\bdata-ontobdc-assembled=)",
+                '<onto-presentation-surface data-ontobdc-assembled="true"',
+                document.text,
+                flags=re.IGNORECASE,
+            )
         )
         #region debug-point (infobim-view-slow-crash): regex sub timer
         _dbg_t_regex: float = time.perf_counter()
         _dbg_state_t0: float = time.perf_counter()
         #endregion
-        document = set_state_marker(document, "surface_assembled")
+        document.set_state_marker("surface_assembled")
         #region debug-point (infobim-view-slow-crash): state marker timer
         _dbg_t_state: float = time.perf_counter()
         _dbg_write_t0: float = time.perf_counter()
@@ -4,7 +4,7 @@ from typing import Any, Dict
 from ontobdc.cli.domain.port.context import CliContextPort
 from ontobdc.shared.adapter.capability import TransformationCapability
 from ontobdc.shared.domain.model.capability import CapabilityMetadata
-from ontobdc.view.adapter.surface.document import JSONLD_ID, set_state_marker, upsert_json_script
+from ontobdc.view.adapter.surface.document import JSONLD_ID
 from ontobdc.view.adapter.surface.transformation import SurfaceTransformationAdapter
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
 from ontobdc.view.plugin.capability.transformation.data_gathered import DataGatheredCapability
@@ -49,8 +49,8 @@ class SurfaceEnrichedCapability(TransformationCapability):
     def execute(self, context: CliContextPort) -> Dict[str, Any]:
         payload = self._gathered_jsonld(context)
         document = self._surface.read(context)
-        document = upsert_json_script(document, JSONLD_ID, payload, "application/ld+json")
-        document = set_state_marker(document, "surface_enriched")
+        document.upsert_json_script(JSONLD_ID, payload, "application/ld+json")
+        document.set_state_marker("surface_enriched")
         path = self._surface.write(context, document)
         self._surface.require_check(context, check_surface_enriched, "surface_enriched")
 
@@ -3,7 +3,7 @@ from typing import Any, Dict
 from ontobdc.cli.domain.port.context import CliContextPort
 from ontobdc.shared.adapter.capability import TransformationCapability
 from ontobdc.shared.domain.model.capability import CapabilityMetadata
-from ontobdc.view.adapter.surface.document import make_initial_html, set_state_marker
+from ontobdc.view.adapter.surface.document import SurfaceDocument, make_initial_html
 from ontobdc.view.adapter.surface.transformation import SurfaceTransformationAdapter
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
 from ontobdc.view.plugin.check.is_surface_initialized.check import main as check_surface_initialized
@@ -47,7 +47,7 @@ class SurfaceInitializedCapability(TransformationCapability):
     def execute(self, context: CliContextPort) -> Dict[str, Any]:
         path = self._surface.path(context)
         lang = str(context.get_parameter_value("language") or "en")
-        document = set_state_marker(make_initial_html(lang), "surface_initialized")
+        document = SurfaceDocument(make_initial_html(lang)).set_state_marker("surface_initialized")
         self._surface.write(context, document)
         self._surface.require_check(context, check_surface_initialized, "surface_initialized")
         return {
@@ -19,8 +19,6 @@ from ontobdc.view.adapter.surface.context import SurfaceContextAdapter
 from ontobdc.view.adapter.surface.document import (
     MATCHES_ID,
     normalize_matches,
-    set_state_marker,
-    upsert_json_script,
 )
 from ontobdc.view.adapter.surface.transformation import SurfaceTransformationAdapter
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
@@ -129,8 +127,9 @@ class SurfaceMatchedCapability(TransformationCapability):
                 resolved_requests.append(resolved)
         matches = normalize_matches(resolved_requests)
 
-        document = upsert_json_script(self._surface.read(context), MATCHES_ID, matches)
-        document = set_state_marker(document, "surface_matched")
+        document = self._surface.read(context)
+        document.upsert_json_script(MATCHES_ID, matches)
+        document.set_state_marker("surface_matched")
         path = self._surface.write(context, document)
         self._surface.require_check(context, check_surface_matched, "surface_matched")
 
@@ -8,9 +8,6 @@ from ontobdc.view.adapter.surface.document import (
     MATCHES_ID,
     extract_json_script,
     normalize_matches,
-    set_state_marker,
-    upsert_json_script,
-    upsert_raw_script,
 )
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
 from ontobdc.view.plugin.capability.transformation.surface_matched import SurfaceMatchedCapability
@@ -119,18 +116,16 @@ class SurfaceOperationalMatchedCapability(SurfaceMatchedCapability):
 
         if added:
             matches = normalize_matches(list(matches) + added)
-            document = upsert_json_script(document, MATCHES_ID, matches)
+            document.upsert_json_script(MATCHES_ID, matches)
 
         if layouts:
             from ontobdc_view.component.adapter.surface_resolution import to_render_payload
 
             payload = [to_render_payload(layout) for layout in layouts]
-            document = upsert_json_script(document, DEFAULT_LAYOUTS_SCRIPT_ID, payload)
-            document = upsert_raw_script(
-                document, DEFAULT_LAYOUTS_BOOTSTRAP_ID, "module", _BOOTSTRAP_JS
-            )
+            document.upsert_json_script(DEFAULT_LAYOUTS_SCRIPT_ID, payload)
+            document.upsert_raw_script(DEFAULT_LAYOUTS_BOOTSTRAP_ID, "module", _BOOTSTRAP_JS)
 
-        document = set_state_marker(document, "surface_operational_matched")
+        document.set_state_marker("surface_operational_matched")
         path = self._surface.write(context, document)
         self._surface.require_check(
             context, check_surface_operational_matched, "surface_operational_matched"
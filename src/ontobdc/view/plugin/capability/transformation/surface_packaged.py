@@ -10,8 +10,8 @@ from ontobdc.view.adapter.surface.document import (
     MATCHES_ID,
     SURFACE_TAG,
     embed_component_scripts,
+    SurfaceDocument,
     extract_json_script,
-    set_state_marker,
 )
 from ontobdc.view.adapter.surface.transformation import SurfaceTransformationAdapter
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
@@ -99,12 +99,12 @@ class SurfacePackagedCapability(TransformationCapability):
         #region debug-point (infobim-view-slow-crash): embed timer
         _dbg_emb_t0: float = time.perf_counter()
         #endregion
-        document = embed_component_scripts(document, scripts)
+        document.replace_text(embed_component_scripts(document.text, scripts))
         #region debug-point (infobim-view-slow-crash): embed done, state marker
         _dbg_t_embed: float = time.perf_counter()
         _dbg_state_t0: float = time.perf_counter()
         #endregion
-        document = set_state_marker(document, "surface_packaged")
+        document.set_state_marker("surface_packaged")
         #region debug-point (infobim-view-slow-crash): state done, write
         _dbg_t_state: float = time.perf_counter()
         _dbg_write_t0: float = time.perf_counter()
@@ -141,7 +141,7 @@ class SurfacePackagedCapability(TransformationCapability):
     def is_satisfied(self, context: CliContextPort) -> bool:
         return self.check(context)
 
-    def _required_component_tags(self, document: str) -> List[str]:
+    def _required_component_tags(self, document: SurfaceDocument) -> List[str]:
         tags = [SURFACE_TAG]
         matches = extract_json_script(document, MATCHES_ID)
         if isinstance(matches, list):
@@ -186,7 +186,7 @@ class SurfacePackagedCapability(TransformationCapability):
             source, encoding="utf-8"
         )
 
-    def _read_component_sources(self, document: str, context: CliContextPort) -> List[str]:
+    def _read_component_sources(self, document: SurfaceDocument, context: CliContextPort) -> List[str]:
         try:
             import ontobdc_view
         except Exception:
@@ -7,8 +7,6 @@ from ontobdc.view.adapter.surface.context import SurfaceContextAdapter
 from ontobdc.view.adapter.surface.document import (
     CONFIG_ID,
     normalize_surface_config,
-    set_state_marker,
-    upsert_json_script,
 )
 from ontobdc.view.adapter.surface.transformation import SurfaceTransformationAdapter
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
@@ -55,8 +53,9 @@ class SurfaceSetCapability(TransformationCapability):
 
     def execute(self, context: CliContextPort) -> Dict[str, Any]:
         config = normalize_surface_config(self._context_adapter.surface_config(context))
-        document = upsert_json_script(self._surface.read(context), CONFIG_ID, config)
-        document = set_state_marker(document, "surface_set")
+        document = self._surface.read(context)
+        document.upsert_json_script(CONFIG_ID, config)
+        document.set_state_marker("surface_set")
         path = self._surface.write(context, document)
         self._surface.require_check(context, check_surface_set, "surface_set")
         return {
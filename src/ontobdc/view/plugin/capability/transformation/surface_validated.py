@@ -3,7 +3,6 @@ from typing import Any, Dict
 from ontobdc.cli.domain.port.context import CliContextPort
 from ontobdc.shared.adapter.capability import TransformationCapability
 from ontobdc.shared.domain.model.capability import CapabilityMetadata
-from ontobdc.view.adapter.surface.document import set_state_marker
 from ontobdc.view.adapter.surface.transformation import SurfaceTransformationAdapter
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
 from ontobdc.view.plugin.check.is_surface_validated.check import main as check_surface_validated
@@ -51,7 +50,7 @@ class SurfaceValidatedCapability(TransformationCapability):
         document = self._surface.read(context)
         if not is_valid_surface(document):
             raise ValueError("Surface package failed validation")
-        document = set_state_marker(document, "surface_validated")
+        document.set_state_marker("surface_validated")
         path = self._surface.write(context, document)
         self._surface.require_check(context, check_surface_validated, "surface_validated")
         return {"resulting_state": SurfaceGenerationProcessState.SURFACE_VALIDATED, "surface_path": str(path)}
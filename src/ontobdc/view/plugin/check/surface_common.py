@@ -1,9 +1,10 @@
+import functools
 import json
 import logging
 import re
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, Callable, Dict, Optional, Set, Union
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -13,12 +14,14 @@ from ontobdc.view.adapter.surface.document import (
     JSONLD_ID,
     MATCHES_ID,
     SURFACE_TAG,
+    SurfaceDocument,
     contains_external_runtime_reference,
     extract_json_script,
     get_state_marker,
-    read_surface,
     resolve_surface_path,
+    surface_text,
 )
+from ontobdc.view.adapter.surface.session import SurfaceDocumentSession
 from ontobdc.view.domain.machine.surface_state import SurfaceGenerationProcessState
 
 
@@ -32,14 +35,35 @@ _STATE_NAME_TO_STATE = {
 }
 
 
-def resolve_document(surface_path: Optional[str]) -> tuple[Path, str]:
+SurfaceInput = Union[str, SurfaceDocument]
+
+
+def resolve_document(surface_path: Optional[str]) -> tuple[Path, SurfaceDocument]:
     path = resolve_surface_path(surface_path)
-    if not path.is_file():
+    if not SurfaceDocumentSession.exists(path):
         raise FileNotFoundError(path)
-    return path, read_surface(path)
+    return path, SurfaceDocumentSession.load(path)
+
 
+def _per_document(predicate: Callable[[SurfaceInput], bool]) -> Callable[[SurfaceInput], bool]:
+    """Evaluate `predicate` once per `SurfaceDocument` version.
+
+    Every state check re-runs the whole cumulative chain below it
+    (`is_packaged_surface` -> `is_assembled_surface` -> ...), and the
+    evaluator runs every check in turn, so without this each predicate
+    would re-scan the same unchanged document once per later state.
+    """
 
-def state_reached(document: str, target: SurfaceGenerationProcessState) -> bool:
+    @functools.wraps(predicate)
+    def wrapper(document: SurfaceInput) -> bool:
+        if isinstance(document, SurfaceDocument):
+            return document.memo(predicate.__name__, lambda: predicate(document))
+        return predicate(document)
+
+    return wrapper
+
+
+def state_reached(document: SurfaceInput, target: SurfaceGenerationProcessState) -> bool:
     marker = get_state_marker(document)
     if not marker:
         return False
@@ -50,7 +74,9 @@ def state_reached(document: str, target: SurfaceGenerationProcessState) -> bool:
     return states.index(current) >= states.index(target)
 
 
-def has_initialized_surface(document: str) -> bool:
+@_per_document
+def has_initialized_surface(document: SurfaceInput) -> bool:
+    document = surface_text(document)
     return (
         "<!doctype html" in document.lower()
         and re.search(r"<html\b", document, re.IGNORECASE) is not None
@@ -60,7 +86,8 @@ def has_initialized_surface(document: str) -> bool:
     )
 
 
-def has_jsonld(document: str) -> bool:
+@_per_document
+def has_jsonld(document: SurfaceInput) -> bool:
     try:
         payload = extract_json_script(document, JSONLD_ID)
     except (ValueError, json.JSONDecodeError):
@@ -68,7 +95,8 @@ def has_jsonld(document: str) -> bool:
     return isinstance(payload, (dict, list))
 
 
-def has_surface_config(document: str) -> bool:
+@_per_document
+def has_surface_config(document: SurfaceInput) -> bool:
     try:
         config = extract_json_script(document, CONFIG_ID)
     except (ValueError, json.JSONDecodeError):
@@ -84,7 +112,8 @@ def has_surface_config(document: str) -> bool:
     )
 
 
-def has_surface_matches(document: str) -> bool:
+@_per_document
+def has_surface_matches(document: SurfaceInput) -> bool:
     try:
         matches = extract_json_script(document, MATCHES_ID)
     except (ValueError, json.JSONDecodeError):
@@ -108,7 +137,8 @@ def has_surface_matches(document: str) -> bool:
     return True
 
 
-def has_valid_default_layouts(document: str) -> bool:
+@_per_document
+def has_valid_default_layouts(document: SurfaceInput) -> bool:
     try:
         payload = extract_json_script(document, DEFAULT_LAYOUTS_ID)
     except (ValueError, json.JSONDecodeError):
@@ -120,11 +150,14 @@ def has_valid_default_layouts(document: str) -> bool:
     )
 
 
-def has_assembled_tiles(document: str) -> bool:
+@_per_document
+def has_assembled_tiles(document: SurfaceInput) -> bool:
     #region debug-point (infobim-view-slow-crash): H2/H3 instrumentation for O(T·html_bytes)
     global _DBG_METRICS
     _dbg_t0: float = time.perf_counter()
     #endregion
+    surface: SurfaceInput = document
+    document = surface_text(document)
     if re.search(
         rf"<{SURFACE_TAG}\b[^>]*\bdata-ontobdc-assembled=[\"']true[\"']",
         document,
@@ -142,7 +175,7 @@ def has_assembled_tiles(document: str) -> bool:
         return False
 
     try:
-        matches = extract_json_script(document, MATCHES_ID)
+        matches = extract_json_script(surface, MATCHES_ID)
     except (ValueError, json.JSONDecodeError):
         #region debug-point (infobim-view-slow-crash): persist error metric
         _DBG_METRICS["has_assembled_tiles"] = {
@@ -369,7 +402,9 @@ def _build_tile_lut(
     return lut
 
 
-def has_packaged_runtime(document: str) -> bool:
+@_per_document
+def has_packaged_runtime(document: SurfaceInput) -> bool:
+    document = surface_text(document)
     if contains_external_runtime_reference(document):
         return False
     return re.search(
@@ -379,29 +414,36 @@ def has_packaged_runtime(document: str) -> bool:
     ) is not None
 
 
-def is_enriched_surface(document: str) -> bool:
+@_per_document
+def is_enriched_surface(document: SurfaceInput) -> bool:
     return has_initialized_surface(document) and has_jsonld(document)
 
 
-def is_set_surface(document: str) -> bool:
+@_per_document
+def is_set_surface(document: SurfaceInput) -> bool:
     return is_enriched_surface(document) and has_surface_config(document)
 
 
-def is_matched_surface(document: str) -> bool:
+@_per_document
+def is_matched_surface(document: SurfaceInput) -> bool:
     return is_set_surface(document) and has_surface_matches(document)
 
 
-def is_operational_matched_surface(document: str) -> bool:
+@_per_document
+def is_operational_matched_surface(document: SurfaceInput) -> bool:
     return is_matched_surface(document) and has_valid_default_layouts(document)
 
 
-def is_assembled_surface(document: str) -> bool:
+@_per_document
+def is_assembled_surface(document: SurfaceInput) -> bool:
     return is_operational_matched_surface(document) and has_assembled_tiles(document)
 
 
-def is_packaged_surface(document: str) -> bool:
+@_per_document
+def is_packaged_surface(document: SurfaceInput) -> bool:
     return is_assembled_surface(document) and has_packaged_runtime(document)
 
 
-def is_valid_surface(document: str) -> bool:
+@_per_document
+def is_valid_surface(document: SurfaceInput) -> bool:
     return is_packaged_surface(document)
@@ -9,8 +9,12 @@ from ontobdc.cli.domain.response.command import CommandResponse
 from ontobdc.shared.adapter.filesystem import remove_directory_tree, remove_file
 from ontobdc.storage.plugin.parameter.container import ContainerIdStrategy
 from ontobdc.view.adapter.surface.context import SurfaceContextAdapter
+from ontobdc.view.adapter.surface.incremental import SurfaceRunStamp
 from ontobdc.view.adapter.surface.machine import SurfaceGenerationStateTransitionHandler
 from ontobdc.view.plugin.capability.transformation.data_gathered import DataGatheredCapability
+from ontobdc.view.plugin.capability.transformation.entity_views_published import (
+    EntityViewsPublishedCapability,
+)
 
 
 class ContainerViewCommand(CliCommandPort):
@@ -56,6 +60,15 @@ class ContainerViewCommand(CliCommandPort):
                 "description": "Select the language declared by the view.",
                 "usage": "ontobdc view --language pt-br",
             },
+            {
+                "accepts": ["--force"],
+                "valued": False,
+                "description": (
+                    "Regenerate the whole view even when its sources did "
+                    "not change since the last run."
+                ),
+                "usage": "ontobdc view --force",
+            },
         ],
     )
 
@@ -66,6 +79,7 @@ class ContainerViewCommand(CliCommandPort):
         "--representation",
         "--language",
     }
+    _FLAGS = {"--force"}
 
     @staticmethod
     def accepts(args: List[str]) -> bool:
@@ -77,10 +91,14 @@ class ContainerViewCommand(CliCommandPort):
         seen = set()
         while index < len(remaining):
             flag = remaining[index]
-            if flag not in ContainerViewCommand._VALUED_FLAGS:
-                return False
             if flag in seen:
                 return False
+            if flag in ContainerViewCommand._FLAGS:
+                seen.add(flag)
+                index += 1
+                continue
+            if flag not in ContainerViewCommand._VALUED_FLAGS:
+                return False
             if (
                 index + 1 >= len(remaining)
                 or remaining[index + 1].startswith("--")
@@ -142,34 +160,45 @@ class ContainerViewCommand(CliCommandPort):
 
     def run(self) -> CommandResponse:
         context = self._request.context
+        container_path = self._resolved_container_path()
+        stamp = SurfaceRunStamp(container_path)
+        stale_stages = self._stale_stages(context, stamp)
 
-        # Avoid a failed prior run leaving a stale index.html frozen mid-state.
         existing_surface_path = SurfaceContextAdapter().surface_path(context)
-        if existing_surface_path.is_file():
-            remove_file(existing_surface_path)
+        if stale_stages:
+            # Avoid a failed prior run leaving a stale index.html frozen mid-state.
+            stamp.clear()
+            if existing_surface_path.is_file():
+                remove_file(existing_surface_path)
 
-        # Same reasoning, plus: a prior run's onto-file-viewer.html sitting
-        # on disk at DATA_GATHERED time would get picked up as an ordinary
-        # container file (it's just another root-level file otherwise) and
-        # pollute the RO-Crate/file-tree inventory with the tool's own
-        # generated artifact. After moving the generated page inside the
-        # ignored marker directory we still clean both locations so
-        # leftovers from older runs don't leak.
-        existing_file_viewer_path = existing_surface_path.parent / "onto-file-viewer.html"
-        if existing_file_viewer_path.is_file():
-            remove_file(existing_file_viewer_path)
-        legacy_marker_viewer_path: Path = (
-            existing_surface_path.parent / ".__ontobdc__" / "onto-file-viewer.html"
-        )
-        if legacy_marker_viewer_path.is_file():
-            remove_file(legacy_marker_viewer_path)
+            # Same reasoning, plus: a prior run's onto-file-viewer.html sitting
+            # on disk at DATA_GATHERED time would get picked up as an ordinary
+            # container file (it's just another root-level file otherwise) and
+            # pollute the RO-Crate/file-tree inventory with the tool's own
+            # generated artifact. After moving the generated page inside the
+            # ignored marker directory we still clean both locations so
+            # leftovers from older runs don't leak.
+            existing_file_viewer_path = existing_surface_path.parent / "onto-file-viewer.html"
+            if existing_file_viewer_path.is_file():
+                remove_file(existing_file_viewer_path)
+            legacy_marker_viewer_path: Path = (
+                existing_surface_path.parent / ".__ontobdc__" / "onto-file-viewer.html"
+            )
+            if legacy_marker_viewer_path.is_file():
+                remove_file(legacy_marker_viewer_path)
 
         # DataGatheredCapability.check() passes as long as this ETL artifact
         # is present, so leaving it behind makes the state machine resume
-        # from a stale DATA_GATHERED instead of re-running it this call.
-        etl_state_directory = DataGatheredCapability.state_directory(context)
-        if etl_state_directory.is_dir():
-            remove_directory_tree(etl_state_directory)
+        # from a stale DATA_GATHERED instead of re-running it this call. It
+        # is kept when only the Surface-side inputs changed.
+        if "data" in stale_stages:
+            etl_state_directory = DataGatheredCapability.state_directory(context)
+            if etl_state_directory.is_dir():
+                remove_directory_tree(etl_state_directory)
+            if self._argument_present("--force"):
+                EntityViewsPublishedCapability.manifest_path(container_path).unlink(
+                    missing_ok=True
+                )
 
         handler = SurfaceGenerationStateTransitionHandler(
             context=context,
@@ -195,6 +224,8 @@ class ContainerViewCommand(CliCommandPort):
                 f"{index_path}."
             )
 
+        stamp.save(stamp.fingerprints(context))
+
         index_uri = index_path.as_uri()
         browser_opened = False
         runtime_error: Optional[str] = None
@@ -233,6 +264,7 @@ class ContainerViewCommand(CliCommandPort):
                 "language": (
                     context.get_parameter_value("language")
                 ),
+                "regenerated_stages": stale_stages,
                 "index_path": str(index_path),
                 "index_uri": index_uri,
                 "browser_opened": browser_opened,
@@ -241,6 +273,36 @@ class ContainerViewCommand(CliCommandPort):
         )
         return response
 
+    def _stale_stages(
+        self,
+        context: Any,
+        stamp: SurfaceRunStamp,
+    ) -> List[str]:
+        """Name the pipeline stages whose inputs changed since the last run.
+
+        `--force`, a missing Surface, or fingerprints that cannot be
+        computed mark every stage stale. `data` covers DATA_GATHERED onward;
+        `surface` covers the HTML Surface built on top of the gathered data.
+        """
+        all_stages: List[str] = ["data", "surface"]
+        if self._argument_present("--force"):
+            return all_stages
+        if not SurfaceContextAdapter().surface_path(context).is_file():
+            return all_stages
+        try:
+            current: Dict[str, str] = stamp.fingerprints(context)
+        except (OSError, ValueError):
+            return all_stages
+        previous: Dict[str, str] = stamp.load()
+        if previous.get("data") != current["data"]:
+            return all_stages
+        if previous.get("surface") != current["surface"]:
+            return ["surface"]
+        return []
+
+    def _argument_present(self, flag: str) -> bool:
+        return flag in list(self._request.command_args)
+
     def _resolved_container_path(self) -> Optional[Path]:
         value = self._request.context.get_parameter_value("container_path")
         normalized = str(value or "").strip()